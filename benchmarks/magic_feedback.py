@@ -0,0 +1,83 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures the throughput of ``DRC.from_magic_feedback`` on a synthetic Magic
+feedback file, as generated by ``Magic.SpiceExtraction`` for designs with many
+illegal overlaps.
+
+Usage: python3 benchmarks/magic_feedback.py [--boxes 1000000] [--multiline-every 100]
+"""
+import os
+import time
+import random
+import tempfile
+from decimal import Decimal
+
+import click
+
+from openlane.common import DRC
+
+RULES = [
+    "Illegal overlap between obsm4 and metal4 (types do not connect)",
+    "Illegal overlap between obsm4 and via4 (types do not connect)",
+    "Illegal overlap between obsm1 and metal1 (types do not connect)",
+]
+
+
+def write_feedback(path: str, boxes: int, multiline_every: int):
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf8") as f:
+        lines = []
+        for i in range(boxes):
+            lx, ly = rng.randrange(0, 1_000_000), rng.randrange(0, 1_000_000)
+            lines.append(f"box {lx} {ly} {lx + 42} {ly + 236}\n")
+            if multiline_every and i % multiline_every == 0:
+                lines.append(
+                    'feedback add "device missing 1 terminal;\n connecting remainder to node VGND" pale\n'
+                )
+            else:
+                lines.append(f'feedback add "{RULES[i % len(RULES)]}" medium\n')
+            if len(lines) >= 65536:
+                f.writelines(lines)
+                lines.clear()
+        f.writelines(lines)
+
+
+@click.command()
+@click.option("--boxes", type=int, default=1_000_000, help="Number of boxes")
+@click.option(
+    "--multiline-every",
+    type=int,
+    default=100,
+    help="Emit a feedback message spanning two lines every this many boxes",
+)
+def main(boxes: int, multiline_every: int):
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "feedback.txt")
+        write_feedback(path, boxes, multiline_every)
+        size_mib = os.path.getsize(path) / 1024 / 1024
+
+        start = time.perf_counter()
+        with open(path, encoding="utf8") as f:
+            drc, bbox_count = DRC.from_magic_feedback(f, Decimal("0.05"), "benchmark")
+        elapsed = time.perf_counter() - start
+
+        assert bbox_count == boxes
+        print(
+            f"{bbox_count} boxes ({size_mib:.1f} MiB) in {elapsed:.2f}s ({bbox_count / elapsed:.0f} boxes/s) into {len(drc.violations)} categories"
+        )
+
+
+if __name__ == "__main__":
+    main()
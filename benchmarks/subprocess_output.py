@@ -0,0 +1,136 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures the throughput of ``Step.run_subprocess`` on synthetic OpenROAD-like
+output, with and without the bulk processing of lines no output processor is
+interested in.
+
+Usage: python3 benchmarks/subprocess_output.py [--size-mib 2048] [--alert-every 1000]
+"""
+import os
+import sys
+import time
+import tempfile
+
+import click
+
+from openlane.config import Config
+from openlane.state import State
+from openlane.steps import (
+    Step,
+    DefaultOutputProcessor,
+    OpenROADAlert,
+    OpenROADOutputProcessor,
+)
+
+GENERATOR = """
+import sys
+size, alert_every = int(sys.argv[1]), int(sys.argv[2])
+lines = []
+for i in range(alert_every * 16):
+    if i % alert_every == 0:
+        lines.append(f"[WARNING GRT-{i % 9999:04d}] Synthetic warning {i}.\\n")
+    elif i % (alert_every * 8) == 1:
+        lines.append("%OL_METRIC_I synthetic__count 1\\n")
+    else:
+        lines.append(f"[INFO DRT-0195] Start {i}th optimization iteration ...\\n")
+block = "".join(lines).encode("utf8")
+written = 0
+out = sys.stdout.buffer
+while written < size:
+    out.write(block)
+    written += len(block)
+"""
+
+
+class PerLineOpenROADOutputProcessor(OpenROADOutputProcessor):
+    prefixes = None
+
+
+class PerLineDefaultOutputProcessor(DefaultOutputProcessor):
+    prefixes = None
+
+
+class BenchmarkStep(Step):
+    id = "Benchmark.SubprocessOutput"
+    inputs = []
+    outputs = []
+
+    output_processors = [OpenROADOutputProcessor, DefaultOutputProcessor]
+
+    @classmethod
+    def get_all_config_variables(Self):
+        # Only the design name is needed to run subprocesses
+        return [
+            variable
+            for variable in super().get_all_config_variables()
+            if variable.name == "DESIGN_NAME"
+        ]
+
+    def on_alert(self, alert: OpenROADAlert) -> OpenROADAlert:
+        return alert
+
+    def run(self, state_in, **kwargs):
+        return {}, {}
+
+
+@click.command()
+@click.option("--size-mib", type=int, default=2048, help="Output size in MiB")
+@click.option(
+    "--alert-every",
+    type=int,
+    default=1000,
+    help="Emit an OpenROAD warning every this many lines",
+)
+def main(size_mib: int, alert_every: int):
+    size = size_mib * 1024 * 1024
+    with tempfile.TemporaryDirectory() as d:
+        BenchmarkStep.step_dir = d
+        step = BenchmarkStep(
+            config=Config(
+                {
+                    "DESIGN_NAME": "benchmark",
+                    "DESIGN_DIR": d,
+                    "PDK_ROOT": d,
+                    "PDK": "dummy",
+                    "STD_CELL_LIBRARY": "dummy_scl",
+                }
+            ),
+            state_in=State(),
+            _no_revalidate_conf=True,
+        )
+        command = [sys.executable, "-c", GENERATOR, str(size), str(alert_every)]
+        for label, processors in [
+            (
+                "per-line",
+                [PerLineOpenROADOutputProcessor, PerLineDefaultOutputProcessor],
+            ),
+            ("batched", [OpenROADOutputProcessor, DefaultOutputProcessor]),
+        ]:
+            start = time.perf_counter()
+            step.run_subprocess(
+                command,
+                log_to=os.path.join(d, f"{label}.log"),
+                silent=True,
+                output_processing=processors,
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label}: {size_mib} MiB in {elapsed:.2f}s ({size_mib / elapsed:.1f} MiB/s)"
+            )
+            os.unlink(os.path.join(d, f"{label}.log"))
+
+
+if __name__ == "__main__":
+    main()
@@ -19,7 +19,6 @@
   nix-gitignore,
   # Tools
   klayout,
-  libparse,
   magic-vlsi,
   netgen,
   opensta,
@@ -103,7 +102,6 @@
         tkinter
         lxml
         deprecated
-        libparse
         psutil
         klayout.pymod
         rapidfuzz
@@ -25,14 +25,12 @@
 
   inputs = {
     nix-eda.url = github:efabless/nix-eda/2.1.2;
-    libparse.url = github:efabless/libparse-python;
     ioplace-parser.url = github:efabless/ioplace_parser;
     volare.url = github:efabless/volare;
     devshell.url = github:numtide/devshell;
     flake-compat.url = "https://flakehub.com/f/edolstra/flake-compat/1.tar.gz";
   };
 
-  inputs.libparse.inputs.nixpkgs.follows = "nix-eda/nixpkgs";
   inputs.ioplace-parser.inputs.nix-eda.follows = "nix-eda";
   inputs.volare.inputs.nixpkgs.follows = "nix-eda/nixpkgs";
   inputs.devshell.inputs.nixpkgs.follows = "nix-eda/nixpkgs";
@@ -40,7 +38,6 @@
   outputs = {
     self,
     nix-eda,
-    libparse,
     ioplace-parser,
     volare,
     devshell,
@@ -53,7 +50,7 @@
     overlays = {
       default = lib.composeManyExtensions [
         (import ./nix/overlay.nix)
-        (nix-eda.flakesToOverlay [libparse ioplace-parser volare])
+        (nix-eda.flakesToOverlay [ioplace-parser volare])
         (pkgs': pkgs: {
           yosys-sby = (pkgs.yosys-sby.override { sha256 = "sha256-Il2pXw2doaoZrVme2p0dSUUa8dCQtJJrmYitn1MkTD4="; });
           klayout = (pkgs.klayout.overrideAttrs(old: {
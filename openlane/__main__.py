@@ -188,10 +188,11 @@ def run(
         err("OpenLane will now quit.")
         ctx.exit(2)
 
+    snapshot_mode = flow.config.get("SNAPSHOT_MODE", "reflink")
     if vsp := view_save_path:
-        state_out.save_snapshot(vsp)
+        state_out.save_snapshot(vsp, mode=snapshot_mode)
     if evsp := ef_view_save_path:
-        flow._save_snapshot_ef(evsp)
+        flow._save_snapshot_ef(evsp, mode=snapshot_mode)
 
 
 def print_version(ctx: click.Context, param: click.Parameter, value: bool):
@@ -20,7 +20,7 @@ A number of common utility functions and classes used throughout the codebase.
 import os
 
 from .tcl import TclUtils
-from .metrics import parse_metric_modifiers, aggregate_metrics
+from .metrics import parse_metric_modifiers, aggregate_metrics, MetricIndex
 from . import metrics
 from .generic_dict import (
     GenericDictEncoder,
@@ -43,6 +43,8 @@ from .misc import (
     Filter,
     get_latest_file,
     process_list_file,
+    Tile,
+    get_tiles,
     _get_process_limit,
 )
 from .types import (
@@ -54,8 +56,31 @@ from .types import (
     AnyPath,
     ScopedFile,
 )
+from .clone import CloneMode, CloneStatistics, clone_file, clone_files
+from .artifact_cache import (
+    ArtifactCache,
+    get_artifact_cache,
+    set_artifact_cache,
+    get_file_digest,
+)
+from .liberty import (
+    LibertyCell,
+    LibertyCellIndex,
+    LibertyCellInfo,
+    LibertyIndex,
+    get_liberty_cell_index,
+    remove_liberty_cells,
+)
+from .run_manifest import RunManifest, RunManifestEntry, StepStatus
 from .toolbox import Toolbox
-from .drc import DRC, Violation
+from .drc import (
+    DRC,
+    Violation,
+    BoundingBoxArray,
+    SpatialIndex,
+    merge_klayout_xml,
+)
 from . import cli
 from .tpe import get_tpe, set_tpe
+from .scheduler import Reservation, ResourceScheduler, get_scheduler, set_scheduler
 from .ring_buffer import RingBuffer
@@ -0,0 +1,230 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import os
+import json
+import uuid
+import hashlib
+import threading
+from typing import Any, Callable, ClassVar, Dict, Iterable, Optional, Tuple
+
+from .misc import mkdirp
+from .clone import clone_file
+from ..logging import debug
+
+_DIGESTS: Dict[Tuple[str, int, int], str] = {}
+_DIGESTS_LOCK = threading.Lock()
+
+
+def get_file_digest(path: str) -> str:
+    """
+    :param path: The path to a file
+    :returns: The SHA-256 digest of the file's contents. Results are memoized
+        for the lifetime of the process as long as the file's size and
+        modification time do not change.
+    """
+    stat = os.stat(path)
+    memo_key = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+    with _DIGESTS_LOCK:
+        if digest := _DIGESTS.get(memo_key):
+            return digest
+    hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            hash.update(chunk)
+    digest = hash.hexdigest()
+    with _DIGESTS_LOCK:
+        _DIGESTS[memo_key] = digest
+    return digest
+
+
+class ArtifactCache(object):
+    """
+    An on-disk, content-addressed and size-bounded cache for files derived
+    from other files, e.g. liberty files with some cells removed, shared by
+    all runs (and designs) using the same cache directory.
+
+    Entries are keyed on a hash of the contents of their input files and of
+    any other parameters used to derive them. When the total size of the
+    cache exceeds ``max_size``, the least recently used entries are evicted.
+
+    Entries are written atomically and never handed out directly: they are
+    reflinked or copied to the requested path instead (see :func:`clone_file`),
+    so multiple flows may safely share, fill and evict from the same cache
+    directory, and modifying a file handed out by the cache does not modify
+    the cache.
+
+    :param path: The directory to store cached files in.
+    :param max_size: The maximum total size of the cached files in bytes.
+    """
+
+    format_version: ClassVar[int] = 1
+
+    def __init__(self, path: str, max_size: int = 4 * 1024 * 1024 * 1024):
+        self.path = os.path.abspath(path)
+        self.max_size = max_size
+
+    def get_key(self, kind: str, inputs: Iterable[str], parameters: Any) -> str:
+        """
+        :param kind: A name for the process used to derive the artifact
+        :param inputs: The input files of the process, in the order they are
+            used
+        :param parameters: Any other JSON-serializable inputs of the process
+        :returns: A key uniquely identifying the artifact.
+        """
+        from ..__version__ import __version__
+
+        components = {
+            "cache_format": self.format_version,
+            "openlane_version": __version__,
+            "kind": kind,
+            "inputs": [get_file_digest(str(input)) for input in inputs],
+            "parameters": parameters,
+        }
+        serialized = json.dumps(components, sort_keys=True)
+        return hashlib.sha256(serialized.encode("utf8")).hexdigest()
+
+    def __entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key)
+
+    def get(self, key: str, target: str) -> bool:
+        """
+        Clones a cached artifact, if it exists, to a path. The artifact is
+        marked as recently used.
+
+        :param key: The key returned by :meth:`get_key`
+        :param target: The path to clone the artifact to
+        :returns: Whether the artifact was found.
+        """
+        entry_path = self.__entry_path(key)
+        try:
+            os.utime(entry_path)
+            clone_file(entry_path, target, mode="reflink")
+        except OSError:
+            return False
+        return True
+
+    def put(self, key: str, source: str) -> bool:
+        """
+        Stores a file in the cache, then evicts the least recently used
+        entries until the cache fits in ``max_size``.
+
+        :param key: The key returned by :meth:`get_key`
+        :param source: The file to store
+        :returns: Whether the file has been stored or not.
+        """
+        entry_path = self.__entry_path(key)
+        staging_path = os.path.join(os.path.dirname(entry_path), f".{uuid.uuid4().hex}")
+        try:
+            mkdirp(os.path.dirname(entry_path))
+            clone_file(source, staging_path, mode="reflink")
+            os.replace(staging_path, entry_path)
+        except OSError as e:
+            debug(f"Failed to store artifact in cache: {e}")
+            if os.path.lexists(staging_path):
+                os.unlink(staging_path)
+            return False
+        self.evict()
+        return True
+
+    def fetch(
+        self,
+        key: str,
+        target: str,
+        create: Callable[[str], bool],
+    ) -> str:
+        """
+        Clones a cached artifact to a path, creating (and storing) it first
+        if it is not cached.
+
+        :param key: The key returned by :meth:`get_key`
+        :param target: The path to clone the artifact to
+        :param create: A function creating the artifact at the path passed to
+            it, returning whether the result may be cached. Results of failed
+            or degraded runs, for example, should not be.
+        :returns: ``target``
+        """
+        if self.get(key, target):
+            debug(f"Restored '{target}' from the artifact cache.")
+            return target
+        if create(target):
+            self.put(key, target)
+        return target
+
+    def evict(self):
+        """
+        Evicts the least recently used entries until the cache fits in
+        ``max_size``. If another process is already evicting entries from the
+        same cache, this returns immediately.
+        """
+        import fcntl
+
+        try:
+            lock = open(os.path.join(self.path, ".lock"), "a")
+        except OSError:
+            return
+        with lock:
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return
+            entries = []
+            total = 0
+            for shard in os.scandir(self.path):
+                if shard.name.startswith(".") or not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_size:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+
+_ARTIFACT_CACHE: Optional[ArtifactCache] = None
+_ARTIFACT_CACHE_LOCK = threading.Lock()
+
+
+def set_artifact_cache(cache: Optional[ArtifactCache]):
+    """
+    Sets (or unsets) the :class:`ArtifactCache` used by
+    :class:`openlane.common.Toolbox`.
+
+    :param cache: The artifact cache, or ``None`` to disable caching.
+    """
+    global _ARTIFACT_CACHE
+    with _ARTIFACT_CACHE_LOCK:
+        _ARTIFACT_CACHE = cache
+
+
+def get_artifact_cache() -> Optional[ArtifactCache]:
+    """
+    :returns: The :class:`ArtifactCache` used by
+        :class:`openlane.common.Toolbox`, if set.
+    """
+    with _ARTIFACT_CACHE_LOCK:
+        return _ARTIFACT_CACHE
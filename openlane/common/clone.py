@@ -0,0 +1,142 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import os
+import sys
+import shutil
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Literal, Optional, Tuple
+
+from .misc import _get_process_limit
+from .types import AnyPath
+
+CloneMode = Literal["copy", "reflink", "link"]
+"""
+How files are cloned:
+
+* ``copy``: The contents of the file are always copied.
+* ``reflink``: The file is cloned copy-on-write if supported by the file
+  system, otherwise, the contents are copied.
+* ``link``: Like ``reflink``, but hardlinks are attempted before copying.
+  Hardlinked files share their contents with the original, so modifying either
+  in-place modifies both.
+"""
+
+CloneMethod = Literal["copy", "reflink", "hardlink", "none"]
+
+# linux/fs.h
+_FICLONE = 0x40049409
+
+
+def _reflink(source: str, target: str) -> bool:
+    if sys.platform == "linux":
+        import fcntl
+
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                if os.fstat(dst.fileno()).st_size == os.fstat(src.fileno()).st_size:
+                    return True
+        except OSError:
+            pass
+        if os.path.lexists(target):
+            os.unlink(target)
+        return False
+    elif sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(libc, "clonefile"):
+            return False
+        return libc.clonefile(source.encode(), target.encode(), 0) == 0
+    return False
+
+
+def clone_file(
+    source: AnyPath,
+    target: AnyPath,
+    mode: CloneMode = "reflink",
+) -> CloneMethod:
+    """
+    Clones a file, following symlinks. Existing targets are replaced, unless
+    they already are the source file.
+
+    :param source: The file to clone
+    :param target: The path of the new file
+    :param mode: See :data:`CloneMode`
+    :returns: The method the file was ultimately cloned with, or ``none`` if
+        the target already is the source file.
+    """
+    source = os.path.realpath(source)
+    target = str(target)
+    if os.path.exists(target) and os.path.samefile(source, target):
+        return "none"
+    if os.path.lexists(target):
+        os.unlink(target)
+    if mode in ["reflink", "link"] and _reflink(source, target):
+        return "reflink"
+    if mode == "link":
+        try:
+            os.link(source, target)
+            return "hardlink"
+        except OSError:
+            pass
+    shutil.copyfile(source, target)
+    return "copy"
+
+
+@dataclass
+class CloneStatistics:
+    """
+    :param files: The number of files cloned
+    :param bytes_total: The total size of the files cloned
+    :param bytes_saved: The total size of the files that were reflinked or
+        hardlinked, i.e., that did not use additional disk space
+    """
+
+    files: int = 0
+    bytes_total: int = 0
+    bytes_saved: int = 0
+
+
+def clone_files(
+    pairs: Iterable[Tuple[AnyPath, AnyPath]],
+    mode: CloneMode = "reflink",
+    max_workers: Optional[int] = None,
+) -> CloneStatistics:
+    """
+    Clones multiple files in parallel using :func:`clone_file`.
+
+    :param pairs: Pairs of source files and targets
+    :param mode: See :data:`CloneMode`
+    :param max_workers: The maximum number of files to clone at a time. If
+        unset, this will be equal to your machine's thread count.
+    :returns: Statistics on the cloned files.
+    """
+    stats = CloneStatistics()
+    with ThreadPoolExecutor(max_workers=max_workers or _get_process_limit()) as tpe:
+        futures = [
+            (source, tpe.submit(clone_file, source, target, mode))
+            for source, target in pairs
+        ]
+        for source, future in futures:
+            method = future.result()
+            size = os.path.getsize(source)
+            stats.files += 1
+            stats.bytes_total += size
+            if method != "copy":
+                stats.bytes_saved += size
+    return stats
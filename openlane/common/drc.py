@@ -13,21 +13,180 @@
 # limitations under the License.
 import io
 import re
+import sys
 import json
+import math
 import shlex
+import struct
+from array import array
+from bisect import bisect_right
 from enum import IntEnum
 from decimal import Decimal, InvalidOperation
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Tuple, Dict
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape
+from typing import (
+    IO,
+    Any,
+    ClassVar,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Dict,
+    Union,
+    overload,
+)
 
 BoundingBox = Tuple[Decimal, Decimal, Decimal, Decimal]  # microns
+BoundingBoxDBU = Tuple[int, int, int, int]  # database units
 
+#: The size of a database unit in microns. Coordinates are snapped to this grid
+#: when they are added to a :class:`BoundingBoxArray`.
+DATABASE_UNIT = Decimal("0.0001")
+_DBU_DIGITS = 4
+_DBU_PER_MICRON = 10**_DBU_DIGITS
+
+
+def _to_dbu(value: Union[Decimal, int, str]) -> int:
+    if not isinstance(value, Decimal):
+        value = Decimal(value)
+    return int(value.scaleb(_DBU_DIGITS).to_integral_value())
+
+
+def _format_dbu(value: int) -> str:
+    sign = "-" if value < 0 else ""
+    whole, frac = divmod(abs(value), _DBU_PER_MICRON)
+    if frac == 0:
+        return f"{sign}{whole}"
+    return f"{sign}{whole}." + f"{frac:0{_DBU_DIGITS}d}".rstrip("0")
+
+
+def _from_dbu(value: int) -> Decimal:
+    return Decimal(_format_dbu(value))
+
+
+class BoundingBoxArray(Sequence[BoundingBox]):
+    """
+    A compact list of bounding boxes, stored as integer database units (see
+    :data:`DATABASE_UNIT`) in a typed array.
+
+    Indexing and iteration return bounding boxes in microns, as tuples of
+    :class:`decimal.Decimal`; the raw coordinates are available using
+    :meth:`iter_dbu` and :attr:`data`.
+
+    :param bounding_boxes: Initial bounding boxes, in microns.
+    """
+
+    __slots__ = ("data",)
+
+    data: array
+
+    def __init__(self, bounding_boxes: Iterable[BoundingBox] = ()):
+        self.data = array("q")
+        self.extend(bounding_boxes)
+
+    @classmethod
+    def from_dbu(Self, data: Iterable[int]) -> "BoundingBoxArray":
+        """
+        :param data: A flat iterable of coordinates in database units, four per
+            bounding box: ``lx ly ux uy lx ly …``
+        :returns: A new bounding box array
+        """
+        result = Self()
+        result.data.extend(data)
+        if len(result.data) % 4 != 0:
+            raise ValueError("bounding box data must have four coordinates per box")
+        return result
+
+    def append(self, bounding_box: BoundingBox):
+        lx, ly, ux, uy = bounding_box
+        self.data.extend((_to_dbu(lx), _to_dbu(ly), _to_dbu(ux), _to_dbu(uy)))
+
+    def append_dbu(self, lx: int, ly: int, ux: int, uy: int):
+        self.data.extend((lx, ly, ux, uy))
+
+    def extend(self, bounding_boxes: Iterable[BoundingBox]):
+        if isinstance(bounding_boxes, BoundingBoxArray):
+            self.data.extend(bounding_boxes.data)
+            return
+        for bounding_box in bounding_boxes:
+            self.append(bounding_box)
+
+    def iter_dbu(self) -> Iterator[BoundingBoxDBU]:
+        """
+        :returns: An iterator over the bounding boxes in database units.
+        """
+        it = iter(self.data)
+        return zip(it, it, it, it)
+
+    def __len__(self) -> int:
+        return len(self.data) // 4
+
+    @overload
+    def __getitem__(self, index: int) -> BoundingBox: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[BoundingBox]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("bounding box index out of range")
+        lx, ly, ux, uy = self.data[index * 4 : index * 4 + 4]
+        return (_from_dbu(lx), _from_dbu(ly), _from_dbu(ux), _from_dbu(uy))
+
+    def __iter__(self) -> Iterator[BoundingBox]:
+        for lx, ly, ux, uy in self.iter_dbu():
+            yield (_from_dbu(lx), _from_dbu(ly), _from_dbu(ux), _from_dbu(uy))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BoundingBoxArray):
+            return self.data == other.data
+        if not isinstance(other, Sequence) or len(other) != len(self):
+            return False
+        return all(tuple(a) == tuple(b) for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+class Violation(object):
+    """
+    A category of DRC violations and the bounding boxes where it was found.
+
+    :param rules: A list of (layer, rule) tuples. The first one is used to name
+        the category.
+    :param description: A human-readable description of the violation.
+    :param bounding_boxes: The bounding boxes of the violation, in microns.
+    """
+
+    __slots__ = ("rules", "description", "bounding_boxes")
 
-@dataclass
-class Violation:
     rules: List[Tuple[str, str]]  # (layer, rule)
     description: str
-    bounding_boxes: List[BoundingBox] = field(default_factory=list)
+    bounding_boxes: BoundingBoxArray
+
+    def __init__(
+        self,
+        rules: List[Tuple[str, str]],
+        description: str,
+        bounding_boxes: Iterable[BoundingBox] = (),
+    ):
+        self.rules = rules
+        self.description = description
+        if isinstance(bounding_boxes, BoundingBoxArray):
+            self.bounding_boxes = bounding_boxes
+        else:
+            self.bounding_boxes = BoundingBoxArray(bounding_boxes)
 
     @property
     def layer(self) -> str:
@@ -41,8 +200,152 @@ class Violation:
     def category_name(self) -> str:
         return f"{self.layer}.{self.rule}"
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Violation):
+            return NotImplemented
+        return (
+            [tuple(rule) for rule in self.rules]
+            == [tuple(rule) for rule in other.rules]
+            and self.description == other.description
+            and self.bounding_boxes == other.bounding_boxes
+        )
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rules={self.rules!r}, description={self.description!r}, bounding_boxes={len(self.bounding_boxes)} boxes)"
+
+
+class SpatialIndex(object):
+    """
+    A static, packed R-tree over a flat array of bounding boxes in database
+    units, used to find the bounding boxes that intersect a window.
+
+    The boxes are bulk-loaded: leaves are packed using sort-tile-recursive
+    ordering, and each upper level groups consecutive nodes of the level below.
+    The index is a snapshot; it does not follow later changes to ``data``.
+
+    :param data: A flat array of coordinates, four per bounding box.
+    """
+
+    node_capacity: ClassVar[int] = 16
+
+    def __init__(self, data: Sequence[int]):
+        count = len(data) // 4
+        capacity = self.node_capacity
+
+        centers_x = [data[i] + data[i + 2] for i in range(0, count * 4, 4)]
+        centers_y = [data[i + 1] + data[i + 3] for i in range(0, count * 4, 4)]
+        order = sorted(range(count), key=centers_x.__getitem__)
+        leaf_count = math.ceil(count / capacity)
+        slab_size = math.ceil(math.sqrt(leaf_count)) * capacity
+
+        self.__entries = array("q")
+        for start in range(0, count, slab_size):
+            slab = order[start : start + slab_size]
+            slab.sort(key=centers_y.__getitem__)
+            self.__entries.extend(slab)
+
+        self.__boxes = array("q")
+        for entry in self.__entries:
+            self.__boxes.extend(data[entry * 4 : entry * 4 + 4])
+
+        self.__levels: List[array] = []
+        current = self.__boxes
+        while len(current) != 0 and (len(self.__levels) == 0 or len(current) > 4):
+            current = self.__group(current)
+            self.__levels.append(current)
+
+    @classmethod
+    def __group(Self, boxes: array) -> array:
+        capacity = Self.node_capacity
+        result = array("q")
+        for start in range(0, len(boxes), capacity * 4):
+            end = start + capacity * 4
+            result.extend(
+                (
+                    min(boxes[start:end:4]),
+                    min(boxes[start + 1 : end : 4]),
+                    max(boxes[start + 2 : end : 4]),
+                    max(boxes[start + 3 : end : 4]),
+                )
+            )
+        return result
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def query(self, lx: int, ly: int, ux: int, uy: int) -> Iterator[int]:
+        """
+        :param lx: The lower x coordinate of the window, in database units.
+        :param ly: The lower y coordinate of the window, in database units.
+        :param ux: The upper x coordinate of the window, in database units.
+        :param uy: The upper y coordinate of the window, in database units.
+        :returns: An iterator over the indices of the bounding boxes that
+            intersect or touch the window, in no particular order.
+        """
+        if not self.__levels:
+            return
+        capacity = self.node_capacity
+        top = len(self.__levels) - 1
+        stack = [(top, node) for node in range(len(self.__levels[top]) // 4)]
+        while len(stack):
+            level, node = stack.pop()
+            boxes = self.__levels[level]
+            i = node * 4
+            if (
+                boxes[i] > ux
+                or boxes[i + 2] < lx
+                or boxes[i + 1] > uy
+                or boxes[i + 3] < ly
+            ):
+                continue
+            first = node * capacity
+            if level != 0:
+                last = min(first + capacity, len(self.__levels[level - 1]) // 4)
+                stack.extend((level - 1, child) for child in range(first, last))
+                continue
+            last = min(first + capacity, len(self.__entries))
+            leaves = self.__boxes
+            for j in range(first, last):
+                i = j * 4
+                if (
+                    leaves[i] <= ux
+                    and leaves[i + 2] >= lx
+                    and leaves[i + 1] <= uy
+                    and leaves[i + 3] >= ly
+                ):
+                    yield self.__entries[j]
+
 
 illegal_overlap_rx = re.compile(r"between (\w+) and (\w+)")
+_klayout_coordinate_rx = re.compile(
+    r"(-?[\d.]+(?:[eE][-+]?\d+)?),(-?[\d.]+(?:[eE][-+]?\d+)?)"
+)
+_binary_magic = b"OLDRC\x00\x01\x00"
+_shlex_special_rx = re.compile(r"[\"'\\#]")
+
+
+def _tokenize_magic_feedback(feedback: Iterable[str]) -> Iterator[str]:
+    # Tokenizes line by line: only lines with quotes, escapes or comments go
+    # through shlex, and a quoted string spanning multiple lines is completed
+    # with the lines that follow it.
+    pending = ""
+    for line in feedback:
+        if pending:
+            line = pending + line
+            pending = ""
+        if _shlex_special_rx.search(line) is None:
+            yield from line.split()
+            continue
+        try:
+            tokens = shlex.split(line, comments=True)
+        except ValueError:
+            pending = line
+            continue
+        yield from tokens
+    if pending:
+        yield from shlex.split(pending, comments=True)
 
 
 @dataclass
@@ -53,6 +356,9 @@ class DRC:
 
     module: str
     violations: Dict[str, Violation]
+    _index: Optional[Tuple[tuple, SpatialIndex, List[int], array]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_magic(
@@ -114,7 +420,7 @@ class DRC:
             elif state == State.data:
                 assert violation is not None, "Parser reached an inconsistent state"
                 try:
-                    coord_list = [Decimal(coord[:-2]) for coord in line.split()]
+                    coord_list = [_to_dbu(coord[:-2]) for coord in line.split()]
                 except InvalidOperation:
                     raise ValueError(
                         f"invalid bounding box at line {i}: number is invalid"
@@ -125,14 +431,7 @@ class DRC:
                         f"invalid bounding box at line {i}: bounding box has {len(coord_list)}/4 elements"
                     )
 
-                bounding_box: BoundingBox = (
-                    coord_list[0],
-                    coord_list[1],
-                    coord_list[2],
-                    coord_list[3],
-                )
-
-                violation.bounding_boxes.append(bounding_box)
+                violation.bounding_boxes.append_dbu(*coord_list)
                 violations[violation.category_name] = violation
                 bbox_count += 1
 
@@ -142,104 +441,456 @@ class DRC:
     def from_magic_feedback(
         Self, feedback: io.TextIOWrapper, cif_scale: Decimal, module: str
     ) -> Tuple["DRC", int]:
+        """
+        Parses a Magic feedback file, i.e., a Tcl script of ``box`` and
+        ``feedback add`` commands, in a single streaming pass.
+
+        :param feedback: A text stream of the feedback file.
+        :param cif_scale: The scale of the box coordinates in microns.
+        :param module: The name of the module.
+        :returns: A tuple of the DRC object and the number of boxes.
+        """
         bbox_count = 0
         violations: Dict[str, Violation] = {}
-        last_bounding_box: Optional[BoundingBox] = None
-        lex = shlex.shlex(feedback.read(), posix=True)
-        components = list(lex)
-        while len(components):
-            instruction = components.pop(0)
+        last_bounding_box: Optional[BoundingBoxDBU] = None
+        scale = cif_scale.scaleb(_DBU_DIGITS)
+        int_scale = int(scale) if scale == scale.to_integral_value() else None
+
+        def to_dbu(coord: str) -> int:
+            if int_scale is not None:
+                try:
+                    return int(coord) * int_scale
+                except ValueError:
+                    pass
+            return _to_dbu(Decimal(coord) * cif_scale)
+
+        tokens = _tokenize_magic_feedback(feedback)
+        for instruction in tokens:
             if instruction == "box":
-                if len(components) < 4:
+                try:
+                    lx, ly, ux, uy = (
+                        next(tokens),
+                        next(tokens),
+                        next(tokens),
+                        next(tokens),
+                    )
+                except StopIteration:
                     raise ValueError(
                         "Invalid syntax: 'box' command has less than 4 arguments"
                     )
-                lx, ly, ux, uy = components[0:4]
-                last_bounding_box = (
-                    Decimal(lx) * cif_scale,
-                    Decimal(ly) * cif_scale,
-                    Decimal(ux) * cif_scale,
-                    Decimal(uy) * cif_scale,
-                )
+                last_bounding_box = (to_dbu(lx), to_dbu(ly), to_dbu(ux), to_dbu(uy))
                 bbox_count += 1
-                components = components[4:]
             elif instruction == "feedback":
-                try:
-                    subcmd = components.pop(0)
-                except IndexError:
+                subcmd = next(tokens, None)
+                if subcmd is None:
                     raise ValueError("feedback not given subcommand")
                 if subcmd != "add":
                     raise ValueError(f"Unsuppoorted feedback subcommand {subcmd}")
 
-                try:
-                    rule = components.pop(0)
-                    _ = components.pop(0)
-                except IndexError:
+                rule = next(tokens, None)
+                if rule is None or next(tokens, None) is None:
                     raise ValueError(
                         "Invalid syntax: 'feedback add' command has less than 2 arguments"
                     )
-                vio_layer = "UNKNOWN"
-                vio_rulenum = f"UNKNOWN{len(violations)}"
-                if "Illegal overlap" in rule:
-                    vio_rulenum = "ILLEGAL_OVERLAP"
-                    if match := illegal_overlap_rx.search(rule):
-                        vio_layer = "-".join((match[1], match[2]))
-                if rule not in violations:
-                    violations[rule] = Violation([(vio_layer, vio_rulenum)], rule, [])
+                violation = violations.get(rule)
+                if violation is None:
+                    vio_layer = "UNKNOWN"
+                    vio_rulenum = f"UNKNOWN{len(violations)}"
+                    if "Illegal overlap" in rule:
+                        vio_rulenum = "ILLEGAL_OVERLAP"
+                        if match := illegal_overlap_rx.search(rule):
+                            vio_layer = "-".join((match[1], match[2]))
+                    violation = violations[rule] = Violation(
+                        [(vio_layer, vio_rulenum)], rule
+                    )
                 if last_bounding_box is None:
                     raise ValueError("Attempted to add feedback without a box selected")
-                violations[rule].bounding_boxes.append(last_bounding_box)
+                violation.bounding_boxes.append_dbu(*last_bounding_box)
         violations = {vio.category_name: vio for vio in violations.values()}
         return (Self(module, violations), bbox_count)
 
+    @classmethod
+    def from_klayout_xml(
+        Self,
+        report: IO[Any],
+        module: Optional[str] = None,
+    ) -> Tuple["DRC", int]:
+        """
+        Parses a KLayout report database (``.lyrdb``/``.xml``) into a DRC object
+        in a single streaming pass.
+
+        Each item is reduced to the bounding box of all of its values'
+        coordinates. Items without any coordinates are skipped.
+
+        :param report: An input stream containing the report database.
+        :param module: The name of the module. If unset, the first cell in
+            the report is used.
+        :returns: A tuple of the DRC object and the number of bounding boxes.
+        """
+        from xml.etree.ElementTree import iterparse
+
+        violations: Dict[str, Violation] = {}
+        by_category: Dict[str, Violation] = {}
+        descriptions: Dict[str, str] = {}
+        bbox_count = 0
+
+        category_names: List[str] = []
+        category_descriptions: List[str] = []
+        item_category: Optional[str] = None
+        item_box: Optional[List[int]] = None
+        path: List[str] = []
+
+        def get_violation(category: str) -> Violation:
+            violation = by_category.get(category)
+            if violation is None:
+                layer, _, rule = category.partition(".")
+                if rule == "":
+                    layer, rule = "UNKNOWN", category
+                violation = Violation(
+                    [(layer, rule)], descriptions.get(category) or category
+                )
+                violations[violation.category_name] = by_category[category] = violation
+            return violation
+
+        for event, element in iterparse(report, events=("start", "end")):
+            tag = element.tag
+            if event == "start":
+                path.append(tag)
+                if tag == "category" and path[-2] == "categories":
+                    category_names.append("")
+                    category_descriptions.append("")
+                elif tag == "item":
+                    item_category = None
+                    item_box = None
+                continue
+
+            path.pop()
+            parent = path[-1] if len(path) else None
+            text = element.text or ""
+            if parent == "category" and path[-2:-1] == ["categories"]:
+                if tag == "name":
+                    category_names[-1] = text.strip().strip("'")
+                elif tag == "description":
+                    category_descriptions[-1] = text.strip()
+            elif tag == "category" and parent == "categories":
+                descriptions[".".join(category_names)] = category_descriptions.pop()
+                category_names.pop()
+            elif tag == "name" and parent == "cell" and module is None:
+                module = text.strip()
+            elif parent == "item" and tag == "category":
+                item_category = text.strip().replace("'.'", ".").strip("'")
+            elif parent == "values" and tag == "value":
+                for match in _klayout_coordinate_rx.finditer(text):
+                    x, y = _to_dbu(match[1]), _to_dbu(match[2])
+                    if item_box is None:
+                        item_box = [x, y, x, y]
+                    else:
+                        item_box[0] = min(item_box[0], x)
+                        item_box[1] = min(item_box[1], y)
+                        item_box[2] = max(item_box[2], x)
+                        item_box[3] = max(item_box[3], y)
+            elif tag == "item":
+                if item_category is not None and item_box is not None:
+                    get_violation(item_category).bounding_boxes.append_dbu(*item_box)
+                    bbox_count += 1
+                element.clear()
+
+        return (Self(module or "UNKNOWN", violations), bbox_count)
+
+    @classmethod
+    def merge(
+        Self,
+        drcs: Iterable["DRC"],
+        module: Optional[str] = None,
+        deduplicate: bool = True,
+    ) -> "DRC":
+        """
+        Merges multiple DRC objects, e.g. from multiple tools or from multiple
+        regions of the same design, into a new DRC object.
+
+        Violations are matched by their category names. The rules and
+        description of the first occurrence of each category are kept.
+
+        :param drcs: The DRC objects to merge.
+        :param module: The name of the module. If unset, the module of the
+            first DRC object is used.
+        :param deduplicate: Whether to drop bounding boxes that were already
+            reported for the same category.
+        :returns: The merged DRC object.
+        """
+        violations: Dict[str, Violation] = {}
+        seen: Dict[str, Set[BoundingBoxDBU]] = {}
+        for drc in drcs:
+            if module is None:
+                module = drc.module
+            for name, violation in drc.violations.items():
+                merged = violations.get(name)
+                if merged is None:
+                    merged = violations[name] = Violation(
+                        list(violation.rules), violation.description
+                    )
+                    seen[name] = set()
+                if not deduplicate:
+                    merged.bounding_boxes.extend(violation.bounding_boxes)
+                    continue
+                seen_boxes = seen[name]
+                for bounding_box in violation.bounding_boxes.iter_dbu():
+                    if bounding_box in seen_boxes:
+                        continue
+                    seen_boxes.add(bounding_box)
+                    merged.bounding_boxes.append_dbu(*bounding_box)
+        return Self(module or "UNKNOWN", violations)
+
+    def query(self, window: BoundingBox) -> Iterator[Tuple[str, BoundingBox]]:
+        """
+        Finds the violations in a window using a spatial index, which is built
+        on the first query and rebuilt whenever bounding boxes were added since.
+
+        :param window: The window in microns as ``(lx, ly, ux, uy)``.
+        :returns: An iterator over tuples of category names and bounding boxes
+            that intersect or touch the window.
+        """
+        signature = tuple(
+            (name, len(violation.bounding_boxes))
+            for name, violation in self.violations.items()
+        )
+        if self._index is None or self._index[0] != signature:
+            data = array("q")
+            offsets = []
+            for violation in self.violations.values():
+                offsets.append(len(data) // 4)
+                data.extend(violation.bounding_boxes.data)
+            self._index = (signature, SpatialIndex(data), offsets, data)
+
+        _, index, offsets, data = self._index
+        names = [name for name, _ in signature]
+        lx, ly, ux, uy = window
+        for entry in index.query(_to_dbu(lx), _to_dbu(ly), _to_dbu(ux), _to_dbu(uy)):
+            name = names[bisect_right(offsets, entry) - 1]
+            i = entry * 4
+            yield (
+                name,
+                (
+                    _from_dbu(data[i]),
+                    _from_dbu(data[i + 1]),
+                    _from_dbu(data[i + 2]),
+                    _from_dbu(data[i + 3]),
+                ),
+            )
+
+    def save(self, path: str):
+        """
+        Saves the DRC object to a compact binary file, which can be read back
+        using :meth:`load`.
+
+        :param path: The path of the file.
+        """
+        header = json.dumps(
+            {
+                "module": self.module,
+                "database_unit": str(DATABASE_UNIT),
+                "violations": [
+                    {
+                        "name": name,
+                        "rules": violation.rules,
+                        "description": violation.description,
+                        "count": len(violation.bounding_boxes),
+                    }
+                    for name, violation in self.violations.items()
+                ],
+            }
+        ).encode("utf8")
+        with open(path, "wb") as f:
+            f.write(_binary_magic)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            for violation in self.violations.values():
+                data = violation.bounding_boxes.data
+                if sys.byteorder != "little":
+                    data = array("q", data)
+                    data.byteswap()
+                data.tofile(f)
+
+    @classmethod
+    def load(Self, path: str) -> "DRC":
+        """
+        Loads a DRC object saved using :meth:`save`.
+
+        :param path: The path of the file.
+        :returns: The DRC object.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(_binary_magic)) != _binary_magic:
+                raise ValueError(f"'{path}' is not a DRC database file")
+            (header_length,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_length).decode("utf8"))
+            if Decimal(header["database_unit"]) != DATABASE_UNIT:
+                raise ValueError(
+                    f"'{path}' uses an unsupported database unit {header['database_unit']}"
+                )
+            violations: Dict[str, Violation] = {}
+            for entry in header["violations"]:
+                bounding_boxes = BoundingBoxArray()
+                try:
+                    bounding_boxes.data.fromfile(f, entry["count"] * 4)
+                except EOFError:
+                    raise ValueError(f"'{path}' is truncated")
+                if sys.byteorder != "little":
+                    bounding_boxes.data.byteswap()
+                violations[entry["name"]] = Violation(
+                    [(layer, rule) for layer, rule in entry["rules"]],
+                    entry["description"],
+                    bounding_boxes,
+                )
+        return Self(header["module"], violations)
+
+    def to_magic(self, out: TextIO):
+        """
+        Writes the DRC object as a report in the same format as the one
+        generated by Magic, which can be read back using :meth:`from_magic`.
+
+        :param out: A **text** output stream.
+        """
+        split_line = "-" * 40
+        count = 0
+        out.write(f"{self.module}\n{split_line}\n")
+        for violation in self.violations.values():
+            out.write(f"{violation.description}\n{split_line}\n")
+            for bounding_box in violation.bounding_boxes.iter_dbu():
+                out.write(" ".join(f"{_format_dbu(c)}um" for c in bounding_box))
+                out.write("\n")
+                count += 1
+            out.write(f"{split_line}\n")
+        out.write(f"[INFO] COUNT: {count}\n")
+
+    def to_json(self, out: TextIO):
+        """
+        Writes the DRC object as JSON, one bounding box at a time.
+
+        :param out: A **text** output stream.
+        """
+        out.write(f'{{"module": {json.dumps(self.module)}, "violations": {{')
+        for i, (name, violation) in enumerate(self.violations.items()):
+            if i != 0:
+                out.write(", ")
+            rules = json.dumps([list(rule) for rule in violation.rules])
+            description = json.dumps(violation.description)
+            out.write(
+                f'{json.dumps(name)}: {{"rules": {rules}, "description": {description}, "bounding_boxes": ['
+            )
+            for j, (lx, ly, ux, uy) in enumerate(violation.bounding_boxes.iter_dbu()):
+                out.write(
+                    f"{', ' if j != 0 else ''}[{_format_dbu(lx)}, {_format_dbu(ly)}, {_format_dbu(ux)}, {_format_dbu(uy)}]"
+                )
+            out.write("]}")
+        out.write("}}")
+
     def dumps(self):
         """
         :returns: The DRC object as a JSON string.
         """
-        return json.dumps(asdict(self))
+        sio = io.StringIO()
+        self.to_json(sio)
+        return sio.getvalue()
 
-    def to_klayout_xml(self, out: io.BufferedIOBase):
+    def to_klayout_xml(self, out: IO[bytes]):
         """
-        Converts the DRC object to a KLayout-compatible XML database.
+        Converts the DRC object to a KLayout-compatible XML database, one item
+        at a time.
 
         :param out: A **binary** output stream to the target XML file.
             You can pass the result of ``open("drc.xml",  "wb")``, for example.
         """
-        from lxml import etree as ET
-
-        with ET.xmlfile(out, encoding="utf8", buffered=False) as xf:
-            with xf.element("report-database"):
-                # 1. Cells
-                with xf.element("cells"):
-                    with xf.element("cell"):
-                        name = ET.Element("name")
-                        name.text = self.module
-                        xf.write(name)
-                # 2. Categories
-                with xf.element("categories"):
-                    for _, violation in self.violations.items():
-                        with xf.element("category"):
-                            name = ET.Element("name")
-                            name.text = violation.category_name
-                            description = ET.Element("description")
-                            description.text = violation.description
-                            xf.write(name, description)
-                # 3. Items
-                with xf.element("items"):
-                    for _, violation in self.violations.items():
-                        for bounding_box in violation.bounding_boxes:
-                            with xf.element("item"):
-                                cell = ET.Element("cell")
-                                cell.text = self.module
-                                category = ET.Element("category")
-                                category.text = f"'{violation.category_name}'"
-                                visited = ET.Element("visited")
-                                visited.text = "false"
-                                multiplicity = ET.Element("multiplicity")
-                                multiplicity.text = str(len(violation.bounding_boxes))
-                                xf.write(cell, category, visited, multiplicity)
-                                with xf.element("values"):
-                                    llx, lly, urx, ury = bounding_box
-                                    value = ET.Element("value")
-                                    value.text = f"polygon: ({llx},{lly};{urx},{lly};{urx},{ury};{llx},{ury})"
-                                    xf.write(value)
+        module = escape(self.module)
+        chunk: List[str] = [
+            "<?xml version='1.0' encoding='utf8'?>\n<report-database>",
+            # 1. Cells
+            f"<cells><cell><name>{module}</name></cell></cells>",
+            # 2. Categories
+            "<categories>",
+        ]
+        for violation in self.violations.values():
+            chunk.append(
+                f"<category><name>{escape(violation.category_name)}</name><description>{escape(violation.description)}</description></category>"
+            )
+        chunk.append("</categories>")
+        # 3. Items
+        chunk.append("<items>")
+        for violation in self.violations.values():
+            item_prefix = f"<item><cell>{module}</cell><category>'{escape(violation.category_name)}'</category><visited>false</visited><multiplicity>{len(violation.bounding_boxes)}</multiplicity><values><value>polygon: ("
+            for lx, ly, ux, uy in violation.bounding_boxes.iter_dbu():
+                llx, lly, urx, ury = (
+                    _format_dbu(lx),
+                    _format_dbu(ly),
+                    _format_dbu(ux),
+                    _format_dbu(uy),
+                )
+                chunk.append(
+                    f"{item_prefix}{llx},{lly};{urx},{lly};{urx},{ury};{llx},{ury})</value></values></item>"
+                )
+                if len(chunk) >= 4096:
+                    out.write("".join(chunk).encode("utf8"))
+                    chunk.clear()
+        chunk.append("</items></report-database>")
+        out.write("".join(chunk).encode("utf8"))
+
+
+def merge_klayout_xml(reports: Iterable[str], out: IO[bytes]):
+    """
+    Merges KLayout report databases item by item, keeping their exact
+    geometries, e.g. the outputs of the same check run on different regions of
+    a layout.
+
+    The header of the first report is kept. Categories and cells are matched by
+    name, and all items are kept. Items are streamed from one report at a
+    time, so memory use does not grow with the item count.
+
+    :param reports: Paths to the report databases.
+    :param out: A **binary** output stream to the merged XML file.
+    """
+    from xml.etree.ElementTree import iterparse, tostring
+
+    reports = list(reports)
+    header: Dict[str, Any] = {}
+    categories: Dict[str, Any] = {}
+    cells: Dict[str, Any] = {}
+    for report in reports:
+        depth = 0
+        for event, element in iterparse(report, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 2 and element.tag in ["category", "cell"]:
+                target = categories if element.tag == "category" else cells
+                target.setdefault(element.findtext("name", "").strip(), element)
+            elif depth == 1 and element.tag not in ["categories", "cells", "items"]:
+                header.setdefault(element.tag, element)
+            elif depth == 2 and element.tag == "item":
+                element.clear()
+
+    def write(element: Any):
+        element.tail = None
+        out.write(tostring(element, encoding="utf8", xml_declaration=False))
+
+    out.write(b"<?xml version='1.0' encoding='utf8'?>\n<report-database>")
+    for element in header.values():
+        write(element)
+    out.write(b"<categories>")
+    for element in categories.values():
+        write(element)
+    out.write(b"</categories><cells>")
+    for element in cells.values():
+        write(element)
+    out.write(b"</cells><items>")
+    for report in reports:
+        depth = 0
+        for event, element in iterparse(report, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 2 and element.tag == "item":
+                write(element)
+                element.clear()
+    out.write(b"</items></report-database>")
@@ -20,16 +20,19 @@ from collections import UserString
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
     Hashable,
     ItemsView,
     Iterator,
+    List,
     Mapping,
     Sequence,
     Type,
     TypeVar,
     Tuple,
     Optional,
+    cast,
 )
 
 from .misc import idem
@@ -142,6 +145,25 @@ class GenericDict(Mapping[KT, VT]):
         del self[key]
         return value
 
+    def _get_data(self) -> Mapping[KT, VT]:
+        """
+        :returns: The underlying storage of this object, which must not be
+            mutated.
+        """
+        return self.__data
+
+    def _set_data(self, data: Mapping[KT, VT]):
+        """
+        A constructor hook for subclasses: replaces the underlying storage of
+        this object with ``data`` without copying it.
+
+        ``data`` must provide the read-only interface of a ``dict``, including
+        ``copy()``. It is only mutated if this object is.
+
+        :param data: The new underlying storage
+        """
+        self.__data = cast(Dict[KT, VT], data)
+
     T = TypeVar("T", bound="GenericDict")
 
     def copy(self: T) -> T:
@@ -231,7 +253,94 @@ class GenericDict(Mapping[KT, VT]):
             self[key] = value
 
 
+class _Overlay(Mapping[KT, VT]):
+    """
+    A read-only mapping of a (never mutated) base mapping and a delta of new
+    or overridden values, with the key order of an equivalent ``dict``.
+
+    Chains of overlays are flattened once they reach ``max_depth``, so lookups
+    stay bounded while deriving a mapping only costs O(changes) on average.
+    """
+
+    max_depth: ClassVar[int] = 32
+
+    __slots__ = ("base", "delta", "depth", "length", "flat")
+
+    base: Mapping[KT, VT]
+    delta: Dict[KT, VT]
+    depth: int
+    length: int
+    flat: Optional[Dict[KT, VT]]
+
+    def __init__(self, base: Mapping[KT, VT], delta: Dict[KT, VT]) -> None:
+        if isinstance(base, _Overlay):
+            if base.depth >= self.max_depth:
+                base = base.flatten()
+                self.depth = 1
+            else:
+                self.depth = base.depth + 1
+        else:
+            self.depth = 1
+        self.base = base
+        self.delta = delta
+        self.length = len(base) + sum(1 for key in delta if key not in base)
+        self.flat = None
+
+    def flatten(self) -> Dict[KT, VT]:
+        """
+        :returns: An equivalent ``dict``, computed once then shared. It must
+            not be mutated.
+        """
+        if self.flat is None:
+            layers: List[Mapping[KT, VT]] = []
+            current: Mapping[KT, VT] = self
+            while isinstance(current, _Overlay):
+                if current.flat is not None:
+                    break
+                layers.append(current.delta)
+                current = current.base
+            if isinstance(current, _Overlay) and current.flat is not None:
+                flat = dict(current.flat)
+            else:
+                flat = dict(current)
+            for delta in reversed(layers):
+                flat.update(delta)
+            self.flat = flat
+        return self.flat
+
+    def __getitem__(self, key: KT) -> VT:
+        if self.flat is not None:
+            return self.flat[key]
+        if key in self.delta:
+            return self.delta[key]
+        return self.base[key]
+
+    def __contains__(self, key: object) -> bool:
+        if self.flat is not None:
+            return key in self.flat
+        return key in self.delta or key in self.base
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[KT]:
+        return iter(self.flatten())
+
+    def copy(self) -> Dict[KT, VT]:
+        return self.flatten().copy()
+
+
 class GenericImmutableDict(GenericDict[KT, VT]):
+    """
+    An immutable variant of :class:`GenericDict`.
+
+    As instances cannot be modified, an immutable dictionary created from
+    another one shares its contents instead of copying them, storing only the
+    overrides. Deriving a new dictionary is thus O(changes) rather than
+    O(size), which adds up for large dictionaries derived from one another
+    repeatedly, e.g. the metrics of a flow's states.
+    """
+
     __lock: bool
 
     def __init__(
@@ -241,7 +350,17 @@ class GenericImmutableDict(GenericDict[KT, VT]):
         *args,
         **kwargs,
     ) -> None:
-        super().__init__(copying, *args, **kwargs)
+        if (
+            isinstance(copying, GenericImmutableDict)
+            and len(args) == 0
+            and set(kwargs.keys()) <= {"overrides"}
+        ):
+            super().__init__()
+            self._set_data(
+                _Overlay(copying._get_data(), dict(kwargs.get("overrides") or {}))
+            )
+        else:
+            super().__init__(copying, *args, **kwargs)
         self.__lock = True
 
     def __setitem__(self, key: KT, item: VT):
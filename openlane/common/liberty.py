@@ -0,0 +1,394 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import io
+import os
+import re
+import gzip
+import json
+import mmap
+import threading
+from decimal import Decimal
+from dataclasses import asdict, dataclass, field
+from contextlib import contextmanager
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .misc import Filter
+
+_CHUNK_SIZE = 16 * 1024 * 1024
+
+# A cell group starting at the beginning of a line, or a lone brace
+_TOKEN_RX = re.compile(
+    rb'^(?P<indent>[ \t]*)cell\s*\(\s*"?(?P<name>[^")]*?)"?\s*\)\s*\{|[{}]',
+    re.M,
+)
+
+
+@dataclass(frozen=True)
+class LibertyCell:
+    """
+    The location of a ``cell`` group inside a liberty file.
+
+    :param name: The name of the cell.
+    :param start: The byte offset of the start of the line the group opens on.
+    :param end: The byte offset right after the line the group closes on.
+    :param indent: The whitespace the line the group opens on starts with.
+    """
+
+    name: str
+    start: int
+    end: int
+    indent: bytes
+
+
+@dataclass(frozen=True)
+class LibertyCellIndex:
+    """
+    A byte-offset index of the ``cell`` groups of an (uncompressed) liberty
+    file, in the order they appear in.
+
+    Built once per file by :func:`get_liberty_cell_index` and reused for every
+    set of cells removed from it.
+
+    :param size: The size of the uncompressed file in bytes.
+    :param cells: The cell groups in the file.
+    """
+
+    size: int
+    cells: Tuple[LibertyCell, ...]
+
+    @classmethod
+    def build(Self, data: Union[bytes, mmap.mmap]) -> LibertyCellIndex:
+        """
+        :param data: The contents of an uncompressed liberty file.
+        :returns: The index of the cell groups in ``data``.
+
+            Like the liberty format itself, the scan is brace-based: braces
+            inside comments or strings are not expected.
+        """
+        size = len(data)
+        cells: List[LibertyCell] = []
+        depth = 0
+        current: Optional[Tuple[str, int, bytes]] = None
+        cell_depth = 0
+        for match in _TOKEN_RX.finditer(data):
+            token = match[0]
+            if token == b"}":
+                depth -= 1
+                if current is not None and depth == cell_depth:
+                    name, start, indent = current
+                    end = data.find(b"\n", match.end())
+                    end = size if end == -1 else end + 1
+                    cells.append(LibertyCell(name, start, end, indent))
+                    current = None
+                continue
+            if token != b"{" and current is None:
+                current = (
+                    match["name"].decode("utf8"),
+                    match.start(),
+                    match["indent"],
+                )
+                cell_depth = depth
+            depth += 1
+        return Self(size, tuple(cells))
+
+
+@contextmanager
+def _open_liberty(path: str) -> Iterator[Union[bytes, mmap.mmap]]:
+    # Gzipped files are decompressed into memory, uncompressed ones are
+    # mapped if possible.
+    with open(path, "rb") as f:
+        if f.read(2) == b"\x1f\x8b":
+            f.seek(0)
+            with gzip.open(f, "rb") as g:
+                yield g.read()
+            return
+        f.seek(0)
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, io.UnsupportedOperation):
+            # Empty files, unmappable files or file-like objects without a
+            # file descriptor
+            yield f.read()
+            return
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
+_INDICES: Dict[Tuple[str, int, int], LibertyCellIndex] = {}
+_INDICES_LOCK = threading.Lock()
+
+
+def get_liberty_cell_index(path: str) -> LibertyCellIndex:
+    """
+    :param path: The path to a liberty file, optionally gzipped.
+    :returns: The index of the cell groups in the file. Results are memoized
+        for the lifetime of the process as long as the file's size and
+        modification time do not change.
+    """
+    stat = os.stat(path)
+    memo_key = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+    with _INDICES_LOCK:
+        if index := _INDICES.get(memo_key):
+            return index
+    with _open_liberty(path) as data:
+        index = LibertyCellIndex.build(data)
+    with _INDICES_LOCK:
+        _INDICES[memo_key] = index
+    return index
+
+
+def remove_liberty_cells(
+    input_path: str,
+    excluded_cells: Filter,
+    output_path: str,
+) -> List[str]:
+    """
+    Writes a copy of a liberty file with some cell groups replaced by a
+    comment, e.g. ``/* removed sky130_fd_sc_hd__probe_p_8 */``\\.
+
+    Everything between removed cells is copied verbatim in bulk.
+
+    :param input_path: The liberty file, optionally gzipped.
+    :param excluded_cells: A filter matching the names of the cells to remove.
+    :param output_path: The path to write the uncompressed result to.
+    :returns: The names of the removed cells.
+    """
+    index = get_liberty_cell_index(input_path)
+    removed: List[str] = []
+    with _open_liberty(input_path) as data, open(output_path, "wb") as out:
+        if len(data) != index.size:
+            # The file changed between indexing and opening
+            index = LibertyCellIndex.build(data)
+        view = memoryview(data)
+        try:
+            cursor = 0
+            for cell in index.cells:
+                if not excluded_cells.match(cell.name):
+                    continue
+                for offset in range(cursor, cell.start, _CHUNK_SIZE):
+                    out.write(view[offset : min(offset + _CHUNK_SIZE, cell.start)])
+                out.write(cell.indent + f"/* removed {cell.name} */\n".encode("utf8"))
+                removed.append(cell.name)
+                cursor = cell.end
+            for offset in range(cursor, index.size, _CHUNK_SIZE):
+                out.write(view[offset : min(offset + _CHUNK_SIZE, index.size)])
+        finally:
+            view.release()
+    return removed
+
+
+# Attributes, groups (and the values of their first argument), closing braces
+# and comments
+_STATEMENT_RX = re.compile(
+    rb"(?P<group>(?P<group_name>\w+)\s*\(\s*\"?(?P<arg>[^\")]*?)\"?\s*\)\s*\{)"
+    + rb"|(?P<attribute>(?P<attribute_name>\w+)\s*:\s*(?P<value>\"[^\"]*\"|[^;\n]*?)\s*;)"
+    + rb"|(?P<close>\})"
+    + rb"|(?P<comment>(?s:/\*.*?\*/))"
+)
+_BRACE_RX = re.compile(rb"[{}]")
+
+
+def _skip_group(data: Union[bytes, mmap.mmap], pos: int) -> int:
+    # Returns the offset right after the brace closing a group whose opening
+    # brace ends right before pos
+    depth = 1
+    for match in _BRACE_RX.finditer(data, pos):
+        depth += 1 if match[0] == b"{" else -1
+        if depth == 0:
+            return match.end()
+    return len(data)
+
+
+@dataclass
+class LibertyCellInfo:
+    """
+    Metadata about a cell in a liberty file.
+
+    :param area: The ``area`` attribute of the cell, if set.
+    :param footprint: The ``cell_footprint`` attribute of the cell, if set.
+    :param pins: The directions of the cell's pins and buses by name.
+    """
+
+    area: Optional[str] = None
+    footprint: Optional[str] = None
+    pins: Dict[str, Optional[str]] = field(default_factory=dict)
+
+
+@dataclass
+class LibertyIndex:
+    """
+    Compact metadata about a liberty file, extracted in a single pass that
+    skips over timing and power tables.
+
+    Use :meth:`openlane.common.Toolbox.get_lib_index` to get the index of a
+    file, which is also stored in the global
+    :class:`openlane.common.ArtifactCache` if enabled, so each liberty file is
+    only ever scanned once.
+
+    :param name: The name of the library.
+    :param default_operating_conditions: The ``default_operating_conditions``
+        attribute of the library, if set.
+    :param nom_voltage: The ``nom_voltage`` attribute of the library, if set.
+    :param operating_conditions: The attributes of each ``operating_conditions``
+        group by name.
+    :param cells: The metadata of each cell by name.
+    """
+
+    format_version: ClassVar[int] = 1
+
+    name: Optional[str] = None
+    default_operating_conditions: Optional[str] = None
+    nom_voltage: Optional[str] = None
+    operating_conditions: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    cells: Dict[str, LibertyCellInfo] = field(default_factory=dict)
+
+    @classmethod
+    def build(Self, data: Union[bytes, mmap.mmap]) -> LibertyIndex:
+        """
+        :param data: The contents of an uncompressed liberty file.
+        :returns: The index of ``data``.
+        """
+        index = Self()
+        # The names of the groups enclosing the current position, innermost
+        # last
+        stack: List[str] = []
+        operating_conditions: Dict[str, str] = {}
+        cell = LibertyCellInfo()
+        pin = ""
+        pos = 0
+        while match := _STATEMENT_RX.search(data, pos):
+            pos = match.end()
+            if match["comment"] is not None:
+                continue
+            elif match["close"] is not None:
+                if len(stack):
+                    stack.pop()
+                continue
+            elif match["group"] is not None:
+                group = match["group_name"].decode("utf8")
+                arg = match["arg"].decode("utf8").strip()
+                parent = stack[-1] if len(stack) else None
+                if parent is None and group == "library":
+                    index.name = arg
+                elif parent == "library" and group == "operating_conditions":
+                    operating_conditions = index.operating_conditions[arg] = {}
+                elif parent == "library" and group == "cell":
+                    cell = index.cells[arg] = LibertyCellInfo()
+                elif parent == "cell" and group in ["pin", "bus"]:
+                    pin = arg
+                    cell.pins[pin] = None
+                else:
+                    # Tables and other groups of no interest: skip them entirely
+                    pos = _skip_group(data, pos)
+                    continue
+                stack.append(group)
+                continue
+
+            attribute = match["attribute_name"].decode("utf8")
+            value = match["value"].decode("utf8").strip('"')
+            parent = stack[-1] if len(stack) else None
+            if parent == "library":
+                if attribute == "default_operating_conditions":
+                    index.default_operating_conditions = value
+                elif attribute == "nom_voltage":
+                    index.nom_voltage = value
+            elif parent == "operating_conditions":
+                operating_conditions[attribute] = value
+            elif parent == "cell":
+                if attribute == "area":
+                    cell.area = value
+                elif attribute == "cell_footprint":
+                    cell.footprint = value
+            elif parent in ["pin", "bus"] and attribute == "direction":
+                cell.pins[pin] = value
+        return index
+
+    def get_voltage(self) -> Optional[Decimal]:
+        """
+        :returns: The voltage of the default operating conditions, or of the
+            only operating conditions if there is no default. ``None`` if
+            neither exists.
+        :raises KeyError: If the default operating conditions are not defined
+            or do not have a voltage.
+        """
+        conditions_id = self.default_operating_conditions
+        if conditions_id is None:
+            if len(self.operating_conditions) != 1:
+                return None
+            conditions_id = next(iter(self.operating_conditions))
+        return Decimal(self.operating_conditions[conditions_id]["voltage"])
+
+    def has_cell(self, name: str) -> bool:
+        """
+        :param name: The name of a cell
+        :returns: Whether the library contains the cell.
+        """
+        return name in self.cells
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(Self, raw: Mapping[str, Any]) -> LibertyIndex:
+        cells = {name: LibertyCellInfo(**info) for name, info in raw["cells"].items()}
+        return Self(**{**raw, "cells": cells})
+
+    def save(self, path: str):
+        """
+        Writes the index to a JSON file.
+
+        :param path: The path to write to
+        """
+        with open(path, "w", encoding="utf8") as f:
+            json.dump(
+                {"format_version": self.format_version, **self.to_dict()},
+                f,
+                separators=(",", ":"),
+            )
+
+    @classmethod
+    def load(Self, path: str) -> Optional[LibertyIndex]:
+        """
+        :param path: A JSON file created by :meth:`save`
+        :returns: The loaded index, or ``None`` if the file was created by an
+            incompatible version of OpenLane.
+        """
+        with open(path, encoding="utf8") as f:
+            raw = json.load(f)
+        if raw.pop("format_version", None) != Self.format_version:
+            return None
+        return Self.from_dict(raw)
+
+    @classmethod
+    def from_file(Self, path: str) -> LibertyIndex:
+        """
+        :param path: The path to a liberty file, optionally gzipped.
+        :returns: The index of the file.
+        """
+        with _open_liberty(path) as data:
+            return Self.build(data)
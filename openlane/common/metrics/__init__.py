@@ -32,4 +32,4 @@ Classes and functions for dealing with Metrics based on the `METRICS2.1 <https:/
 """
 from . import library
 from .metric import MetricAggregator, MetricComparisonResult, Metric
-from .util import parse_metric_modifiers, aggregate_metrics, MetricDiff
+from .util import parse_metric_modifiers, aggregate_metrics, MetricDiff, MetricIndex
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import csv
 import sys
 import json
 import gzip
@@ -19,14 +20,16 @@ import click
 import tarfile
 import tempfile
 from io import BytesIO
+from contextlib import ExitStack
 from decimal import Decimal
-from typing import Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Set, TextIO, Tuple
 
 import cloup
 import httpx
 
 from .util import MetricDiff, TableVerbosity
-from ..misc import Filter, get_httpx_session, mkdirp
+from ..misc import Filter, get_httpx_session, mkdirp, _get_process_limit
 from ..cli import formatter_settings, IntEnumChoice
 
 default_filter_set = [
@@ -86,6 +89,12 @@ def common_opts(f):
         help="The place to write the table to.",
         default=None,
     )(f)
+    f = cloup.option(
+        "--csv-out",
+        type=click.Path(file_okay=True, dir_okay=False, writable=True),
+        help="If set, the comparison of every metric is also written to this file in CSV format.",
+        default=None,
+    )(f)
     f = cloup.option(
         "--significant-figures",
         type=int,
@@ -103,6 +112,7 @@ def compare(
     table_verbosity: TableVerbosity,
     filter_wildcards: Tuple[str, ...],
     table_out: Optional[str],
+    csv_out: Optional[str],
     significant_figures: int,
 ):
     """
@@ -134,6 +144,10 @@ def compare(
         table_file = open(table_out, "w", encoding="utf8")
     print(md_str, file=table_file)
 
+    if csv_out is not None:
+        with open(csv_out, "w", encoding="utf8", newline="") as f:
+            diff.render_csv(f)
+
     # When we upgrade to rich 13 (when NixOS 23.11 comes out,
     # it has a proper markdown table renderer, but until then, this will have to do)
 
@@ -141,12 +155,31 @@ def compare(
 cli.add_command(compare)
 
 
+def _compare_metric_files(
+    gold_path: str,
+    new_path: str,
+    significant_figures: int,
+    filter: Filter,
+    table_verbosity: TableVerbosity,
+) -> Tuple[MetricDiff.MetricStatistics, str, List[List[str]]]:
+    # Runs in worker processes: returns only picklable, pre-rendered results
+    gold = json.load(open(gold_path, encoding="utf8"), parse_float=Decimal)
+    new = json.load(open(new_path, encoding="utf8"), parse_float=Decimal)
+    diff = MetricDiff.from_metrics(gold, new, significant_figures, filter=filter)
+    return (
+        diff.stats(),
+        diff.render_md(("corner", ""), table_verbosity),
+        diff.get_rows(),
+    )
+
+
 def _compare_metric_folders(
     filter_wildcards: Tuple[str, ...],
     table_verbosity: TableVerbosity,
     path_a: str,
     path_b: str,
     significant_figures: int,
+    csv_out: Optional[TextIO] = None,
 ) -> Tuple[str, str]:  # (summary, table)
     a: Set[Tuple[str, str, str]] = set()
     b: Set[Tuple[str, str, str]] = set()
@@ -191,41 +224,38 @@ def _compare_metric_folders(
 
     filter = Filter(final_filters)
     critical_change_report = ""
-    tables = ""
+    tables: List[str] = []
     total_critical = 0
-    for pdk, scl, design in sorted(common):
-        metrics_a = json.load(
-            open(
+    designs = sorted(common)
+    with ProcessPoolExecutor(max_workers=_get_process_limit()) as ppe:
+        futures = [
+            ppe.submit(
+                _compare_metric_files,
                 os.path.join(path_a, f"{pdk}-{scl}-{design}.metrics.json"),
-                encoding="utf8",
-            ),
-            parse_float=Decimal,
-        )
-
-        metrics_b = json.load(
-            open(
                 os.path.join(path_b, f"{pdk}-{scl}-{design}.metrics.json"),
-                encoding="utf8",
-            ),
-            parse_float=Decimal,
-        )
-
-        diff = MetricDiff.from_metrics(
-            metrics_a,
-            metrics_b,
-            significant_figures,
-            filter=filter,
-        )
+                significant_figures,
+                filter,
+                table_verbosity,
+            )
+            for pdk, scl, design in designs
+        ]
+        results = [future.result() for future in futures]
 
-        stats = diff.stats()
+    csv_writer = None
+    if csv_out is not None:
+        csv_writer = csv.writer(csv_out)
+        csv_writer.writerow(["pdk", "scl", "design"] + MetricDiff.csv_header)
 
+    for (pdk, scl, design), (stats, rendered, rows) in zip(designs, results):
         total_critical += stats.critical
         if stats.critical > 0:
             critical_change_report += f"  * `{pdk}/{scl}/{design}` \n"
-        if table_verbosity != "NONE":
-            rendered = diff.render_md(("corner", ""), table_verbosity)
-            if rendered.strip() != "":
-                tables += f"<details><summary><code>{pdk}/{scl}/{design}</code></summary>\n{rendered}\n</details>\n\n"
+        if rendered.strip() != "":
+            tables.append(
+                f"<details><summary><code>{pdk}/{scl}/{design}</code></summary>\n{rendered}\n</details>\n\n"
+            )
+        if csv_writer is not None:
+            csv_writer.writerows([pdk, scl, design] + row for row in rows)
 
     if total_critical == 0:
         critical_change_report = (
@@ -242,7 +272,7 @@ def _compare_metric_folders(
     report += difference_report
     report += critical_change_report
 
-    return report, tables.strip()
+    return report, "".join(tables).strip()
 
 
 @cloup.command(no_args_is_help=True)
@@ -253,6 +283,7 @@ def compare_multiple(
     table_verbosity: TableVerbosity,
     metric_folders: Tuple[str, str],
     table_out: Optional[str],
+    csv_out: Optional[str],
     significant_figures: int,
 ):
     """
@@ -263,9 +294,20 @@ def compare_multiple(
     All other files are ignored.
     """
     path_a, path_b = metric_folders
-    summary, tables = _compare_metric_folders(
-        filter_wildcards, table_verbosity, path_a, path_b, significant_figures
-    )
+    with ExitStack() as stack:
+        csv_file = None
+        if csv_out is not None:
+            csv_file = stack.enter_context(
+                open(csv_out, "w", encoding="utf8", newline="")
+            )
+        summary, tables = _compare_metric_folders(
+            filter_wildcards,
+            table_verbosity,
+            path_a,
+            path_b,
+            significant_figures,
+            csv_file,
+        )
     print(summary)
     table_file = sys.stdout
     if table_out is not None:
@@ -318,6 +360,7 @@ def compare_remote(
     token: str,
     metric_folder: str,
     table_out: Optional[str],
+    csv_out: Optional[str],
     significant_figures: int,
     branch: str,
 ):
@@ -377,13 +420,20 @@ def compare_remote(
                         with open(final_path, "wb") as f:
                             f.write(io.read())
 
-            summary, tables = _compare_metric_folders(
-                filter_wildcards,
-                table_verbosity,
-                d,
-                metric_folder,
-                significant_figures,
-            )
+            with ExitStack() as stack:
+                csv_file = None
+                if csv_out is not None:
+                    csv_file = stack.enter_context(
+                        open(csv_out, "w", encoding="utf8", newline="")
+                    )
+                summary, tables = _compare_metric_folders(
+                    filter_wildcards,
+                    table_verbosity,
+                    d,
+                    metric_folder,
+                    significant_figures,
+                    csv_file,
+                )
             print(summary)
             table_file = sys.stdout
             if table_out is not None:
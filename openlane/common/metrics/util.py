@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
+import sys
+import csv
 import textwrap
 from enum import IntEnum
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import (
+    ClassVar,
     List,
     Mapping,
     Tuple,
@@ -23,6 +27,7 @@ from typing import (
     Any,
     Iterable,
     Optional,
+    TextIO,
     Union,
 )
 
@@ -45,21 +50,90 @@ class TableVerbosity(IntEnum):
     ALL = 4
 
 
+ParsedModifiers = Tuple[Tuple[str, str], ...]
+
+
+@lru_cache(maxsize=65536)
+def _parse_metric_name(metric_name: str) -> Tuple[str, ParsedModifiers]:
+    mn_mut = metric_name.split("__")
+    modifiers = {}
+    while ":" in mn_mut[-1]:
+        key, value = mn_mut.pop().split(":", maxsplit=1)
+        modifiers[sys.intern(key)] = value
+    return sys.intern("__".join(mn_mut)), tuple(
+        (k, modifiers[k]) for k in reversed(modifiers)
+    )
+
+
+@lru_cache(maxsize=65536)
+def _get_aggregate_names(metric_name: str) -> Tuple[str, ...]:
+    # The names of the aggregates a metric contributes to: its base name
+    # followed by each of its modifiers except the last
+    base, modifiers = _parse_metric_name(metric_name)
+    names = [base]
+    for key, value in modifiers[:-1]:
+        names.append(f"{names[-1]}__{key}:{value}")
+    return tuple(names)
+
+
 def parse_metric_modifiers(metric_name: str) -> Tuple[str, Mapping[str, str]]:
     """
     Parses a metric name into a base and modifiers as specified in
     the METRICS2.1 naming convention.
 
+    Parsed names are cached, so repeatedly parsing the same names is cheap.
+
     :param metric_name: The name of the metric as generated by a utility.
     :returns: A tuple of the base part as a string, then the modifiers as
         a key-value mapping.
     """
-    mn_mut = metric_name.split("__")
-    modifiers = {}
-    while ":" in mn_mut[-1]:
-        key, value = mn_mut.pop().split(":", maxsplit=1)
-        modifiers[key] = value
-    return "__".join(mn_mut), {k: modifiers[k] for k in reversed(modifiers)}
+    base, modifiers = _parse_metric_name(metric_name)
+    return base, dict(modifiers)
+
+
+class MetricIndex(object):
+    """
+    An index of a set of metric names by their base names as specified in the
+    METRICS2.1 naming convention, so metrics can be looked up by base name and
+    modifiers without parsing or scanning every name again.
+
+    :param names: The names of the metrics to index.
+    """
+
+    by_base: Dict[str, List[Tuple[str, ParsedModifiers]]]
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.by_base = {}
+        for name in names:
+            base, modifiers = _parse_metric_name(name)
+            entries = self.by_base.get(base)
+            if entries is None:
+                entries = self.by_base[base] = []
+            entries.append((name, modifiers))
+
+    def get(self, base: str) -> List[Tuple[str, Mapping[str, str]]]:
+        """
+        :param base: The base name of the metrics.
+        :returns: A list of tuples of the full names and modifiers of all
+            metrics with this base name.
+        """
+        return [
+            (name, dict(modifiers)) for name, modifiers in self.by_base.get(base, [])
+        ]
+
+    def get_modifier_values(self, base: str, modifier: str) -> Dict[str, str]:
+        """
+        :param base: The base name of the metrics.
+        :param modifier: The key of the modifier, e.g. ``corner``.
+        :returns: A mapping from each value of the modifier to the name of
+            the metric with this base name and no modifiers other than this one,
+            i.e., ``{base}__{modifier}:{value}``.
+        """
+        result = {}
+        for name, modifiers in self.by_base.get(base, []):
+            if len(modifiers) == 1 and modifiers[0][0] == modifier:
+                result[modifiers[0][1]] = name
+        return result
 
 
 def aggregate_metrics(
@@ -82,14 +156,8 @@ def aggregate_metrics(
     if aggregator_by_metric is None:
         aggregator_by_metric = Metric.by_name
 
-    aggregated: Dict[str, Any] = {}
-    for name, value in input.items():
-        metric_name, modifiers = parse_metric_modifiers(name)
-        if len(modifiers) < 1:
-            # No modifiers = final aggregate, don't double-represent in sums
-            continue
-
-        modifier_names = list(modifiers.keys())
+    values_by_aggregate: Dict[str, Tuple[MetricAggregator, List[Any]]] = {}
+    for metric_name, entries in MetricIndex(input.keys()).by_base.items():
         dont_aggregate: Iterable[str] = []
         entry = aggregator_by_metric.get(metric_name)
         if isinstance(entry, Metric):
@@ -99,18 +167,25 @@ def aggregate_metrics(
         if entry is None:
             continue
 
-        if len(set(modifier_names).intersection(set(dont_aggregate))):
-            continue
+        dont_aggregate = set(dont_aggregate)
+        for name, modifiers in entries:
+            if len(modifiers) < 1:
+                # No modifiers = final aggregate, don't double-represent in sums
+                continue
 
-        metric_name_so_far = metric_name
-        for modifier in modifier_names:
-            start, aggregation_fn = entry
-            current = aggregated.get(metric_name_so_far) or start
-            aggregated[metric_name_so_far] = aggregation_fn([current, value])
-            metric_name_so_far += f"__{modifier}:{modifiers[modifier]}"
+            if any(key in dont_aggregate for key, _ in modifiers):
+                continue
+
+            value = input[name]
+            for aggregate_name in _get_aggregate_names(name):
+                if aggregate := values_by_aggregate.get(aggregate_name):
+                    aggregate[1].append(value)
+                else:
+                    values_by_aggregate[aggregate_name] = (entry, [value])
 
     final_values = dict(input)
-    final_values.update(aggregated)
+    for name, ((start, aggregation_fn), values) in values_by_aggregate.items():
+        final_values[name] = aggregation_fn([start, *values])
     return final_values
 
 
@@ -206,12 +281,14 @@ class MetricDiff(object):
             listed_differences += remaining
 
         if len(listed_differences) > 0:
-            table = textwrap.dedent(
-                f"""
-                | {'Metric':<70} | {'Before':<10} | {'After':<10} | {'Delta':<20} |
-                | {'-':<70} | {'-':<10} | {'-':<10} | {'-':<20} |
-                """
-            )
+            lines = [
+                textwrap.dedent(
+                    f"""
+                    | {'Metric':<70} | {'Before':<10} | {'After':<10} | {'Delta':<20} |
+                    | {'-':<70} | {'-':<10} | {'-':<10} | {'-':<20} |
+                    """
+                )
+            ]
 
             for row in listed_differences:
                 before, after, delta = row.format_values()
@@ -223,10 +300,64 @@ class MetricDiff(object):
                         emoji = " ❗"
                 if row.critical and row.is_changed():
                     emoji = " ‼️"
-                table += f"| {row.metric_name:<70} | {before:<10} | {after:<10} | {f'{delta}{emoji}':<20} |\n"
+                lines.append(
+                    f"| {row.metric_name:<70} | {before:<10} | {after:<10} | {f'{delta}{emoji}':<20} |\n"
+                )
+            table = "".join(lines)
 
         return table
 
+    csv_header: ClassVar[List[str]] = [
+        "metric",
+        "corner",
+        "before",
+        "after",
+        "delta",
+        "delta_pct",
+        "better",
+        "critical",
+    ]
+
+    def get_rows(self) -> List[List[str]]:
+        """
+        :returns: The differences as rows of strings with the columns listed in
+            :attr:`csv_header`, where the ``corner`` modifier, if any, is
+            split off of the metric name into its own column.
+        """
+        rows = []
+        for row in self.differences:
+            base, modifiers = _parse_metric_name(row.metric_name)
+            corner = ""
+            metric_name = base
+            for key, value in modifiers:
+                if key == "corner":
+                    corner = value
+                else:
+                    metric_name += f"__{key}:{value}"
+            rows.append(
+                [
+                    metric_name,
+                    corner,
+                    str(row.gold),
+                    str(row.new),
+                    "" if row.delta is None else str(row.delta),
+                    "" if row.delta_pct is None else str(row.delta_pct),
+                    "" if row.better is None else str(row.better),
+                    str(row.critical),
+                ]
+            )
+        return rows
+
+    def render_csv(self, out: TextIO):
+        """
+        Writes the differences to a file in CSV format, one row per metric.
+
+        :param out: The file to write the CSV to.
+        """
+        writer = csv.writer(out)
+        writer.writerow(self.csv_header)
+        writer.writerows(self.get_rows())
+
     def stats(self) -> MetricStatistics:
         """
         :returns: A :class:`MetricStatistics` object based on this aggregate.
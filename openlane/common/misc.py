@@ -19,12 +19,15 @@ import typing
 import fnmatch
 import pathlib
 import unicodedata
-from math import inf
+from math import inf, ceil
+from decimal import Decimal
 from typing import (
     Any,
     Generator,
     Iterable,
     List,
+    NamedTuple,
+    Tuple,
     TypeVar,
     Optional,
     SupportsFloat,
@@ -247,6 +250,75 @@ def format_elapsed_time(elapsed_seconds: SupportsFloat) -> str:
     return f"{hours:02}:{minutes:02}:{seconds:02}.{milliseconds:03}"
 
 
+Rectangle = Tuple[Decimal, Decimal, Decimal, Decimal]
+
+
+class Tile(NamedTuple):
+    """
+    A tile of a larger rectangular area, as generated by :func:`get_tiles`.
+
+    :param core: The region the tile is responsible for. Tiles on the edges of
+        the area extend infinitely outwards, so the cores of all tiles cover
+        the plane without overlapping.
+    :param window: The region that should be processed for this tile, i.e., the
+        bounded core plus the overlap on each side.
+    """
+
+    core: Rectangle
+    window: Rectangle
+
+    def owns(self, rectangle: Rectangle) -> bool:
+        """
+        :param rectangle: A rectangle, e.g. a bounding box of a DRC violation.
+        :returns: Whether the center of the rectangle lies in the tile's core,
+            which is closed on the lower edges and open on the upper edges.
+        """
+        lx, ly, ux, uy = rectangle
+        x, y = (lx + ux) / 2, (ly + uy) / 2
+        c_lx, c_ly, c_ux, c_uy = self.core
+        return c_lx <= x < c_ux and c_ly <= y < c_uy
+
+
+def get_tiles(area: Rectangle, tile_size: Decimal, overlap: Decimal) -> List[Tile]:
+    """
+    Splits a rectangular area into a grid of square tiles, the last row and
+    column of which may be smaller.
+
+    :param area: The area as ``(lx, ly, ux, uy)``.
+    :param tile_size: The side of each tile.
+    :param overlap: How far the window of each tile extends beyond its core.
+    :returns: The tiles, row by row, from the bottom left.
+    """
+    lx, ly, ux, uy = area
+    columns = max(1, ceil((ux - lx) / tile_size))
+    rows = max(1, ceil((uy - ly) / tile_size))
+    infinity = Decimal("Infinity")
+    tiles = []
+    for row in range(rows):
+        t_ly = ly + row * tile_size
+        t_uy = min(t_ly + tile_size, uy)
+        for column in range(columns):
+            t_lx = lx + column * tile_size
+            t_ux = min(t_lx + tile_size, ux)
+            tiles.append(
+                Tile(
+                    core=(
+                        -infinity if column == 0 else t_lx,
+                        -infinity if row == 0 else t_ly,
+                        infinity if column == columns - 1 else t_ux,
+                        infinity if row == rows - 1 else t_uy,
+                    ),
+                    window=(
+                        t_lx - overlap,
+                        t_ly - overlap,
+                        t_ux + overlap,
+                        t_uy + overlap,
+                    ),
+                )
+            )
+    return tiles
+
+
 class Filter(object):
     """
     Encapsulates commonly used wildcard-based filtering functions into an object.
@@ -0,0 +1,129 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import os
+import json
+import threading
+from dataclasses import asdict, dataclass
+from typing import ClassVar, Dict, List, Literal, Optional
+
+StepStatus = Literal["running", "success", "failed"]
+
+
+@dataclass
+class RunManifestEntry:
+    """
+    A record of a step in a :class:`RunManifest`.
+
+    :param ordinal: The ordinal of the step, i.e. the numeric prefix of its
+        directory.
+    :param dir: The directory of the step, relative to the run directory.
+    :param status: The status of the step at the time of recording.
+    :param id: The implementation ID of the step, if known.
+    :param runtime: The runtime of the step in seconds, if it has concluded.
+    """
+
+    ordinal: int
+    dir: str
+    status: StepStatus
+    id: Optional[str] = None
+    runtime: Optional[float] = None
+
+    @property
+    def state_in(self) -> str:
+        """
+        The path of the step's input state, relative to the run directory.
+        """
+        return os.path.join(self.dir, "state_in.json")
+
+    @property
+    def state_out(self) -> Optional[str]:
+        """
+        The path of the step's output state relative to the run directory, if
+        the step has concluded successfully.
+        """
+        if self.status != "success":
+            return None
+        return os.path.join(self.dir, "state_out.json")
+
+
+class RunManifest(object):
+    """
+    An append-only index of the steps of a run, stored as JSON lines in
+    ``run.jsonl`` at the root of the run directory.
+
+    A flow records each of its steps when it starts and again when it
+    concludes, so the steps of a run and their states can be found without
+    listing or globbing the run directory. The last record for a step
+    directory supersedes earlier ones.
+
+    :param run_dir: The run directory.
+    """
+
+    filename: ClassVar[str] = "run.jsonl"
+
+    def __init__(self, run_dir: str):
+        self.run_dir = os.path.abspath(run_dir)
+        self.path = os.path.join(self.run_dir, self.filename)
+        self.__lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """
+        :returns: Whether the manifest has been created. Runs created by older
+            versions of OpenLane do not have one.
+        """
+        return os.path.isfile(self.path)
+
+    def record(self, entry: RunManifestEntry):
+        """
+        Appends a record to the manifest.
+
+        :param entry: The record to append.
+        """
+        line = json.dumps(asdict(entry)) + "\n"
+        with self.__lock, open(self.path, "a", encoding="utf8") as f:
+            f.write(line)
+
+    def get_entries(self) -> List[RunManifestEntry]:
+        """
+        :returns: The latest record of each step directory, sorted by ordinal.
+            Truncated records, e.g. from an interrupted write, are ignored.
+        """
+        entries: Dict[str, RunManifestEntry] = {}
+        try:
+            f = open(self.path, encoding="utf8")
+        except FileNotFoundError:
+            return []
+        with f:
+            for line in f:
+                try:
+                    entry = RunManifestEntry(**json.loads(line))
+                except (json.JSONDecodeError, TypeError):
+                    continue
+                entries[entry.dir] = entry
+        return sorted(entries.values(), key=lambda entry: entry.ordinal)
+
+    def get_latest_state(self) -> Optional[str]:
+        """
+        :returns: The absolute path to the latest state of the run: the output
+            state of the top-level step with the highest ordinal that concluded
+            successfully, if any.
+        """
+        for entry in reversed(self.get_entries()):
+            if os.sep in entry.dir:
+                continue
+            if state_out := entry.state_out:
+                return os.path.join(self.run_dir, state_out)
+        return None
@@ -0,0 +1,219 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import os
+import json
+import uuid
+import threading
+from collections import deque
+from dataclasses import dataclass
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional
+
+from .misc import _get_process_limit
+
+
+def _get_physical_memory() -> int:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        import psutil
+
+        return psutil.virtual_memory().total
+
+
+@dataclass
+class Reservation:
+    """
+    Resources granted by a :class:`ResourceScheduler`.
+
+    :param cpus: The number of CPU slots granted
+    :param memory: The amount of memory granted in bytes
+    """
+
+    cpus: int
+    memory: int
+
+
+class ResourceScheduler(object):
+    """
+    Hands out CPU slots and memory to the subprocesses of all running
+    :class:`openlane.steps.Step`\\s, so steps running concurrently share the
+    machine instead of each assuming it owns all of it.
+
+    Requests are granted in the order they are made. A request is granted once
+    enough CPU slots and memory are free, or immediately if nothing else is
+    running, so requests larger than the machine still eventually run (alone).
+
+    The memory a subprocess needs is estimated from the peak resident memory
+    recorded for the same key in previous runs, if any.
+
+    :param cpus: The number of CPU slots available. If unset, this will be
+        equal to your machine's thread count.
+    :param memory: The amount of memory available in bytes. If unset, this will
+        be equal to your machine's physical memory.
+    :param history_path: An optional JSON file to load and store peak memory
+        records in. See :meth:`load_history`.
+    """
+
+    def __init__(
+        self,
+        cpus: Optional[int] = None,
+        memory: Optional[int] = None,
+        history_path: Optional[str] = None,
+    ):
+        self.cpus = max(1, cpus or _get_process_limit())
+        self.memory = memory or _get_physical_memory()
+        self.history_path: Optional[str] = None
+        self.__history: Dict[str, int] = {}
+        self.__free_cpus = self.cpus
+        self.__free_memory = self.memory
+        self.__running = 0
+        self.__queue: Deque[object] = deque()
+        self.__condition = threading.Condition()
+        if history_path is not None:
+            self.load_history(history_path)
+
+    def load_history(self, path: str):
+        """
+        Loads peak memory records from a JSON file, if it exists, and stores
+        all future records in it.
+
+        :param path: The path to the JSON file
+        """
+        try:
+            with open(path, encoding="utf8") as f:
+                history = json.load(f)
+        except (OSError, ValueError):
+            history = {}
+        with self.__condition:
+            self.history_path = path
+            for key, value in history.items():
+                if isinstance(value, int):
+                    self.__history[key] = value
+
+    def get_peak_memory(self, key: str) -> Optional[int]:
+        """
+        :param key: A key identifying a kind of subprocess, e.g. a step's
+            implementation ID and the name of the log file
+        :returns: The last recorded peak memory usage of this kind of
+            subprocess in bytes, if any.
+        """
+        with self.__condition:
+            return self.__history.get(key)
+
+    def record_peak_memory(self, key: str, memory: int):
+        """
+        Records the peak memory usage of a subprocess. The record is saved to
+        :attr:`history_path` if set.
+
+        :param key: See :meth:`get_peak_memory`
+        :param memory: The peak memory usage of the subprocess in bytes
+        """
+        with self.__condition:
+            self.__history[key] = int(memory)
+            history_path = self.history_path
+            history = self.__history.copy()
+        if history_path is None:
+            return
+        staging_path = f"{history_path}.{uuid.uuid4().hex}"
+        try:
+            with open(staging_path, "w", encoding="utf8") as f:
+                json.dump(history, f, sort_keys=True)
+            os.replace(staging_path, history_path)
+        except OSError:
+            if os.path.exists(staging_path):
+                os.unlink(staging_path)
+
+    @contextmanager
+    def reserve(
+        self,
+        cpus: int = 1,
+        memory: Optional[int] = None,
+    ) -> Iterator[Reservation]:
+        """
+        Blocks until the requested resources are available, then holds them
+        until the context is exited.
+
+        Reservations must not be nested, i.e., resources must be released
+        before more are requested by the same thread, or the scheduler may
+        deadlock.
+
+        :param cpus: The number of CPU slots to reserve. Clamped to the total
+            number of CPU slots.
+        :param memory: The amount of memory to reserve in bytes. Clamped to
+            the total amount of memory.
+        :returns: The resources actually reserved.
+        """
+        reservation = Reservation(
+            cpus=min(max(1, cpus), self.cpus),
+            memory=min(max(0, memory or 0), self.memory),
+        )
+        ticket = object()
+        with self.__condition:
+            self.__queue.append(ticket)
+            try:
+                self.__condition.wait_for(
+                    lambda: self.__queue[0] is ticket
+                    and (
+                        self.__running == 0
+                        or (
+                            reservation.cpus <= self.__free_cpus
+                            and reservation.memory <= self.__free_memory
+                        )
+                    )
+                )
+            finally:
+                self.__queue.remove(ticket)
+                self.__condition.notify_all()
+            self.__free_cpus -= reservation.cpus
+            self.__free_memory -= reservation.memory
+            self.__running += 1
+        try:
+            yield reservation
+        finally:
+            with self.__condition:
+                self.__free_cpus += reservation.cpus
+                self.__free_memory += reservation.memory
+                self.__running -= 1
+                self.__condition.notify_all()
+
+
+_SCHEDULER: Optional[ResourceScheduler] = None
+_SCHEDULER_LOCK = threading.Lock()
+
+
+def set_scheduler(scheduler: ResourceScheduler):
+    """
+    Allows replacing OpenLane's global :class:`ResourceScheduler` with a
+    customized one.
+
+    :param scheduler: The replacement scheduler
+    """
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        _SCHEDULER = scheduler
+
+
+def get_scheduler() -> ResourceScheduler:
+    """
+    :returns: OpenLane's global :class:`ResourceScheduler`, which is created
+        with the default parameters on first use.
+    """
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        if _SCHEDULER is None:
+            _SCHEDULER = ResourceScheduler()
+        return _SCHEDULER
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
-import tkinter
 from typing import Dict, Mapping, Any, Iterable
 
 _env_rx = re.compile(r"(?:\:\:)?env\((\w+)\)")
@@ -55,6 +54,10 @@ class TclUtils(object):
 
     @staticmethod
     def _eval_env(env_in: Mapping[str, Any], tcl_in: str) -> Dict[str, Any]:
+        # Imported lazily, as PDK configurations are usually loaded from the
+        # artifact cache and Tk may not be installed
+        import tkinter
+
         interpreter = tkinter.Tcl()
 
         interpreter.eval("array unset ::env")
@@ -17,9 +17,9 @@ import uuid
 import shutil
 import tempfile
 import subprocess
-from enum import IntEnum
 from decimal import Decimal
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
@@ -35,11 +35,12 @@ from typing import (
     Union,
 )
 
-import libparse
 from deprecated.sphinx import deprecated
 
 
-from .misc import mkdirp, gzopen
+from .misc import mkdirp, _get_process_limit
+from .liberty import LibertyIndex, remove_liberty_cells
+from .artifact_cache import get_artifact_cache
 from .types import Path
 from .metrics import aggregate_metrics
 from .generic_dict import GenericImmutableDict, is_string
@@ -53,7 +54,8 @@ class Toolbox(object):
     An assisting object shared by a Flow and all its constituent Steps.
 
     The toolbox may create artifacts that are cached to avoid constant re-creation
-    between steps.
+    between steps. Some are also stored in the global
+    :class:`openlane.common.ArtifactCache`, if enabled, and reused across runs.
     """
 
     def __init__(self, tmp_dir: str) -> None:
@@ -63,6 +65,7 @@ class Toolbox(object):
 
         self.remove_cells_from_lib = lru_cache(16, True)(self.remove_cells_from_lib)  # type: ignore
         self.create_blackbox_model = lru_cache(16, True)(self.create_blackbox_model)  # type: ignore
+        self.get_lib_index = lru_cache(64, True)(self.get_lib_index)  # type: ignore
 
     @deprecated(
         version="2.0.0b1",
@@ -368,7 +371,8 @@ class Toolbox(object):
         Creates a new lib file with some cells removed.
 
         This function is memoized, i.e., results are cached for a specific set
-        of inputs.
+        of inputs. The filtered files are also stored in the global
+        :class:`openlane.common.ArtifactCache`, if enabled.
 
         :param input_lib_files: A `frozenset` of input lib files.
         :param excluded_cells: A `frozenset` of wildcards of cells to remove
@@ -377,56 +381,51 @@ class Toolbox(object):
         """
         mkdirp(self.tmp_dir)
 
-        class State(IntEnum):
-            initial = 0
-            cell = 10
-            excluded_cell = 11
-
-        cell_start_rx = re.compile(r"(\s*)cell\s*\(\"?(.*?)\"?\)\s*\{")
-        out_paths = []
-
         excluded_cells_filter = Filter(excluded_cells)
 
-        for file in input_lib_files:
-            input_lib_stream = gzopen(file)
+        def filter_lib(file: str) -> str:
             # can't be gzip -- abc cannot read gzipped lib files
             out_path = os.path.join(self.tmp_dir, f"{uuid.uuid4().hex}.lib")
+            self.__create_artifact(
+                "remove_cells_from_lib",
+                [file],
+                sorted(excluded_cells),
+                out_path,
+                lambda path: self.__remove_cells(file, excluded_cells_filter, path),
+            )
+            return out_path
 
-            state = State.initial
-            brace_count = 0
-            output_file_handle = open(out_path, "w")
-            write = lambda x: print(x, file=output_file_handle, end="")
-            for line in input_lib_stream:
-                if state == State.initial:
-                    cell_m = cell_start_rx.search(line)
-                    if cell_m is not None:
-                        whitespace = cell_m[1]
-                        cell_name = cell_m[2]
-                        if excluded_cells_filter.match(cell_name):
-                            state = State.excluded_cell
-                            write(f"{whitespace}/* removed {cell_name} */\n")
-                        else:
-                            state = State.cell
-                            write(line)
-                        brace_count = 1
-                    else:
-                        write(line)
-                elif state in [State.cell, State.excluded_cell]:
-                    if "{" in line:
-                        brace_count += 1
-                    if "}" in line:
-                        brace_count -= 1
-                    if state == State.cell:
-                        write(line)
-                    if brace_count == 0:
-                        state = State.initial
-
-            output_file_handle.close()
-
-            out_paths.append(out_path)
+        # Different corners' lib files are independent and the filtering is
+        # mostly bulk I/O, so they are processed concurrently
+        with ThreadPoolExecutor(max_workers=_get_process_limit()) as tpe:
+            out_paths = list(tpe.map(filter_lib, input_lib_files))
 
         return out_paths
 
+    def __create_artifact(
+        self,
+        kind: str,
+        inputs: Sequence[str],
+        parameters: Any,
+        out_path: str,
+        create: Callable[[str], bool],
+    ):
+        cache = get_artifact_cache()
+        if cache is None:
+            create(out_path)
+            return
+        cache.fetch(cache.get_key(kind, inputs, parameters), out_path, create)
+
+    def __remove_cells(
+        self,
+        input_lib_file: str,
+        excluded_cells_filter: Filter,
+        out_path: str,
+    ) -> bool:
+        removed = remove_liberty_cells(input_lib_file, excluded_cells_filter, out_path)
+        debug(f"Removed {len(removed)} cell(s) from '{input_lib_file}'.")
+        return True
+
     def create_blackbox_model(
         self,
         input_models: Union[frozenset, Tuple[str, ...]],
@@ -434,9 +433,34 @@ class Toolbox(object):
     ) -> str:
         mkdirp(self.tmp_dir)
         out_path = os.path.join(self.tmp_dir, f"{uuid.uuid4().hex}.bb.v")
+        if isinstance(input_models, frozenset):
+            input_models = tuple(sorted(input_models))
+        yosys = shutil.which("yosys") or shutil.which("yowasp-yosys")
+        self.__create_artifact(
+            "create_blackbox_model",
+            input_models,
+            {
+                "defines": sorted(defines),
+                "yosys": yosys and os.path.realpath(yosys),
+            },
+            out_path,
+            lambda path: self.__create_blackbox_model(
+                input_models, defines, yosys, path
+            ),
+        )
+        return out_path
+
+    def __create_blackbox_model(
+        self,
+        input_models: Tuple[str, ...],
+        defines: FrozenSet[str],
+        yosys: Optional[str],
+        out_path: str,
+    ) -> bool:
         debug(f"Creating cell models for {input_models} at '{out_path}'…")
         bad_yosys_line = re.compile(r"^\s+(\w+|(\\\S+?))\s*\(.*\).*;")
 
+        success = True
         stack: List[Literal["specify", "primitive"]] = []
         with open(out_path, "w", encoding="utf8") as out:
             for model in input_models:
@@ -467,14 +491,13 @@ class Toolbox(object):
                     print("", file=out)
                 except ValueError as e:
                     err(f"Failed to pre-process input models for linting: {e}")
-
-        yosys = shutil.which("yosys") or shutil.which("yowasp-yosys")
+                    success = False
 
         if yosys is None:
             warn(
                 "yosys and yowasp-yosys not found in PATH. This may trigger issues with blackboxing."
             )
-            return out_path
+            return False
 
         commands = ""
         for define in list(defines):
@@ -502,8 +525,44 @@ class Toolbox(object):
             err(f"Failed to pre-process input models for linting with Yosys: {e}")
             err(open(output_log_path, "r", encoding="utf8").read())
             err("Will attempt to load models into linter as-is.")
+            return False
 
-        return out_path
+        return success
+
+    def get_lib_index(self, input_lib: str) -> LibertyIndex:
+        """
+        Returns compact metadata about a liberty file, such as its cells and
+        operating conditions, without parsing the entire file.
+
+        This function is memoized, i.e., results are cached for a specific set
+        of inputs. The index is also stored in the global
+        :class:`openlane.common.ArtifactCache`, if enabled, so each liberty file
+        is only scanned once across runs.
+
+        :param input_lib: The lib file in question, optionally gzipped.
+        :returns: The index of the lib file
+        """
+        cache = get_artifact_cache()
+        if cache is None:
+            return LibertyIndex.from_file(input_lib)
+
+        mkdirp(self.tmp_dir)
+        out_path = os.path.join(self.tmp_dir, f"{uuid.uuid4().hex}.lib.json")
+
+        def create(path: str) -> bool:
+            LibertyIndex.from_file(input_lib).save(path)
+            return True
+
+        key = cache.get_key("lib_index", [input_lib], LibertyIndex.format_version)
+        cache.fetch(key, out_path, create)
+        try:
+            index = LibertyIndex.load(out_path)
+        finally:
+            os.unlink(out_path)
+        if index is None:
+            # Stale entry from a different format version
+            index = LibertyIndex.from_file(input_lib)
+        return index
 
     def get_lib_voltage(
         self,
@@ -519,31 +578,17 @@ class Toolbox(object):
         :param input_lib: The lib file in question
         :returns: The voltage in question
         """
-        parser = libparse.LibertyParser(open(input_lib, encoding="utf8"))
-        ast = parser.ast
-
-        default_operating_conditions_id = None
-        operating_conditions_raw = {}
-        for child in ast.children:
-            if child.id == "default_operating_conditions":
-                default_operating_conditions_id = child.value
-            if child.id == "operating_conditions":
-                operating_conditions_raw[child.args[0]] = child
-
-        if default_operating_conditions_id is None:
-            if len(operating_conditions_raw) > 1:
+        index = self.get_lib_index(input_lib)
+
+        if index.default_operating_conditions is None:
+            if len(index.operating_conditions) > 1:
                 warn(
                     f"No default operating condition defined in lib file '{input_lib}', and the lib file has multiple operating conditions."
                 )
                 return None
 
-            elif len(operating_conditions_raw) < 1:
+            elif len(index.operating_conditions) < 1:
                 warn(f"Lib file '{input_lib}' has no operating conditions set.")
                 return None
-            default_operating_conditions_id = list(operating_conditions_raw.keys())[0]
 
-        operating_conditions = operating_conditions_raw[default_operating_conditions_id]
-        operating_condition_dict = {}
-        for child in operating_conditions.children:
-            operating_condition_dict[child.id] = child.value
-        return Decimal(operating_condition_dict["voltage"])
+        return index.get_voltage()
@@ -69,6 +69,8 @@ def cli():
     run_options=False,
     sequential_flow_controls=False,
     jobs=False,
+    step_cache=False,
+    odb_server=False,
     accept_config_files=False,
 )
 @click.argument(
@@ -14,6 +14,7 @@
 import os
 import json
 import yaml
+import tempfile
 from yamlcore import CCoreLoader
 import dataclasses
 from glob import glob
@@ -48,6 +49,7 @@ from ..common import (
     TclUtils,
     AnyPath,
     is_string,
+    get_artifact_cache,
 )
 
 AnyConfig = Union[AnyPath, Mapping[str, Any]]
@@ -794,6 +796,30 @@ class Config(GenericImmutableDict[str, Any]):
 
         return os.path.abspath(pdk_root)
 
+    @staticmethod
+    def __eval_tcl_config(
+        env_in: Mapping[str, Any],
+        tcl_path: str,
+    ) -> Dict[str, Any]:
+        # The evaluated environments are stored in the global artifact cache,
+        # keyed on the Tcl file and the input environment, so Tcl is only
+        # needed the first time a PDK/SCL combination is loaded.
+        tcl_in = open(tcl_path, encoding="utf8").read()
+        cache = get_artifact_cache()
+        if cache is None:
+            return TclUtils._eval_env(env_in, tcl_in)
+
+        def create(path: str) -> bool:
+            env_out = TclUtils._eval_env(env_in, tcl_in)
+            with open(path, "w", encoding="utf8") as f:
+                json.dump(env_out, f)
+            return True
+
+        key = cache.get_key("tcl_config", [tcl_path], {"env": dict(env_in)})
+        with tempfile.TemporaryDirectory(prefix="openlane_tcl_config_") as d:
+            env_path = cache.fetch(key, os.path.join(d, "env.json"), create)
+            return json.load(open(env_path, encoding="utf8"))
+
     @staticmethod
     @lru_cache(1, True)
     def __get_pdk_raw(
@@ -821,10 +847,7 @@ class Config(GenericImmutableDict[str, Any]):
 
         pdk_config_path = os.path.join(pdkpath, "libs.tech", "openlane", "config.tcl")
 
-        pdk_env = TclUtils._eval_env(
-            pdk_config,
-            open(pdk_config_path, encoding="utf8").read(),
-        )
+        pdk_env = Config.__eval_tcl_config(pdk_config, pdk_config_path)
 
         scl = pdk_env["STD_CELL_LIBRARY"]
         assert (
@@ -835,12 +858,7 @@ class Config(GenericImmutableDict[str, Any]):
             pdkpath, "libs.tech", "openlane", scl, "config.tcl"
         )
 
-        scl_env = migrate_old_config(
-            TclUtils._eval_env(
-                pdk_env,
-                open(scl_config_path, encoding="utf8").read(),
-            )
-        )
+        scl_env = migrate_old_config(Config.__eval_tcl_config(pdk_env, scl_config_path))
 
         return GenericImmutableDict(scl_env), pdkpath, scl
 
@@ -485,6 +485,12 @@ option_variables = [
         deprecated_names=["BASE_SDC_FILE", "SDC_FILE"],
         default=Path(os.path.join(get_script_dir(), "base.sdc")),
     ),
+    Variable(
+        "SAVE_STATE_DELTAS",
+        bool,
+        "Saves the `state_in.json` and `state_out.json` files of each step as the changes against the state files of an earlier step of the same run, which saves space. Such files can only be read using `openlane.state`: `python3 -m openlane.state materialize <file>` prints the full state.",
+        default=False,
+    ),
 ]
 
 flow_common_variables = pdk_variables + scl_variables + option_variables
@@ -121,7 +121,7 @@ class Classic(SequentialFlow):
         Misc.ReportManufacturability,
     ]
 
-    config_vars = [
+    config_vars = SequentialFlow.config_vars + [
         Variable(
             "RUN_TAP_ENDCAP_INSERTION",
             bool,
@@ -34,7 +34,17 @@ from cloup.constraints import (
 from cloup.typing import Decorator
 
 from .flow import Flow
-from ..common import set_tpe, cli, get_opdks_rev, _get_process_limit
+from ..steps import OdbServer, StepCache, set_step_cache
+from ..common import (
+    ArtifactCache,
+    set_artifact_cache,
+    set_tpe,
+    set_scheduler,
+    cli,
+    get_opdks_rev,
+    ResourceScheduler,
+    _get_process_limit,
+)
 from ..logging import set_log_level, verbose, err, options, LogLevels
 from ..state import State, InvalidState
 
@@ -69,6 +79,37 @@ def set_worker_count_cb(
         return None
 
     set_tpe(ThreadPoolExecutor(max_workers=value))
+    set_scheduler(ResourceScheduler(cpus=value))
+
+
+def set_step_cache_cb(
+    ctx: Context,
+    param: Parameter,
+    value: Optional[str],
+):
+    if value is None:
+        return None
+
+    set_step_cache(StepCache(value))
+
+
+def set_artifact_cache_cb(
+    ctx: Context,
+    param: Parameter,
+    value: Optional[str],
+):
+    if value is None:
+        return None
+
+    set_artifact_cache(ArtifactCache(value))
+
+
+def set_odb_server_cb(
+    ctx: Context,
+    param: Parameter,
+    value: bool,
+):
+    OdbServer.set_enabled(value)
 
 
 def initial_state_cb(
@@ -80,17 +121,13 @@ def initial_state_cb(
         return None
 
     try:
-        initial_state_str = open(value, encoding="utf8").read()
-    except Exception as e:
-        err(f"Failed to read initial state: {e}")
-        ctx.exit(-1)
-    try:
-        initial_state = State.loads(initial_state_str, validate_path=True)
+        initial_state = State.load(value, validate_path=True)
     except InvalidState as e:
         err(e)
         ctx.exit(-1)
 
-    return initial_state
+    # Copied so the states of the run do not reference the file
+    return initial_state.copy()
 
 
 def only_cb(
@@ -134,6 +171,9 @@ def cloup_flow_opts(
     pdk_options: bool = True,
     log_level: bool = True,
     jobs: bool = True,
+    step_cache: bool = True,
+    artifact_cache: bool = True,
+    odb_server: bool = True,
     accept_config_files: bool = True,
     volare_by_default: bool = True,
     volare_pdk_override: Optional[str] = None,
@@ -176,6 +216,9 @@ def cloup_flow_opts(
     :param pdk_options: Enables PDK CLI flags
     :param log_level: Enables ``--log-level`` CLI flag
     :param jobs: Enables ``-j/--jobs`` CLI flag
+    :param step_cache: Enables ``--step-cache`` CLI flag
+    :param artifact_cache: Enables ``--artifact-cache`` CLI flag
+    :param odb_server: Enables ``--odb-server`` CLI flag
     :param accept_config_files: Accepts configuration file paths as CLI arguments
     :param volare_by_default: If ``pdk_options`` is ``True``, this changes whether
         Volare is used by default for this CLI or not.
@@ -382,6 +425,38 @@ def cloup_flow_opts(
                 callback=set_worker_count_cb,
                 expose_value=False,
             )(f)
+        if step_cache:
+            f = o(
+                "--step-cache",
+                type=Path(
+                    file_okay=False,
+                    dir_okay=True,
+                ),
+                default=None,
+                help="A directory to cache the results of steps in. Steps with identical configuration, input views and tool versions to a cached result are restored from the cache instead of being run again.",
+                callback=set_step_cache_cb,
+                expose_value=False,
+            )(f)
+        if artifact_cache:
+            f = o(
+                "--artifact-cache",
+                type=Path(
+                    file_okay=False,
+                    dir_okay=True,
+                ),
+                default=None,
+                help="A directory to cache files derived from the PDK in, e.g. the evaluated PDK configuration or liberty files with some cells removed, shared across runs and designs.",
+                callback=set_artifact_cache_cb,
+                expose_value=False,
+            )(f)
+        if odb_server:
+            f = o(
+                "--odb-server/--no-odb-server",
+                default=False,
+                help="Run consecutive Odb steps in a single long-lived OpenROAD process, keeping the design database in memory between them. Each step still writes the ODB file it produces.",
+                callback=set_odb_server_cb,
+                expose_value=False,
+            )(f)
         if enable_initial_state_element:
             f = o(
                 "-e",
@@ -0,0 +1,538 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import os
+import re
+import csv
+import itertools
+import threading
+from operator import eq, ge, gt, le, lt, ne
+from decimal import Decimal, InvalidOperation
+from collections import deque
+from dataclasses import dataclass, field
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import rich
+import rich.table
+
+from .flow import Flow, FlowException
+from .classic import Classic
+from ..config import Config, Variable
+from ..common import Filter, GenericDict, slugify
+from ..state import State
+from ..logging import info, warn, success, options, console
+from ..steps import Step, DeferredStepError
+
+
+class CandidatePruned(Exception):
+    """
+    Raised in place of the output state of a step of an exploration candidate
+    that did not meet the metric thresholds configured for that step.
+
+    :param message: The reason the candidate was pruned
+    :param state: The output state of the step
+    """
+
+    def __init__(self, message: str, state: State):
+        super().__init__(message)
+        self.state = state
+
+
+@dataclass
+class MetricThreshold:
+    """
+    A condition on the value of a metric, e.g. ``timing__setup__ws >= 0``.
+
+    :param metric: The name of the metric
+    :param operator: One of ``<``, ``<=``, ``>``, ``>=``, ``==`` or ``!=``
+    :param value: The value to compare the metric to
+    """
+
+    metric: str
+    operator: str
+    value: Decimal
+
+    operators: ClassVar[Dict[str, Callable[[Any, Any], bool]]] = {
+        "<=": le,
+        ">=": ge,
+        "==": eq,
+        "!=": ne,
+        "<": lt,
+        ">": gt,
+    }
+    rx: ClassVar[re.Pattern] = re.compile(r"^\s*(\S+?)\s*(<=|>=|==|!=|<|>)\s*(\S+)\s*$")
+
+    @classmethod
+    def parse(Self, condition: str) -> MetricThreshold:
+        """
+        :param condition: A condition in the form ``<metric> <operator> <value>``
+        :returns: The parsed threshold
+        :raises ValueError: If the condition is malformed
+        """
+        match = Self.rx.match(condition)
+        if match is None:
+            raise ValueError(
+                f"Invalid metric threshold '{condition}': expected '<metric> <operator> <value>'"
+            )
+        metric, op, value = match.groups()
+        try:
+            return Self(metric, op, Decimal(value))
+        except InvalidOperation:
+            raise ValueError(
+                f"Invalid metric threshold '{condition}': '{value}' is not a number"
+            )
+
+    def check(self, metrics: Mapping[str, Any]) -> bool:
+        """
+        :param metrics: A set of metrics
+        :returns: Whether the metric meets the threshold. Missing or
+            non-numeric metrics always meet it.
+        """
+        value = metrics.get(self.metric)
+        if value is None:
+            return True
+        try:
+            value = Decimal(str(value))
+        except InvalidOperation:
+            return True
+        return self.operators[self.operator](value, self.value)
+
+    def __str__(self) -> str:
+        return f"{self.metric} {self.operator} {self.value}"
+
+
+@dataclass
+class Candidate:
+    """
+    A single point in the design space explored by :class:`Exploration`.
+
+    :param name: The name of the candidate, also used for its directory
+    :param assignments: The values of the swept variables for this candidate
+    :param config: The configuration of the candidate
+    """
+
+    name: str
+    assignments: Dict[str, Any]
+    config: Config
+    status: Literal["pending", "completed", "pruned", "failed"] = "pending"
+    reason: Optional[str] = None
+    state: Optional[State] = None
+    deferred_errors: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _Node:
+    # A step run by one or more candidates
+    step: Step
+    future: Future[State] = field(default_factory=Future)
+    deferred_errors: List[str] = field(default_factory=list)
+
+
+@Flow.factory.register()
+class Exploration(Classic):
+    """
+    Runs the steps of the :class:`Classic` flow for every combination of values
+    of a set of configuration variables (``EXPLORATION_SWEEP``), running the
+    candidates concurrently.
+
+    Candidates whose metrics do not meet the thresholds configured for a given
+    step (``EXPLORATION_PRUNING``) are pruned right after that step, so cheap
+    early steps can rule out candidates before the expensive ones are run.
+
+    The results of all candidates are tabulated, e.g.: ::
+
+      ┏━━━━━━━━━━━┳━━━━━━━━━━━━━━┳━━━━━━━━━━━┳━━━━━━━━━━━━━━━━━━━━━━━━┳━━━━━━━━━━━━━━━━━━━┓
+      ┃ Candidate ┃ FP_CORE_UTIL ┃ Status    ┃ design__instance__area ┃ timing__setup__ws ┃
+      ┡━━━━━━━━━━━╇━━━━━━━━━━━━━━╇━━━━━━━━━━━╇━━━━━━━━━━━━━━━━━━━━━━━━╇━━━━━━━━━━━━━━━━━━━┩
+      │ 0         │ 40           │ completed │ 96447.5008             │ 6.434102          │
+      │ 1         │ 60           │ pruned    │ 96447.5008             │ -0.2              │
+      └───────────┴──────────────┴───────────┴────────────────────────┴───────────────────┘
+
+    The table is also written to ``summary.rpt`` and ``exploration.csv`` in the
+    run directory, and each candidate's steps are run in a subdirectory of the
+    run directory named after the candidate.
+
+    Steps that do not use any of the swept variables (per
+    :meth:`Step.get_all_config_variables`) and that only follow such steps,
+    e.g. linting when sweeping floorplanning variables, are only run once for
+    all candidates whose values for the variables used so far are identical.
+    Shared steps are run in the directory of the first such candidate.
+
+    To explore a different sequential flow, subclass this flow and override
+    :attr:`Steps` and :attr:`gating_config_vars`.
+    """
+
+    config_vars = Classic.config_vars + [
+        Variable(
+            "EXPLORATION_SWEEP",
+            Dict[str, List[Union[str, bool, Decimal]]],
+            "A map from configuration variable names to the values to try for each. Every combination of values is run as a separate candidate. Only variables with scalar values may be swept.",
+        ),
+        Variable(
+            "EXPLORATION_PRUNING",
+            Optional[Dict[str, List[str]]],
+            "A map from step IDs (wildcards) to lists of metric thresholds in the form `<metric> <operator> <value>`, e.g. `timing__setup__ws >= 0`, where the operator is one of `<`, `<=`, `>`, `>=`, `==` and `!=`. Candidates not meeting all thresholds after a matching step are pruned. Missing metrics are not considered.",
+        ),
+        Variable(
+            "EXPLORATION_METRICS",
+            List[str],
+            "The metrics tabulated for each candidate.",
+            default=[
+                "design__instance__count",
+                "design__instance__area",
+                "timing__setup__ws",
+                "timing__setup__tns",
+                "timing__hold__ws",
+                "route__wirelength",
+                "power__total",
+            ],
+        ),
+        Variable(
+            "EXPLORATION_MAX_CONCURRENT",
+            Optional[int],
+            "The maximum number of candidates to run concurrently. If unset, all candidates are started at once, and only the number of threads and CPU slots available to OpenLane limit how many steps run at a time.",
+        ),
+    ]
+
+    def run(
+        self,
+        initial_state: State,
+        frm: Optional[str] = None,
+        to: Optional[str] = None,
+        skip: Optional[Iterable[str]] = None,
+        reproducible: Optional[str] = None,
+        **kwargs,
+    ) -> Tuple[State, List[Step]]:
+        if frm or to or skip or reproducible:
+            warn(
+                f"Running partial flows and creating reproducibles is not supported by {self.name}: all steps will be run."
+            )
+
+        candidates = self.__get_candidates()
+        thresholds = self.__get_thresholds()
+
+        self.progress_bar.set_max_stage_count(1)
+        self.progress_bar.start_stage("Exploration")
+        info(f"Exploring {len(candidates)} candidates…")
+
+        condensed_mode_bk = options.get_condensed_mode()
+        options.set_condensed_mode(True)
+
+        # Candidates share the results of a step if they share all steps up to
+        # and including it, and the step does not use any variable for which
+        # they have different values
+        step_variables = {
+            cls.id: {variable.name for variable in cls.get_all_config_variables()}
+            for cls in self.Steps
+        }
+        plans: Dict[str, List[Tuple[Type[Step], int, Tuple]]] = {}
+        for candidate in candidates:
+            plan: List[Tuple[Type[Step], int, Tuple]] = []
+            key: Tuple = ()
+            for cls in self.Steps:
+                if self.__is_gated(cls.id, candidate.config):
+                    continue
+                key = key + (
+                    (
+                        cls.id,
+                        tuple(
+                            (name, value)
+                            for name, value in candidate.assignments.items()
+                            if name in step_variables[cls.id]
+                        ),
+                    ),
+                )
+                plan.append((cls, len(plan), key))
+            plans[candidate.name] = plan
+        total_steps = sum(len(plan) for plan in plans.values())
+        unique_steps = len({key for plan in plans.values() for _, _, key in plan})
+        if unique_steps != total_steps:
+            info(
+                f"{total_steps - unique_steps} of {total_steps} step runs are shared between candidates and will only be run once."
+            )
+
+        step_list: List[Step] = []
+        lock = threading.RLock()
+        nodes: Dict[Tuple, _Node] = {}
+        queue: Deque[Candidate] = deque(candidates)
+        remaining = len(candidates)
+        all_done = threading.Event()
+
+        def start_candidate(candidate: Candidate) -> Future[State]:
+            assert self.run_dir is not None
+            current: Future[State] = Future()
+            current.set_result(initial_state)
+            for cls, ordinal_offset, key in plans[candidate.name]:
+                with lock:
+                    if node := nodes.get(key):
+                        current = node.future
+                        continue
+                    step = cls(config=candidate.config, state_in=current)
+                    step_list.append(step)
+                    step_future = self.start_step_async(
+                        step,
+                        step_dir=os.path.join(
+                            self.run_dir,
+                            candidate.name,
+                            f"{self.progress_bar.get_ordinal_prefix(ordinal_offset)}{slugify(step.id)}",
+                        ),
+                    )
+                    node = _Node(step)
+                    node.future = self.__link(
+                        node,
+                        step_future,
+                        [
+                            threshold
+                            for id, step_thresholds in thresholds.items()
+                            if Filter([id]).match(step.id)
+                            for threshold in step_thresholds
+                        ],
+                    )
+                    nodes[key] = node
+                    current = node.future
+            return current
+
+        def finish_candidate(candidate: Candidate, future: Future[State]):
+            nonlocal remaining
+            try:
+                with lock:
+                    candidate.deferred_errors = [
+                        error
+                        for _, _, key in plans[candidate.name]
+                        if key in nodes
+                        for error in nodes[key].deferred_errors
+                    ]
+                try:
+                    candidate.state = future.result()
+                    if len(candidate.deferred_errors):
+                        candidate.status = "failed"
+                        candidate.reason = "\n".join(candidate.deferred_errors)
+                    else:
+                        candidate.status = "completed"
+                except CandidatePruned as e:
+                    candidate.status = "pruned"
+                    candidate.reason = str(e)
+                    candidate.state = e.state
+                except Exception as e:
+                    candidate.status = "failed"
+                    candidate.reason = str(e)
+                info(f"Candidate {candidate.name}: {candidate.status}.")
+                launch_next()
+            finally:
+                with lock:
+                    remaining -= 1
+                    if remaining == 0:
+                        all_done.set()
+
+        def launch_next():
+            with lock:
+                if len(queue) == 0:
+                    return
+                candidate = queue.popleft()
+            try:
+                future = start_candidate(candidate)
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+            future.add_done_callback(lambda f: finish_candidate(candidate, f))
+
+        try:
+            if len(candidates) == 0:
+                all_done.set()
+            max_concurrent = self.config["EXPLORATION_MAX_CONCURRENT"] or len(
+                candidates
+            )
+            for _ in range(max_concurrent):
+                launch_next()
+            all_done.wait()
+        finally:
+            options.set_condensed_mode(condensed_mode_bk)
+        self.progress_bar.end_stage()
+
+        self.__report(candidates)
+
+        success("Flow complete.")
+        # Steps of pruned or failed candidates may never have been started
+        return (initial_state, [step for step in step_list if step.start_time])
+
+    def __get_candidates(self) -> List[Candidate]:
+        variables_by_name = {
+            variable.name: variable for variable in self.get_all_config_variables()
+        }
+        sweep: Dict[str, List[Any]] = self.config["EXPLORATION_SWEEP"]
+        values_by_name: Dict[str, List[Any]] = {}
+        for name, values in sweep.items():
+            variable = variables_by_name.get(name)
+            if variable is None:
+                raise FlowException(
+                    f"Cannot sweep '{name}': no such variable in flow '{self.name}'."
+                )
+            if name.startswith("EXPLORATION_"):
+                raise FlowException(f"Cannot sweep exploration variable '{name}'.")
+            values_by_name[name] = []
+            for value in values:
+                try:
+                    _, processed = variable.compile(
+                        GenericDict({name: value}),
+                        [],
+                        permissive_typing=True,
+                    )
+                except ValueError as e:
+                    raise FlowException(f"Invalid value for swept variable: {e}")
+                values_by_name[name].append(processed)
+
+        candidates = []
+        for i, combination in enumerate(itertools.product(*values_by_name.values())):
+            assignments = dict(zip(values_by_name.keys(), combination))
+            candidates.append(
+                Candidate(
+                    name=str(i),
+                    assignments=assignments,
+                    config=self.config.copy(**assignments),
+                )
+            )
+        return candidates
+
+    def __get_thresholds(self) -> Dict[str, List[MetricThreshold]]:
+        thresholds: Dict[str, List[MetricThreshold]] = {}
+        step_ids = [cls.id for cls in self.Steps]
+        for id, conditions in (self.config["EXPLORATION_PRUNING"] or {}).items():
+            if next(Filter([id]).filter(step_ids), None) is None:
+                raise FlowException(
+                    f"Invalid pruning configuration: no step(s) with ID '{id}' found in flow."
+                )
+            try:
+                thresholds[id] = [
+                    MetricThreshold.parse(condition) for condition in conditions
+                ]
+            except ValueError as e:
+                raise FlowException(f"Invalid pruning configuration: {e}")
+        return thresholds
+
+    def __is_gated(self, step_id: str, config: Config) -> bool:
+        for id, variable_names in self.gating_config_vars.items():
+            if not Filter([id]).match(step_id):
+                continue
+            for variable in variable_names:
+                if not config[variable]:
+                    return True
+        return False
+
+    def __link(
+        self,
+        node: _Node,
+        step_future: Future[State],
+        thresholds: List[MetricThreshold],
+    ) -> Future[State]:
+        # The input state of the next step: deferred errors are recorded and
+        # skipped over, and thresholds are checked
+        linked: Future[State] = Future()
+
+        def callback(future: Future[State]):
+            try:
+                state = future.result()
+            except DeferredStepError as e:
+                node.deferred_errors.append(str(e))
+                state = node.step.state_in.result()
+            except BaseException as e:
+                linked.set_exception(e)
+                return
+            failed = [
+                str(threshold)
+                for threshold in thresholds
+                if not threshold.check(state.metrics)
+            ]
+            if len(failed):
+                linked.set_exception(
+                    CandidatePruned(
+                        f"Pruned after {node.step.id}: {', '.join(failed)} not met",
+                        state,
+                    )
+                )
+            else:
+                linked.set_result(state)
+
+        step_future.add_done_callback(callback)
+        return linked
+
+    def __report(self, candidates: List[Candidate]):
+        swept = list(self.config["EXPLORATION_SWEEP"].keys())
+        metrics = self.config["EXPLORATION_METRICS"]
+
+        rows = []
+        for candidate in candidates:
+            candidate_metrics = candidate.state.metrics if candidate.state else {}
+            rows.append(
+                [candidate.name]
+                + [str(candidate.assignments[name]) for name in swept]
+                + [candidate.status]
+                + [
+                    (
+                        str(candidate_metrics[metric])
+                        if candidate_metrics.get(metric) is not None
+                        else ""
+                    )
+                    for metric in metrics
+                ]
+                + [candidate.reason or ""]
+            )
+        header = ["Candidate"] + swept + ["Status"] + metrics + ["Reason"]
+
+        assert self.run_dir is not None
+        with open(
+            os.path.join(self.run_dir, "exploration.csv"),
+            "w",
+            encoding="utf8",
+            newline="",
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+        status_styles = {
+            "completed": "[green]",
+            "pruned": "[yellow]",
+            "failed": "[red]",
+        }
+        table = rich.table.Table()
+        for column in header[:-1]:
+            table.add_column(column)
+        for candidate, row in zip(candidates, rows):
+            row = row[:-1]
+            status_index = len(swept) + 1
+            row[status_index] = (
+                f"{status_styles.get(candidate.status, '')}{row[status_index]}"
+            )
+            table.add_row(*row)
+
+        console.print(table)
+        with open(os.path.join(self.run_dir, "summary.rpt"), "w", encoding="utf8") as f:
+            file_console = rich.console.Console(file=f, width=160)
+            file_console.print(table)
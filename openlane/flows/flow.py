@@ -18,6 +18,8 @@ import shutil
 import fnmatch
 import logging
 import datetime
+import threading
+import time
 import textwrap
 from dataclasses import dataclass
 from abc import abstractmethod, ABC
@@ -25,6 +27,7 @@ from concurrent.futures import Future
 from functools import wraps
 from typing import (
     List,
+    MutableSequence,
     Sequence,
     Tuple,
     Type,
@@ -34,6 +37,7 @@ from typing import (
     Callable,
     TypeVar,
     Union,
+    overload,
 )
 
 from rich.progress import (
@@ -49,7 +53,7 @@ from openlane.common.types import Path
 
 from ..config import Config, Variable, universal_flow_config_variables, AnyConfigs
 from ..state import State, DesignFormat, DesignFormatObject
-from ..steps import Step, StepNotFound
+from ..steps import Step, StepNotFound, materialize_views
 from ..logging import (
     LevelFilter,
     console,
@@ -62,15 +66,85 @@ from ..logging import (
 )
 from ..common import (
     get_tpe,
+    get_scheduler,
     mkdirp,
     protected,
     final,
     slugify,
     Toolbox,
-    get_latest_file,
+    format_size,
+    clone_files,
+    CloneMode,
+    AnyPath,
+    RunManifest,
+    RunManifestEntry,
 )
 
 
+class LazyStepList(MutableSequence[Step]):
+    """
+    A mutable sequence of :class:`Step` objects, some of which may be
+    placeholders for steps that have already concluded in a previous run.
+
+    Placeholders are materialized (using a loader function) the first time
+    they are accessed, so resuming a run with many concluded steps does not
+    require loading the configurations and states of all of them up-front.
+
+    :param loader: A function loading a concluded step from its directory.
+    """
+
+    def __init__(self, loader: Callable[[str], Step]) -> None:
+        self.__loader = loader
+        self.__items: List[Union[Step, str]] = []
+        self.__lock = threading.Lock()
+
+    def append_finished(self, step_dir: str):
+        """
+        Appends a placeholder for a concluded step.
+
+        :param step_dir: The directory of the concluded step.
+        """
+        with self.__lock:
+            self.__items.append(step_dir)
+
+    def __materialize(self, index: int) -> Step:
+        with self.__lock:
+            item = self.__items[index]
+            if isinstance(item, str):
+                item = self.__loader(item)
+                self.__items[index] = item
+            return item
+
+    @overload
+    def __getitem__(self, index: int) -> Step: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Step]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Step, List[Step]]:
+        if isinstance(index, slice):
+            return [self.__materialize(i) for i in range(len(self))[index]]
+        return self.__materialize(index)
+
+    def __setitem__(self, index, value):
+        with self.__lock:
+            self.__items[index] = value
+
+    def __delitem__(self, index):
+        with self.__lock:
+            del self.__items[index]
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def insert(self, index: int, value: Step):
+        with self.__lock:
+            self.__items.insert(index, value)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__} of {len(self)} steps>"
+
+
 class FlowError(RuntimeError):
     """
     A ``RuntimeError`` that occurs when a Flow, or one of its underlying Steps,
@@ -212,13 +286,15 @@ class FlowProgressBar(object):
         self.__progress.update(self.__task_id, completed=float(self.__stages_completed))
 
     @ensure_progress_started
-    def get_ordinal_prefix(self) -> str:
+    def get_ordinal_prefix(self, offset: int = 0) -> str:
         """
+        :param offset: An offset to add to the current step ordinal, useful
+            for flows that assign step directories ahead of running the steps.
         :returns: A string with the current step ordinal, which can be
             used to create a step directory.
         """
         max_stage_digits = len(str(self.__max_stage))
-        return f"{str(self.__ordinal).zfill(max_stage_digits)}-"
+        return f"{str(self.__ordinal + offset).zfill(max_stage_digits)}-"
 
 
 class Flow(ABC):
@@ -268,6 +344,9 @@ class Flow(ABC):
         A list of :class:`Step` **objects** from the last run of the flow,
         if it exists.
 
+        When resuming a run, the steps that concluded previously are only
+        loaded once they are accessed.
+
         If :meth:`start` is called again, the reference is destroyed.
 
     :ivar run_dir:
@@ -280,6 +359,13 @@ class Flow(ABC):
 
         If :meth:`start` is called again, the reference is destroyed.
 
+    :ivar run_manifest:
+        The :class:`openlane.common.RunManifest` of the last run of the flow, if it exists,
+        in which every step started through :meth:`start_step` or
+        :meth:`start_step_async` is recorded.
+
+        If :meth:`start` is called again, the reference is destroyed.
+
     :ivar config_resolved_path:
         The path to the serialization of the resolved configuration for the
         last run of the flow.
@@ -328,10 +414,11 @@ class Flow(ABC):
     name: str = NotImplemented
     Steps: List[Type[Step]] = NotImplemented  # Override
     config_vars: List[Variable] = []
-    step_objects: Optional[List[Step]] = None
+    step_objects: Optional[LazyStepList] = None
     run_dir: Optional[str] = None
     toolbox: Optional[Toolbox] = None
     config_resolved_path: Optional[str] = None
+    run_manifest: Optional[RunManifest] = None
 
     def __init__(
         self,
@@ -510,7 +597,8 @@ class Flow(ABC):
 
         :param with_initial_state: An optional initial state object to use.
             If not provided:
-            * If resuming a previous run, the latest ``state_out.json`` (by filesystem modification date)
+            * If resuming a previous run, the ``state_out.json`` of the
+              concluded step with the highest ordinal
             * If not, an empty state object is created.
         :param tag: A name for this invocation of the flow. If not provided,
             one based on a date string will be created.
@@ -564,7 +652,20 @@ class Flow(ABC):
         )
         initial_state = with_initial_state or State()
 
-        self.step_objects = []
+        def load_finished(step_dir: str) -> Step:
+            try:
+                return Step.load_finished(
+                    step_dir,
+                    self.config["PDK_ROOT"],
+                    self.Steps,
+                )
+            except StepNotFound as e:
+                raise FlowException(
+                    f"Error while loading concluded step in {os.path.basename(step_dir)}: {e}"
+                )
+
+        self.step_objects = LazyStepList(load_finished)
+        self.run_manifest = RunManifest(self.run_dir)
         starting_ordinal = 1
         try:
             entries = os.listdir(self.run_dir)
@@ -577,48 +678,35 @@ class Flow(ABC):
 
             info(f"Using existing run at '{tag}' with the '{self.name}' flow.")
 
-            # Extract maximum step ordinal + load finished steps
-            entries_sorted = sorted(
-                filter(
-                    lambda x: "-" in x and x.split("-", maxsplit=1)[0].isdigit(),
-                    entries,
-                ),
-                key=lambda x: int(x.split("-", maxsplit=1)[0]),
-            )
-            for entry in entries_sorted:
-                components = entry.split("-", maxsplit=1)
+            if not self.run_manifest.exists():
+                self.__index_run_dir(entries)
 
-                try:
-                    extracted_ordinal = int(components[0])
-                except ValueError:
+            # Extract maximum step ordinal + index finished steps
+            latest_json: Optional[str] = None
+            for entry in self.run_manifest.get_entries():
+                if os.sep in entry.dir:
+                    # Nested step, e.g. in an exploration candidate
                     continue
+                starting_ordinal = max(starting_ordinal, entry.ordinal + 1)
 
-                if not _no_load_previous_steps:
-                    try:
-                        self.step_objects.append(
-                            Step.load_finished(
-                                os.path.join(self.run_dir, entry),
-                                self.config["PDK_ROOT"],
-                                self.Steps,
-                            )
-                        )
-                    except StepNotFound as e:
-                        raise FlowException(
-                            f"Error while loading concluded step in {entry}: {e}"
-                        )
-                    except FileNotFoundError:
-                        pass
+                if state_out := entry.state_out:
+                    latest_json = os.path.join(self.run_dir, state_out)
+                else:
+                    continue
 
-                starting_ordinal = max(starting_ordinal, extracted_ordinal + 1)
+                if _no_load_previous_steps:
+                    continue
+                if entry.id is not None and self.__find_step(entry.id) is None:
+                    raise FlowException(
+                        f"Error while loading concluded step in {entry.dir}: Step {entry.id} not found"
+                    )
+                self.step_objects.append_finished(os.path.join(self.run_dir, entry.dir))
 
             # Extract Maximum State
-            if with_initial_state is None:
-                if latest_json := get_latest_file(self.run_dir, "state_out.json"):
-                    verbose(f"Using state at '{latest_json}'.")
+            if with_initial_state is None and latest_json is not None:
+                verbose(f"Using state at '{latest_json}'.")
 
-                    initial_state = State.loads(
-                        open(latest_json, encoding="utf8").read()
-                    )
+                initial_state = State.load(latest_json)
 
         except NotADirectoryError:
             raise FlowException(
@@ -631,6 +719,10 @@ class Flow(ABC):
         # Stored until next start()
         self.toolbox = Toolbox(os.path.join(self.run_dir, "tmp"))
 
+        get_scheduler().load_history(
+            os.path.join(os.path.dirname(self.run_dir), ".resource_history.json")
+        )
+
         for level in ["WARNING", "ERROR"]:
             path = os.path.join(self.run_dir, f"{level.lower()}.log")
             handler = logging.FileHandler(path, mode="a+")
@@ -674,6 +766,63 @@ class Flow(ABC):
                 for record in warning_handler.warnings.values():
                     warn(f"{record}")
 
+    def __index_run_dir(self, entries: List[str]):
+        # Runs created before run manifests were introduced: create one from
+        # the step directories
+        assert self.run_manifest is not None
+        step_dirs = sorted(
+            filter(
+                lambda x: "-" in x and x.split("-", maxsplit=1)[0].isdigit(),
+                entries,
+            ),
+            key=lambda x: int(x.split("-", maxsplit=1)[0]),
+        )
+        for step_dir in step_dirs:
+            concluded = os.path.isfile(
+                os.path.join(self.run_manifest.run_dir, step_dir, "state_out.json")
+            )
+            self.run_manifest.record(
+                RunManifestEntry(
+                    ordinal=int(step_dir.split("-", maxsplit=1)[0]),
+                    dir=step_dir,
+                    status="success" if concluded else "failed",
+                )
+            )
+
+    def __find_step(self, id: str) -> Optional[Type[Step]]:
+        for step in self.Steps:
+            if step.get_implementation_id() == id:
+                return step
+        return Step.factory.get(id)
+
+    def __start_step_recorded(self, step: Step, *args, **kwargs) -> State:
+        manifest = self.run_manifest
+        step_dir = kwargs.get("step_dir")
+        if manifest is None or step_dir is None:
+            return step.start(*args, **kwargs)
+
+        basename = os.path.basename(step_dir)
+        prefix = basename.split("-", maxsplit=1)[0]
+        entry = RunManifestEntry(
+            ordinal=int(prefix) if prefix.isdigit() else 0,
+            dir=os.path.relpath(step_dir, manifest.run_dir),
+            status="running",
+            id=step.get_implementation_id(),
+        )
+        manifest.record(entry)
+        start = time.time()
+        try:
+            state_out = step.start(*args, **kwargs)
+        except BaseException:
+            entry.status = "failed"
+            raise
+        else:
+            entry.status = "success"
+        finally:
+            entry.runtime = time.time() - start
+            manifest.record(entry)
+        return state_out
+
     @protected
     @abstractmethod
     def run(
@@ -691,11 +840,13 @@ class Flow(ABC):
         pass
 
     @protected
-    def dir_for_step(self, step: Step) -> str:
+    def dir_for_step(self, step: Step, ordinal_offset: int = 0) -> str:
         """
         May only be called while :attr:`run_dir` is not None, i.e., the flow
         has started. Otherwise, a :class:`FlowException` is raised.
 
+        :param step: The step object in question
+        :param ordinal_offset: See :meth:`FlowProgressBar.get_ordinal_prefix`
         :returns: A directory within the run directory for a specific step,
             prefixed with the current progress bar stage number.
         """
@@ -705,7 +856,7 @@ class Flow(ABC):
             )
         return os.path.join(
             self.run_dir,
-            f"{self.progress_bar.get_ordinal_prefix()}{slugify(step.id)}",
+            f"{self.progress_bar.get_ordinal_prefix(ordinal_offset)}{slugify(step.id)}",
         )
 
     @protected
@@ -738,7 +889,7 @@ class Flow(ABC):
         kwargs["toolbox"] = self.toolbox
         kwargs["step_dir"] = self.dir_for_step(step)
 
-        return step.start(*args, **kwargs)
+        return self.__start_step_recorded(step, *args, **kwargs)
 
     @protected
     def start_step_async(
@@ -753,21 +904,63 @@ class Flow(ABC):
         :param step: The step object to run
         :param args: Arguments to `step.start`
         :param kwargs: Keyword arguments to `step.start`
+
+            If ``step_dir`` is passed explicitly, it is used as-is instead of
+            :meth:`dir_for_step`.
         :returns: A ``Future`` encapsulating a State object, which can be used
-            as an input to the next step (where the next step will wait for the
-            ``Future`` to be realized before calling :meth:`Step.run`)
+            as an input to the next step.
+
+            The step is only submitted to the thread pool once its own input
+            state has been realized, so steps waiting on other steps never
+            occupy a worker. If the input state cannot be realized, the
+            exception is propagated to the returned ``Future`` and the step is
+            not run.
         """
 
         kwargs["toolbox"] = self.toolbox
-        kwargs["step_dir"] = self.dir_for_step(step)
+        if kwargs.get("step_dir") is None:
+            kwargs["step_dir"] = self.dir_for_step(step)
 
-        return get_tpe().submit(step.start, *args, **kwargs)
+        result: Future[State] = Future()
 
-    def _save_snapshot_ef(self, path: Union[str, os.PathLike]):
+        def relay(step_future: Future[State]):
+            try:
+                result.set_result(step_future.result())
+            except BaseException as e:
+                result.set_exception(e)
+
+        def submit(state_in: Future[State]):
+            if not result.set_running_or_notify_cancel():
+                return
+            try:
+                state_in.result()
+            except BaseException as e:
+                result.set_exception(e)
+                return
+            try:
+                step_future = get_tpe().submit(
+                    self.__start_step_recorded, step, *args, **kwargs
+                )
+            except RuntimeError as e:  # Executor has been shut down
+                result.set_exception(e)
+                return
+            step_future.add_done_callback(relay)
+
+        # If the input state is already realized, this runs immediately.
+        step.state_in.add_done_callback(submit)
+
+        return result
+
+    def _save_snapshot_ef(
+        self,
+        path: Union[str, os.PathLike],
+        mode: CloneMode = "reflink",
+    ):
         if (
             self.step_objects is None
             or self.toolbox is None
             or self.config_resolved_path is None
+            or self.run_dir is None
         ):
             raise RuntimeError(
                 "Flow was not run before attempting to save views in the Efabless format."
@@ -802,6 +995,15 @@ class Flow(ABC):
             DesignFormat.GDS: ("gds", "gds"),
             DesignFormat.MAG: ("mag", "mag"),
         }
+        last_state = materialize_views(
+            self.config,
+            self.toolbox,
+            last_state,
+            supported_formats,
+            os.path.join(self.run_dir, "lazy-views"),
+        )
+
+        pairs: List[Tuple[AnyPath, AnyPath]] = []
 
         def visitor(key, value, top_key, _, __):
             df = DesignFormat.by_id(top_key)
@@ -828,19 +1030,23 @@ class Flow(ABC):
                         target_path = os.path.join(
                             default_corner_target_dir, target_basename
                         )
-                        shutil.copyfile(
-                            default_corner_view[0], target_path, follow_symlinks=True
-                        )
+                        pairs.append((default_corner_view[0], target_path))
                     else:
+                        mkdirp(target_dir)
                         for file in default_corner_view:
-                            shutil.copyfile(file, target_dir, follow_symlinks=True)
+                            pairs.append(
+                                (
+                                    file,
+                                    os.path.join(target_dir, os.path.basename(file)),
+                                )
+                            )
                 return
 
             target_basename = os.path.basename(str(value))
             target_basename = target_basename[: -len(dfo.extension)] + extension
             target_path = os.path.join(target_dir, target_basename)
             mkdirp(target_dir)
-            shutil.copyfile(value, target_path, follow_symlinks=True)
+            pairs.append((value, target_path))
 
         last_state._walk(last_state.to_raw_dict(metrics=False), path, visit=visitor)
 
@@ -851,9 +1057,7 @@ class Flow(ABC):
                 if os.path.isdir(file_path):
                     continue
                 if fnmatch.fnmatch(file, filter):
-                    shutil.copyfile(
-                        file_path, os.path.join(to_dir, file), follow_symlinks=True
-                    )
+                    pairs.append((file_path, os.path.join(to_dir, file)))
 
         signoff_folder = os.path.join(
             path, "signoff", self.config["DESIGN_NAME"], "openlane-signoff"
@@ -861,10 +1065,11 @@ class Flow(ABC):
         mkdirp(signoff_folder)
 
         # resolved.json
-        shutil.copyfile(
-            self.config_resolved_path,
-            os.path.join(signoff_folder, "resolved.json"),
-            follow_symlinks=True,
+        pairs.append(
+            (
+                self.config_resolved_path,
+                os.path.join(signoff_folder, "resolved.json"),
+            )
         )
 
         # Logs
@@ -897,6 +1102,12 @@ class Flow(ABC):
                     mkdirp(target)
                     copy_dir_contents(dir_path, target, "*.rpt")
 
+        stats = clone_files(pairs, mode)
+        if stats.bytes_saved != 0:
+            info(
+                f"Saved {format_size(stats.bytes_saved)} of {format_size(stats.bytes_total)} by linking files instead of copying them."
+            )
+
     @deprecated(
         version="2.0.0a46",
         reason="Use .progress_bar.set_max_stage_count",
@@ -14,10 +14,13 @@
 from __future__ import annotations
 
 import os
+import re
 import fnmatch
+from concurrent.futures import Future, wait, FIRST_COMPLETED
 from typing import (
     Iterable,
     List,
+    Sequence,
     Set,
     Tuple,
     Optional,
@@ -29,19 +32,79 @@ from typing import (
 from rapidfuzz import process, fuzz, utils
 
 from .flow import Flow, FlowException, FlowError
-from ..common import Filter
-from ..state import State
-from ..logging import info, success, debug
+from ..config import Variable
+from ..common import Filter, GenericImmutableDict, CloneMode
+from ..state import State, DesignFormat
+from ..logging import info, success, debug, verbose
 from ..steps import (
     Step,
     StepError,
     StepException,
     DeferredStepError,
+    materialize_views,
 )
 
 Substitution = Union[str, Type[Step], None]
 
 
+def _wildcards_overlap(a: str, b: str) -> bool:
+    # Conservative: two wildcards overlap unless their literal prefixes differ
+    a_prefix = re.split(r"[*?\[]", a, maxsplit=1)[0]
+    b_prefix = re.split(r"[*?\[]", b, maxsplit=1)[0]
+    if a_prefix == a:
+        return fnmatch.fnmatchcase(a, b)
+    if b_prefix == b:
+        return fnmatch.fnmatchcase(b, a)
+    return a_prefix.startswith(b_prefix) or b_prefix.startswith(a_prefix)
+
+
+def _may_emit(
+    metrics_out: Optional[Sequence[str]], metrics_in: Optional[Sequence[str]]
+) -> bool:
+    if metrics_out is None:
+        return metrics_in is None or len(metrics_in) != 0
+    if metrics_in is None:
+        return len(metrics_out) != 0
+    # Wildcards prefixed with "!" only exclude metrics (see Filter)
+    return any(
+        _wildcards_overlap(emitted, read)
+        for emitted in metrics_out
+        for read in metrics_in
+        if not read.startswith("!")
+    )
+
+
+def get_step_dependencies(steps: Sequence[Type[Step]]) -> List[Set[int]]:
+    """
+    Derives a dependency graph for a list of Steps meant to be run in order.
+
+    * A Step depends on the latest preceding Step declaring any of its
+      ``inputs`` or ``outputs`` as an output, the latter as Steps may build
+      upon the previous version of a view they update.
+    * A Step that reads metrics (see :attr:`Step.metrics_in`) depends on all
+      preceding Steps that may emit any of them (see :attr:`Step.metrics_out`).
+
+    :param steps: The list of Step types, in their sequential order.
+    :returns: For each Step, the set of the indices of the Steps it directly
+        depends on.
+    """
+    dependencies: List[Set[int]] = []
+    last_writer: Dict[DesignFormat, int] = {}
+    for i, step in enumerate(steps):
+        step_dependencies = {
+            last_writer[format]
+            for format in step.inputs + step.outputs
+            if format in last_writer
+        }
+        for j, previous in enumerate(steps[:i]):
+            if _may_emit(previous.metrics_out, step.metrics_in):
+                step_dependencies.add(j)
+        dependencies.append(step_dependencies)
+        for output in step.outputs:
+            last_writer[output] = i
+    return dependencies
+
+
 class SequentialFlow(Flow):
     """
     The simplest Flow, running each Step as a stage, serially,
@@ -74,6 +137,26 @@ class SequentialFlow(Flow):
     Substitutions: Optional[Dict[str, Union[str, Type[Step], None]]] = None
     gating_config_vars: Dict[str, List[str]] = {}
 
+    config_vars = [
+        Variable(
+            "PARALLEL_STEPS",
+            bool,
+            "Runs Steps that do not depend on one another concurrently. Dependencies are derived from the design formats each Step consumes and produces, and Steps that read metrics wait for all prior Steps that may emit them to conclude. The final state is identical to that of running the Steps one after another. Ignored when creating reproducibles.",
+            default=False,
+        ),
+        Variable(
+            "PARALLEL_STEPS_MAX",
+            Optional[int],
+            "The maximum number of Steps to run concurrently if PARALLEL_STEPS is enabled. If unset, only the maximum number of threads used by OpenLane bounds it.",
+        ),
+        Variable(
+            "SNAPSHOT_MODE",
+            CloneMode,
+            "How the final views are saved. `copy` always copies files, `reflink` clones them copy-on-write where the file system supports it and copies them otherwise, and `link` additionally attempts to hardlink files before copying them. Hardlinked views share their contents with the files in the step directories, so modifying either in-place modifies both.",
+            default="reflink",
+        ),
+    ]
+
     def __init_subclass__(Self, scm_type=None, name=None, **kwargs):
         Self.Steps = Self.Steps.copy()  # Break global reference
         Self.config_vars = Self.config_vars.copy()
@@ -304,9 +387,16 @@ class SequentialFlow(Flow):
             for id in Filter([key]).filter(step_ids.values()):
                 gating_cvars_expanded[id] = value
 
+        parallel = self.config.get("PARALLEL_STEPS") and reproducible_resolved is None
+        planned: List[Tuple[Step, str]] = []
+
         current_state = initial_state
         for cls in self.Steps:
-            step = cls(config=self.config, state_in=current_state)
+            state_in: Union[State, Future[State]] = current_state
+            if parallel:
+                # Realized right before the step is started
+                state_in = Future()
+            step = cls(config=self.config, state_in=state_in)
             if frm_resolved is not None and frm_resolved == step.id:
                 executing = True
 
@@ -332,13 +422,15 @@ class SequentialFlow(Flow):
                     )
                 )
                 break
+            elif parallel:
+                step_list.append(step)
+                planned.append(
+                    (step, self.dir_for_step(step, ordinal_offset=len(planned)))
+                )
             else:
                 step_list.append(step)
                 try:
-                    current_state = step.start(
-                        toolbox=self.toolbox,
-                        step_dir=self.dir_for_step(step),
-                    )
+                    current_state = self.start_step(step)
                 except StepException as e:
                     raise FlowException(str(e)) from None
                 except DeferredStepError as e:
@@ -346,10 +438,16 @@ class SequentialFlow(Flow):
                 except StepError as e:
                     raise FlowError(str(e)) from None
 
-            self.progress_bar.end_stage(increment_ordinal=increment_ordinal)
+            if not (parallel and increment_ordinal):
+                # Stages for parallel steps are ended as they conclude
+                self.progress_bar.end_stage(increment_ordinal=increment_ordinal)
 
             if to_resolved and to_resolved == step.id:
                 executing = False
+
+        if parallel:
+            current_state = self.__run_parallel(initial_state, planned, deferred_errors)
+
         if len(deferred_errors) != 0:
             raise FlowError(
                 "One or more deferred errors were encountered:\n"
@@ -357,11 +455,113 @@ class SequentialFlow(Flow):
             )
 
         assert self.run_dir is not None
+        assert self.toolbox is not None
         debug(f"Run concluded ▶ '{self.run_dir}'")
         final_views_path = os.path.join(self.run_dir, "final")
         try:
-            current_state.save_snapshot(final_views_path)
+            current_state = materialize_views(
+                self.config,
+                self.toolbox,
+                current_state,
+                DesignFormat,
+                os.path.join(self.run_dir, "lazy-views"),
+            )
+            current_state.save_snapshot(
+                final_views_path, mode=self.config.get("SNAPSHOT_MODE", "reflink")
+            )
         except Exception as e:
             raise FlowException(f"Failed to save final views: {e}")
         success("Flow complete.")
         return (current_state, step_list)
+
+    def __run_parallel(
+        self,
+        initial_state: State,
+        planned: List[Tuple[Step, str]],
+        deferred_errors: List[str],
+    ) -> State:
+        dependencies = get_step_dependencies([type(step) for step, _ in planned])
+        ancestors: List[Set[int]] = []
+        for direct in dependencies:
+            ancestors.append(direct.union(*[ancestors[i] for i in direct]))
+
+        max_parallel = self.config.get("PARALLEL_STEPS_MAX") or len(planned)
+        verbose(f"Running up to {max_parallel} step(s) concurrently…")
+
+        updates: Dict[int, Tuple[dict, dict]] = {}
+        pending = list(range(len(planned)))
+        in_flight: Dict[Future[State], int] = {}
+        failure: Optional[FlowError] = None
+        while len(in_flight) or (failure is None and len(pending)):
+            if failure is None:
+                for i in list(pending):
+                    if len(in_flight) >= max_parallel:
+                        break
+                    if not dependencies[i].issubset(updates):
+                        continue
+                    pending.remove(i)
+                    step, step_dir = planned[i]
+                    step.state_in.set_result(
+                        self.__apply_updates(
+                            initial_state, [updates[j] for j in sorted(ancestors[i])]
+                        )
+                    )
+                    self.progress_bar.start_stage(step.name)
+                    in_flight[self.start_step_async(step, step_dir=step_dir)] = i
+
+            # Steps only ever depend on earlier steps, so the earliest pending
+            # step is always either running or ready to run
+            assert len(in_flight), "Parallel flow has deadlocked"
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda future: in_flight[future]):
+                i = in_flight.pop(future)
+                step, _ = planned[i]
+                state_in = step.state_in.result()
+                try:
+                    state_out = future.result()
+                    updates[i] = (
+                        {
+                            key: value
+                            for key, value in state_out.items()
+                            if state_in.get(key) != value
+                        },
+                        {
+                            key: value
+                            for key, value in state_out.metrics.items()
+                            if state_in.metrics.get(key) != value
+                        },
+                    )
+                except StepException as e:
+                    failure = failure or FlowException(str(e))
+                    continue
+                except DeferredStepError as e:
+                    deferred_errors.append(str(e))
+                    updates[i] = ({}, {})
+                except StepError as e:
+                    failure = failure or FlowError(str(e))
+                    continue
+                self.progress_bar.end_stage()
+
+        if failure is not None:
+            raise failure
+
+        return self.__apply_updates(
+            initial_state, [updates[i] for i in range(len(planned))]
+        )
+
+    @staticmethod
+    def __apply_updates(
+        state: State,
+        updates: List[Tuple[dict, dict]],
+    ) -> State:
+        views_updates: dict = {}
+        metrics_updates: dict = {}
+        for views_update, metrics_update in updates:
+            views_updates.update(views_update)
+            metrics_updates.update(metrics_update)
+        return state.__class__(
+            state,
+            overrides=views_updates,
+            metrics=GenericImmutableDict(state.metrics, overrides=metrics_updates),
+        )
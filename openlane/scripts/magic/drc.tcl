@@ -25,6 +25,9 @@ if { $::env(MAGIC_DRC_USE_GDS) } {
 set report_dir $::env(STEP_DIR)/reports
 
 set drc_rpt_path $report_dir/drc_violations.magic.rpt
+if { [info exists ::env(_DRC_REPORT)] } {
+    set drc_rpt_path $::env(_DRC_REPORT)
+}
 set fout [open $drc_rpt_path w]
 set oscale [cif scale out]
 set cell_name $::env(DESIGN_NAME)
@@ -33,6 +36,12 @@ puts stdout "\[INFO\] Loading $cell_name\n"
 flush stdout
 load $cell_name
 select top cell
+if { [info exists ::env(_DRC_WINDOW)] } {
+    # Only check (and report) the area of one tile
+    lassign $::env(_DRC_WINDOW) llx lly urx ury
+    puts stdout "\[INFO\] Checking window ($llx, $lly) - ($urx, $ury)\n"
+    box values ${llx}um ${lly}um ${urx}um ${ury}um
+}
 drc euclidean on
 drc style drc(full)
 drc check
@@ -68,6 +77,10 @@ puts stdout "\[INFO\] Should be divided by 3 or 4"
 puts stdout "\[INFO\] DRC Checking DONE ($drc_rpt_path)"
 flush stdout
 
+if { [info exists ::env(_DRC_WINDOW)] } {
+    exit 0
+}
+
 set views_dir $::env(STEP_DIR)/views
 file mkdir $views_dir
 
@@ -15,6 +15,7 @@
 import odb
 from openroad import Tech, Design
 
+import os
 import re
 import sys
 import json
@@ -23,7 +24,7 @@ import inspect
 import functools
 from decimal import Decimal
 from fnmatch import fnmatch
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
 
 # -- START: Environment Fixes
 try:
@@ -51,13 +52,18 @@ auto_handled_output_opts = [f"output_{key}" for key in write_fn]
 
 
 class OdbReader(object):
+    # Set by server.py to the path of the database already loaded in memory,
+    # which is then not read again
+    resident: Optional[str] = None
+
     def __init__(self, *args, **kwargs):
         self.ord_tech = Tech()
         self.design = Design(self.ord_tech)
 
         if len(args) == 1:
             db_in = args[0]
-            self.design.readDb(db_in)
+            if OdbReader.resident != os.path.realpath(db_in):
+                self.design.readDb(db_in)
         elif len(args) == 2:
             lef_in, def_in = args
             if not (isinstance(lef_in, list) or isinstance(lef_in, tuple)):
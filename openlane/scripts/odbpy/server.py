@@ -0,0 +1,161 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# A long-lived OpenROAD process that runs odbpy scripts on request, keeping the
+# design database in memory between requests.
+#
+# * ``serve`` is run by OpenROAD (``openroad -python server.py serve <socket>``)
+# * ``run`` is run by a regular Python interpreter, forwarding a single
+#   invocation of an odbpy script to the server and relaying its output and
+#   exit code as if it were the OpenROAD process itself.
+#
+# Only ``run`` may be invoked outside of OpenROAD.
+import os
+import sys
+import json
+import socket
+import traceback
+
+import click
+
+EXIT_LOCUS = "%OL_ODB_SERVER_EXIT"
+
+
+def handle_request(connection: socket.socket, request: dict) -> int:
+    import runpy
+    import ctypes
+
+    import utl
+    from reader import OdbReader
+
+    libc = ctypes.CDLL(None)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    libc.fflush(None)
+    saved_stdout, saved_stderr = os.dup(1), os.dup(2)
+    os.dup2(connection.fileno(), 1)
+    os.dup2(connection.fileno(), 2)
+
+    os.environ.clear()
+    os.environ.update(request["env"])
+    os.chdir(request["cwd"])
+    OdbReader.resident = request["reuse_db"]
+    metrics_path = request["metrics"]
+    if metrics_path is not None:
+        utl.open_metrics(metrics_path)
+
+    argv = request["argv"]
+    sys.argv = argv
+    returncode = 0
+    try:
+        runpy.run_path(argv[0], run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            returncode = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except BaseException:
+        traceback.print_exc()
+        returncode = 1
+    finally:
+        OdbReader.resident = None
+        if metrics_path is not None:
+            utl.close_metrics(metrics_path)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        libc.fflush(None)
+        os.dup2(saved_stdout, 1)
+        os.dup2(saved_stderr, 2)
+        os.close(saved_stdout)
+        os.close(saved_stderr)
+
+    return returncode
+
+
+@click.group()
+def cli():
+    pass
+
+
+@click.command()
+@click.argument("socket_path")
+def serve(socket_path):
+    import utl
+
+    if not (hasattr(utl, "open_metrics") and hasattr(utl, "close_metrics")):
+        print(
+            "This version of OpenROAD does not support redirecting metrics.",
+            file=sys.stderr,
+        )
+        exit(1)
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+    while True:
+        connection, _ = server.accept()
+        with connection:
+            request = json.loads(connection.makefile("r", encoding="utf8").readline())
+            if request.get("shutdown"):
+                break
+            returncode = handle_request(connection, request)
+            connection.sendall(f"{EXIT_LOCUS} {returncode}\n".encode("utf8"))
+    server.close()
+
+
+cli.add_command(serve)
+
+
+@click.command(context_settings={"ignore_unknown_options": True})
+@click.option("--socket", "socket_path", required=True)
+@click.option("--metrics", "metrics_path", default=None)
+@click.option("--reuse-db", default=None)
+@click.argument("argv", nargs=-1, type=click.UNPROCESSED, required=True)
+def run(socket_path, metrics_path, reuse_db, argv):
+    request = {
+        "argv": list(argv),
+        "env": dict(os.environ),
+        "cwd": os.getcwd(),
+        "metrics": metrics_path and os.path.abspath(metrics_path),
+        "reuse_db": reuse_db,
+    }
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.connect(socket_path)
+    connection.sendall((json.dumps(request) + "\n").encode("utf8"))
+
+    returncode = None
+    with connection.makefile("r", encoding="utf8") as f:
+        for line in f:
+            if (index := line.find(EXIT_LOCUS)) != -1:
+                sys.stdout.write(line[:index])
+                returncode = int(line[index + len(EXIT_LOCUS) :].strip())
+                break
+            sys.stdout.write(line)
+    sys.stdout.flush()
+
+    if returncode is None:
+        print("OpenROAD server terminated unexpectedly.", file=sys.stderr)
+        exit(1)
+    exit(returncode)
+
+
+cli.add_command(run)
+
+
+if __name__ == "__main__":
+    cli()
@@ -144,29 +144,62 @@ proc read_current_netlist {args} {
     read_current_sdc
 }
 
+proc get_sta_corner_names {} {
+    # Multiple corners may be analyzed by a single process, in which case the
+    # per-corner file lists are suffixed with __<corner name>
+    if { [info exists ::env(_CURRENT_CORNER_NAMES)] } {
+        return $::env(_CURRENT_CORNER_NAMES)
+    }
+    if { [info exists ::env(_CURRENT_CORNER_NAME)] } {
+        return [list $::env(_CURRENT_CORNER_NAME)]
+    }
+    return {}
+}
+
+proc select_sta_corner {corner_name} {
+    if { ![info exists ::env(_CURRENT_CORNER_NAMES)] } {
+        return
+    }
+    foreach key {
+        _CURRENT_CORNER_LIBS
+        _CURRENT_CORNER_SPEFS
+        _CURRENT_CORNER_EXTRA_SPEFS_BACKCOMPAT
+        _CURRENT_SPEF_BY_CORNER
+    } {
+        unset -nocomplain ::env($key)
+        if { [info exists ::env(${key}__$corner_name)] } {
+            set ::env($key) $::env(${key}__$corner_name)
+        }
+    }
+    set ::env(_CURRENT_CORNER_NAME) $corner_name
+}
+
 proc read_timing_info {args} {
     sta::parse_key_args "read_timing_info" args \
         keys {}\
         flags {-powered}
 
-    if { ![info exists ::env(_CURRENT_CORNER_NAME)] } {
+    set corner_names [get_sta_corner_names]
+    if { [llength $corner_names] == 0 } {
         return
     }
-    set corner_name $::env(_CURRENT_CORNER_NAME)
-    define_corners $corner_name
+    define_corners {*}$corner_names
 
-    puts "Reading timing models for corner $corner_name…"
+    foreach corner_name $corner_names {
+        select_sta_corner $corner_name
+        puts "Reading timing models for corner $corner_name…"
 
-    foreach lib $::env(_CURRENT_CORNER_LIBS) {
-        puts "Reading cell library for the '$corner_name' corner at '$lib'…"
-        read_liberty -corner $corner_name $lib
-    }
+        foreach lib $::env(_CURRENT_CORNER_LIBS) {
+            puts "Reading cell library for the '$corner_name' corner at '$lib'…"
+            read_liberty -corner $corner_name $lib
+        }
 
-    if { [info exists ::env(EXTRA_LIBS) ] } {
-        puts "Reading explicitly-specified extra libs for $corner_name…"
-        foreach extra_lib $::env(EXTRA_LIBS) {
-            puts "Reading extra timing library for the '$corner_name' corner at '$extra_lib'…"
-            read_liberty -corner $corner_name $extra_lib
+        if { [info exists ::env(EXTRA_LIBS) ] } {
+            puts "Reading explicitly-specified extra libs for $corner_name…"
+            foreach extra_lib $::env(EXTRA_LIBS) {
+                puts "Reading extra timing library for the '$corner_name' corner at '$extra_lib'…"
+                read_liberty -corner $corner_name $extra_lib
+            }
         }
     }
 
@@ -208,34 +241,34 @@ proc lshift {inputlist} {
 }
 
 proc read_spefs {} {
-    if { [info exists ::env(_CURRENT_SPEF_BY_CORNER)] } {
-        set corner_name $::env(_CURRENT_CORNER_NAME)
-        puts "Reading top-level design parasitics for the '$corner_name' corner at '$::env(_CURRENT_SPEF_BY_CORNER)'…"
-        read_spef -corner $corner_name $::env(_CURRENT_SPEF_BY_CORNER)
-    }
-    if { [info exists ::env(_CURRENT_CORNER_SPEFS)] } {
-        set corner_name $::env(_CURRENT_CORNER_NAME)
-        foreach spefs $::env(_CURRENT_CORNER_SPEFS) {
-            set instance_path [lshift spefs]
-            foreach spef $spefs {
-                puts "Reading '$instance_path' parasitics for the '$corner_name' corner at '$spef'…"
-                read_spef -corner $corner_name -path $instance_path $spef
-            }
+    foreach corner_name [get_sta_corner_names] {
+        select_sta_corner $corner_name
+        if { [info exists ::env(_CURRENT_SPEF_BY_CORNER)] } {
+            puts "Reading top-level design parasitics for the '$corner_name' corner at '$::env(_CURRENT_SPEF_BY_CORNER)'…"
+            read_spef -corner $corner_name $::env(_CURRENT_SPEF_BY_CORNER)
         }
-    }
-    if { [info exists ::env(_CURRENT_CORNER_EXTRA_SPEFS_BACKCOMPAT)] } {
-        set corner_name $::env(_CURRENT_CORNER_NAME)
-        foreach pair $::env(_CURRENT_CORNER_EXTRA_SPEFS_BACKCOMPAT) {
-            set module_name [lindex $pair 0]
-            set spef [lindex $pair 1]
-            foreach cell [get_cells * -hierarchical] {
-                if { "[get_property $cell ref_name]" eq "$module_name"} {
-                    set instance_path [get_property $cell full_name]
+        if { [info exists ::env(_CURRENT_CORNER_SPEFS)] } {
+            foreach spefs $::env(_CURRENT_CORNER_SPEFS) {
+                set instance_path [lshift spefs]
+                foreach spef $spefs {
                     puts "Reading '$instance_path' parasitics for the '$corner_name' corner at '$spef'…"
                     read_spef -corner $corner_name -path $instance_path $spef
                 }
             }
         }
+        if { [info exists ::env(_CURRENT_CORNER_EXTRA_SPEFS_BACKCOMPAT)] } {
+            foreach pair $::env(_CURRENT_CORNER_EXTRA_SPEFS_BACKCOMPAT) {
+                set module_name [lindex $pair 0]
+                set spef [lindex $pair 1]
+                foreach cell [get_cells * -hierarchical] {
+                    if { "[get_property $cell ref_name]" eq "$module_name"} {
+                        set instance_path [get_property $cell full_name]
+                        puts "Reading '$instance_path' parasitics for the '$corner_name' corner at '$spef'…"
+                        read_spef -corner $corner_name -path $instance_path $spef
+                    }
+                }
+            }
+        }
     }
 }
 
@@ -405,6 +438,14 @@ proc write_views {args} {
     }
 }
 
+proc get_corner_save_dir {save_dir corner_name} {
+    # With multiple corners per process, each corner has its own subdirectory
+    if { [info exists ::env(_CURRENT_CORNER_NAMES)] } {
+        return $save_dir/$corner_name
+    }
+    return $save_dir
+}
+
 proc write_sdfs {} {
     if { [info exists ::env(_SDF_SAVE_DIR)] } {
         set corners [sta::corners]
@@ -412,7 +453,7 @@ proc write_sdfs {} {
         puts "Writing SDF files for all corners…"
         foreach corner $corners {
             set corner_name [$corner name]
-            set target $::env(_SDF_SAVE_DIR)/$::env(DESIGN_NAME)__$corner_name.sdf
+            set target [get_corner_save_dir $::env(_SDF_SAVE_DIR) $corner_name]/$::env(DESIGN_NAME)__$corner_name.sdf
             write_sdf -include_typ -divider . -corner $corner_name $target
         }
     }
@@ -428,7 +469,7 @@ proc write_libs {} {
         puts "Writing timing models for all corners…"
         foreach corner $corners {
             set corner_name [$corner name]
-            set target $::env(_LIB_SAVE_DIR)/$::env(DESIGN_NAME)__$corner_name.lib
+            set target [get_corner_save_dir $::env(_LIB_SAVE_DIR) $corner_name]/$::env(DESIGN_NAME)__$corner_name.lib
             puts "Writing timing models for the $corner_name corner to $target…"
             write_timing_model -corner $corner_name $target
         }
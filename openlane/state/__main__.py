@@ -12,13 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import sys
-import json
 from typing import Optional
 
 import cloup
 
-from ..common import get_latest_file
+from ..common import AnyPath, RunManifest, get_latest_file
 from ..common.cli import formatter_settings
+from .state import State, InvalidState
 
 
 @cloup.group(
@@ -38,16 +38,23 @@ def cli():
 def latest(extract_metrics_to: Optional[str], run_dir: str):
     exit_code = 0
 
-    if latest_state := get_latest_file(run_dir, "state_*.json"):
+    manifest = RunManifest(run_dir)
+    latest_state: Optional[AnyPath]
+    if manifest.exists():
+        latest_state = manifest.get_latest_state()
+    else:
+        latest_state = get_latest_file(run_dir, "state_*.json")
+
+    if latest_state:
         try:
-            state = json.load(open(latest_state, encoding="utf8"))
-        except json.JSONDecodeError as e:
+            state = State.load(latest_state, validate_path=False)
+        except InvalidState as e:
             print(f"Latest state at {latest_state} is invalid: {e}", file=sys.stderr)
             exit(1)
-        metrics = state["metrics"]
         print(latest_state, end="")
         if output := extract_metrics_to:
-            json.dump(metrics, open(output, "w", encoding="utf8"))
+            with open(output, "w", encoding="utf8") as f:
+                f.write(state.metrics.dumps(indent=None))
     else:
         print("No state_*.json files found", file=sys.stderr)
         exit_code = 1
@@ -55,7 +62,57 @@ def latest(extract_metrics_to: Optional[str], run_dir: str):
     exit(exit_code)
 
 
+@cloup.command()
+@cloup.argument("run_dir")
+def steps(run_dir: str):
+    """
+    Lists the steps of a run as recorded in its manifest: one line per step
+    with its ordinal, ID, status, runtime in seconds and directory, separated
+    by tabs.
+    """
+    manifest = RunManifest(run_dir)
+    if not manifest.exists():
+        print(f"No run manifest found in {run_dir}", file=sys.stderr)
+        exit(1)
+
+    for entry in manifest.get_entries():
+        runtime = "" if entry.runtime is None else f"{entry.runtime:.2f}"
+        print(
+            "\t".join(
+                [str(entry.ordinal), entry.id or "", entry.status, runtime, entry.dir]
+            )
+        )
+
+
+@cloup.command()
+@cloup.option(
+    "-o",
+    "--output",
+    default=None,
+    help="The file to write the state to. If unset, the state is printed.",
+)
+@cloup.argument("state_json")
+def materialize(output: Optional[str], state_json: str):
+    """
+    Writes the full state stored in STATE_JSON, resolving any deltas against
+    the states it was saved against.
+    """
+    try:
+        state = State.load(state_json, validate_path=False)
+    except InvalidState as e:
+        print(f"State at {state_json} is invalid: {e}", file=sys.stderr)
+        exit(1)
+
+    if output is None:
+        print(state.dumps())
+    else:
+        with open(output, "w", encoding="utf8") as f:
+            f.write(state.dumps())
+
+
 cli.add_command(latest)
+cli.add_command(steps)
+cli.add_command(materialize)
 
 if __name__ == "__main__":
     cli()
@@ -16,9 +16,20 @@ from __future__ import annotations
 import os
 import sys
 import json
-import shutil
+import threading
 from decimal import Decimal
-from typing import Callable, List, Mapping, Tuple, Union, Optional, Dict, Any
+from typing import (
+    Callable,
+    ClassVar,
+    List,
+    Mapping,
+    Set,
+    Tuple,
+    Union,
+    Optional,
+    Dict,
+    Any,
+)
 
 from .design_format import (
     DesignFormat,
@@ -29,7 +40,10 @@ from ..common import (
     Path,
     GenericImmutableDict,
     mkdirp,
-    copy_recursive,
+    format_size,
+    clone_files,
+    CloneMode,
+    AnyPath,
 )
 from ..logging import info
 
@@ -57,7 +71,7 @@ class State(GenericImmutableDict[str, StateElement]):
             overrides={
                 …
             },
-            metrics=GenericImmutableDict(copying=state_a.metrics, overrides={
+            metrics=GenericImmutableDict(state_a.metrics, overrides={
                 …
             })
         )
@@ -66,6 +80,14 @@ class State(GenericImmutableDict[str, StateElement]):
     own: after executing a Step, you only return your deltas and then the Flow
     is responsible for the creation of a new Step object.
 
+    A State created from another State (and metrics created from other
+    immutable metrics) share their contents with the original and only store
+    the overrides, so deriving states costs O(changes).
+
+    Likewise, :meth:`save` may optionally write a State as a delta against a
+    State that was previously saved or loaded, which :meth:`load` resolves
+    transparently.
+
     :param copying: A mutable or immutable mapping to use as the starting
         value for this State.
     :param overrides: A mutable or immutable mapping to override the starting
@@ -75,6 +97,14 @@ class State(GenericImmutableDict[str, StateElement]):
         it passed a certain check or not.
     """
 
+    #: The maximum number of deltas between a saved state and a full state.
+    #: Set to ``0`` to always save full states.
+    max_delta_depth: ClassVar[int] = 16
+    base_key: ClassVar[str] = "__base__"
+
+    __origin: Optional[Tuple[str, int]] = None
+    __origin_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         copying: Optional[
@@ -87,18 +117,25 @@ class State(GenericImmutableDict[str, StateElement]):
         metrics: Optional[Mapping[str, Any]] = None,
         **kwargs,
     ) -> None:
-        copying_resolved: Dict[str, StateElement] = {}
-        if c_mapping := copying:
-            for key, value in c_mapping.items():
-                if isinstance(key, DesignFormat):
-                    copying_resolved[key.value.id] = value
-                else:
-                    copying_resolved[key] = value
-
-        for format in DesignFormat:
-            assert isinstance(format.value, DesignFormatObject)  # type checker shut up
-            if format.value.id not in copying_resolved:
-                copying_resolved[format.value.id] = None
+        copying_resolved: Mapping[str, StateElement]
+        if isinstance(copying, State):
+            # Already resolved and immutable: shared instead of copied
+            copying_resolved = copying
+        else:
+            copying_resolved = {}
+            if c_mapping := copying:
+                for key, value in c_mapping.items():
+                    if isinstance(key, DesignFormat):
+                        copying_resolved[key.value.id] = value
+                    else:
+                        copying_resolved[key] = value
+
+            for format in DesignFormat:
+                assert isinstance(
+                    format.value, DesignFormatObject
+                )  # type checker shut up
+                if format.value.id not in copying_resolved:
+                    copying_resolved[format.value.id] = None
 
         overrides_resolved = {}
         if o_mapping := overrides:
@@ -110,7 +147,11 @@ class State(GenericImmutableDict[str, StateElement]):
                     k = k.value.id
                 overrides_resolved[k] = value
 
-        self.metrics = GenericImmutableDict(metrics or {})
+        if type(metrics) is GenericImmutableDict:
+            # Immutable: shared instead of copied
+            self.metrics = metrics
+        else:
+            self.metrics = GenericImmutableDict(metrics or {})
 
         super().__init__(
             copying_resolved,
@@ -144,11 +185,7 @@ class State(GenericImmutableDict[str, StateElement]):
         return final
 
     def copy(self: "State") -> "State":
-        metrics: GenericImmutableDict[str, Any] = GenericImmutableDict(
-            copy_recursive(self.metrics)
-        )
-        new = State(self, metrics=metrics)
-        return new
+        return State(self, metrics=self.metrics)
 
     def _walk(
         self,
@@ -193,25 +230,37 @@ class State(GenericImmutableDict[str, StateElement]):
                         depth + 1,
                     )
 
-    def save_snapshot(self, path: Union[str, os.PathLike]):
+    def save_snapshot(
+        self,
+        path: Union[str, os.PathLike],
+        mode: CloneMode = "reflink",
+    ):
         """
         Validates the current state then saves all views to a folder by
         design format, including the metrics.
 
         :param path: The folder that would contain other folders.
+        :param mode: How the views are saved. See
+            :data:`openlane.common.CloneMode`.
         """
+        pairs: List[Tuple[AnyPath, AnyPath]] = []
 
         def visitor(key, value, top_key, save_directory, depth):
             if not isinstance(value, Path):
                 return
             mkdirp(save_directory)
             target_path = os.path.join(save_directory, os.path.basename(value))
-            shutil.copyfile(value, target_path, follow_symlinks=True)
+            pairs.append((value, target_path))
 
         self.validate()
         info(f"Saving views to '{os.path.abspath(path)}'…")
         mkdirp(path)
         self._walk(self, path, visitor)
+        stats = clone_files(pairs, mode)
+        if stats.bytes_saved != 0:
+            info(
+                f"Saved {format_size(stats.bytes_saved)} of {format_size(stats.bytes_total)} by linking views instead of copying them."
+            )
         metrics_csv_path = os.path.join(path, "metrics.csv")
         with open(metrics_csv_path, "w", encoding="utf8") as f:
             f.write("Metric,Value\n")
@@ -274,7 +323,7 @@ class State(GenericImmutableDict[str, StateElement]):
         return target
 
     @classmethod
-    def loads(Self, json_in: str, validate_path: bool = True) -> "State":
+    def __parse_raw(Self, json_in: str) -> dict:
         try:
             raw = json.loads(json_in, parse_float=Decimal)
         except json.JSONDecodeError as e:
@@ -283,15 +332,150 @@ class State(GenericImmutableDict[str, StateElement]):
         if not isinstance(raw, dict):
             raise InvalidState("Failed to load state: JSON result is not a dictionary")
 
+        return raw
+
+    @classmethod
+    def __from_raw(Self, raw: dict, validate_path: bool) -> "State":
         metrics = raw.get("metrics")
         if metrics is not None:
             del raw["metrics"]
 
         views = Self.__loads_recursive(raw, validate_path)
-        state = Self(views, metrics=metrics)
+        return Self(views, metrics=metrics)
+
+    @classmethod
+    def loads(Self, json_in: str, validate_path: bool = True) -> "State":
+        raw = Self.__parse_raw(json_in)
+        if Self.base_key in raw:
+            raise InvalidState(
+                "Failed to load state: delta-encoded states must be loaded from a file using State.load"
+            )
+
+        return Self.__from_raw(raw, validate_path)
+
+    @classmethod
+    def __load_raw(Self, path: str, visited: Set[str]) -> Tuple[dict, int]:
+        if path in visited:
+            raise InvalidState(f"Failed to load state: '{path}' references itself")
+        visited.add(path)
 
+        try:
+            json_in = open(path, encoding="utf8").read()
+        except OSError as e:
+            raise InvalidState(f"Failed to read state at '{path}': {e}")
+        raw = Self.__parse_raw(json_in)
+
+        base_path = raw.pop(Self.base_key, None)
+        if base_path is None:
+            return raw, 0
+
+        base_path = os.path.normpath(os.path.join(os.path.dirname(path), base_path))
+        resolved, depth = Self.__load_raw(base_path, visited)
+        metrics_delta = raw.pop("metrics", None) or {}
+        resolved.update(raw)
+        resolved["metrics"] = {**(resolved.get("metrics") or {}), **metrics_delta}
+        return resolved, depth + 1
+
+    @classmethod
+    def load(
+        Self,
+        path: Union[str, os.PathLike],
+        validate_path: bool = True,
+    ) -> "State":
+        """
+        Loads a state from a file created by :meth:`save`, resolving any
+        deltas against the states they were saved against.
+
+        Files containing full states, i.e., those created by older versions
+        of OpenLane, are also supported.
+
+        :param path: The path to the state's JSON file.
+        :param validate_path: Whether to check that the state's views exist.
+        :returns: The loaded state.
+        """
+        path = os.path.abspath(path)
+        raw, depth = Self.__load_raw(path, set())
+        state = Self.__from_raw(raw, validate_path)
+        state.__set_origin(path, depth)
         return state
 
+    def __set_origin(self, path: str, depth: int):
+        with State.__origin_lock:
+            if self.__origin is None:
+                object.__setattr__(self, "_State__origin", (path, depth))
+
+    def __get_delta(self, base: "State") -> Optional[Dict[str, Any]]:
+        if not set(base.keys()).issubset(self.keys()) or not set(
+            base.metrics.keys()
+        ).issubset(self.metrics.keys()):
+            # Deltas can only add or modify keys
+            return None
+
+        delta: Dict[str, Any] = {
+            key: value
+            for key, value in self.items()
+            if key not in base or base[key] != value
+        }
+        delta["metrics"] = {
+            key: value
+            for key, value in self.metrics.items()
+            if key not in base.metrics or base.metrics[key] != value
+        }
+        return delta
+
+    def save(
+        self,
+        path: Union[str, os.PathLike],
+        base: Optional["State"] = None,
+        delta_root: Optional[Union[str, os.PathLike]] = None,
+    ):
+        """
+        Saves the state to a JSON file, which may be loaded using :meth:`load`.
+
+        The full state is written unless ``delta_root`` is set. If it is, and
+        ``base`` (or this state itself) has previously been saved to or loaded
+        from a file inside ``delta_root``, only the views and metrics that
+        differ from it are written alongside a relative reference to its file,
+        unless that would require more than :attr:`max_delta_depth` files to be
+        read to reconstruct the full state.
+
+        :param path: The path to the JSON file to create.
+        :param base: A state to write the delta against. If unset, a state that
+            has been saved or loaded before is saved as a reference to its
+            existing file.
+        :param delta_root: A directory the files of base states must be in for
+            a delta to be written, e.g. that of the current run. Deltas are not
+            written if unset.
+        """
+        path = os.path.abspath(path)
+        base = base or self
+
+        delta = None
+        depth = 0
+        if delta_root is not None and (origin := base.__origin):
+            base_path, base_depth = origin
+            delta_root = os.path.abspath(delta_root)
+            if (
+                base_path != path
+                and base_depth < self.max_delta_depth
+                and os.path.commonpath([base_path, delta_root]) == delta_root
+            ):
+                delta = self.__get_delta(base)
+                depth = base_depth + 1
+
+        with open(path, "w", encoding="utf8") as f:
+            if delta is None:
+                depth = 0
+                f.write(self.dumps())
+            else:
+                delta = {
+                    self.base_key: os.path.relpath(base_path, os.path.dirname(path)),
+                    **delta,
+                }
+                f.write(json.dumps(delta, cls=self.get_encoder(), indent=4))
+
+        self.__set_origin(path, depth)
+
     def __mapping_to_html_rec(
         self,
         mapping: Mapping[str, Any],
@@ -29,7 +29,11 @@ from .step import (
     DefaultOutputProcessor,
     MetricsUpdate,
     ViewsUpdate,
+    ViewMaterializer,
+    view_materializers,
+    materialize_views,
 )
+from .cache import StepCache, get_step_cache, set_step_cache
 from .tclstep import TclStep
 from . import checker as Checker
 
@@ -49,6 +53,7 @@ from .openroad import OpenROADStep
 
 from . import odb as Odb
 from .odb import OdbpyStep
+from .odb_server import OdbServer
 
 from . import magic as Magic
 from .magic import MagicStep
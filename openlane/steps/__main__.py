@@ -121,6 +121,8 @@ o = partial(option, show_default=True)
     run_options=False,
     sequential_flow_controls=False,
     jobs=False,
+    step_cache=False,
+    odb_server=False,
     accept_config_files=False,
 )
 @pass_context
@@ -0,0 +1,257 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import os
+import json
+import uuid
+import shutil
+import hashlib
+from decimal import Decimal
+from dataclasses import fields, is_dataclass
+from typing import Any, ClassVar, Dict, Optional, Tuple, TYPE_CHECKING
+
+from ..__version__ import __version__
+from ..common import (
+    GenericDict,
+    GenericDictEncoder,
+    Filter,
+    Path,
+    get_file_digest,
+    mkdirp,
+)
+from ..logging import debug
+from ..state import State, DesignFormat
+
+if TYPE_CHECKING:
+    from .step import Step
+
+# Written by Step.start() regardless of whether the result was cached or not
+_STEP_METADATA_FILES = ["state_in.json", "config.json", "state_out.json", "runtime.txt"]
+
+
+class StepCache(object):
+    """
+    An on-disk, content-addressed cache for the results of :class:`Step`\\s.
+
+    Results are keyed on a hash of:
+
+    * The OpenLane version and the ``PATH`` environment variable, the latter
+      standing in for the versions of the underlying tools (e.g. Nix store paths)
+    * The Step's implementation ID
+    * The Step's configuration, including the contents of any files it refers to
+    * The contents of every view in the input state, as well as the metrics
+      the Step may read (see :attr:`Step.metrics_in`)
+
+    On a hit, the files generated by the previous run of the Step are restored
+    into the new step directory, alongside the views and metrics it updated,
+    and the Step is not run.
+
+    Entries are written atomically, so multiple flows may safely share the same
+    cache directory.
+
+    :param path: The directory to store cached results in.
+    """
+
+    format_version: ClassVar[int] = 1
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+
+    @classmethod
+    def get_file_digest(Self, path: str) -> str:
+        """
+        :param path: The path to a file
+        :returns: The SHA-256 digest of the file's contents. Results are memoized
+            for the lifetime of the process as long as the file's size and
+            modification time do not change.
+        """
+        return get_file_digest(path)
+
+    def __fingerprint(self, value: Any) -> Any:
+        if isinstance(value, Path):
+            if os.path.isfile(value):
+                return f"sha256:{self.get_file_digest(str(value))}"
+            return str(value)
+        elif isinstance(value, (dict, GenericDict)):
+            return {str(k): self.__fingerprint(v) for k, v in value.items()}
+        elif isinstance(value, (list, tuple)):
+            return [self.__fingerprint(element) for element in value]
+        elif not isinstance(value, type) and is_dataclass(value):
+            return {
+                field.name: self.__fingerprint(getattr(value, field.name))
+                for field in fields(value)
+            }
+        return value
+
+    def get_key(self, step: Step, state_in: State) -> str:
+        """
+        :param step: The step object to be run
+        :param state_in: The step's (resolved) input state
+        :returns: A key uniquely identifying the results of running this step
+            with this input state.
+        """
+        metrics: Dict[str, Any] = state_in.metrics.to_raw_dict()
+        if step.metrics_in is not None:
+            metrics_filter = Filter(step.metrics_in)
+            metrics = {k: v for k, v in metrics.items() if metrics_filter.match(k)}
+        components = {
+            "cache_format": self.format_version,
+            "openlane_version": __version__,
+            "path": os.getenv("PATH"),
+            "step": step.__class__.get_implementation_id(),
+            "config": self.__fingerprint(step.config.to_raw_dict()),
+            "views": self.__fingerprint(state_in.to_raw_dict(metrics=False)),
+            "metrics": metrics,
+        }
+        serialized = json.dumps(components, cls=GenericDictEncoder, sort_keys=True)
+        return hashlib.sha256(serialized.encode("utf8")).hexdigest()
+
+    def __entry_dir(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key)
+
+    def restore(
+        self,
+        key: str,
+        step_dir: str,
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Restores a cached result, if it exists, into a step directory.
+
+        :param key: The key returned by :meth:`get_key`
+        :param step_dir: The (new) step directory
+        :returns: A tuple of views and metrics updates if the key is found,
+            otherwise ``None``.
+        """
+        entry_dir = self.__entry_dir(key)
+        result_path = os.path.join(entry_dir, "result.json")
+        try:
+            with open(result_path, encoding="utf8") as f:
+                result = json.load(f, parse_float=Decimal)
+        except FileNotFoundError:
+            return None
+
+        shutil.copytree(
+            os.path.join(entry_dir, "files"),
+            step_dir,
+            symlinks=True,
+            dirs_exist_ok=True,
+        )
+
+        def relocate(value: Any) -> Any:
+            if isinstance(value, str):
+                return Path(os.path.join(step_dir, value))
+            elif isinstance(value, list):
+                return [relocate(element) for element in value]
+            elif isinstance(value, dict):
+                return {k: relocate(v) for k, v in value.items()}
+            return value
+
+        return relocate(result["views"]), result["metrics"]
+
+    def store(
+        self,
+        key: str,
+        step_dir: str,
+        views_updates: Dict[Any, Any],
+        metrics_updates: Dict[str, Any],
+    ) -> bool:
+        """
+        Stores the result of a step in the cache.
+
+        Results with views outside of the step directory cannot be cached.
+
+        :param key: The key returned by :meth:`get_key`
+        :param step_dir: The step directory
+        :param views_updates: The views updated by the step
+        :param metrics_updates: The metrics updated by the step
+        :returns: Whether the result has been stored or not.
+        """
+        step_dir_real = os.path.realpath(step_dir)
+
+        class NotCacheable(Exception):
+            pass
+
+        def relativize(value: Any) -> Any:
+            if isinstance(value, Path):
+                relative = os.path.relpath(os.path.realpath(value), step_dir_real)
+                if relative.startswith(os.pardir):
+                    raise NotCacheable(str(value))
+                return relative
+            elif isinstance(value, list):
+                return [relativize(element) for element in value]
+            elif isinstance(value, dict):
+                return {k: relativize(v) for k, v in value.items()}
+            return value
+
+        try:
+            views = {}
+            for format, value in views_updates.items():
+                if isinstance(format, DesignFormat):
+                    format = format.value.id
+                views[format] = relativize(value)
+        except NotCacheable as e:
+            debug(f"Not caching result: view '{e}' is outside the step directory.")
+            return False
+
+        entry_dir = self.__entry_dir(key)
+        if os.path.exists(entry_dir):
+            return True
+
+        mkdirp(os.path.dirname(entry_dir))
+        staging_dir = os.path.join(os.path.dirname(entry_dir), f".{uuid.uuid4().hex}")
+        try:
+            shutil.copytree(
+                step_dir,
+                os.path.join(staging_dir, "files"),
+                symlinks=True,
+                ignore=lambda dir, _: (_STEP_METADATA_FILES if dir == step_dir else []),
+            )
+            with open(
+                os.path.join(staging_dir, "result.json"), "w", encoding="utf8"
+            ) as f:
+                json.dump(
+                    {"views": views, "metrics": metrics_updates},
+                    f,
+                    cls=GenericDictEncoder,
+                )
+            os.rename(staging_dir, entry_dir)
+        except OSError as e:
+            # Another process got to it first, or the cache is unwritable
+            debug(f"Failed to store result in cache: {e}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return os.path.exists(entry_dir)
+        return True
+
+
+_STEP_CACHE: Optional[StepCache] = None
+
+
+def set_step_cache(cache: Optional[StepCache]):
+    """
+    Sets (or unsets) the :class:`StepCache` used by all :class:`Step`\\s.
+
+    The cache is disabled by default.
+
+    :param cache: The step cache, or ``None`` to disable caching.
+    """
+    global _STEP_CACHE
+    _STEP_CACHE = cache
+
+
+def get_step_cache() -> Optional[StepCache]:
+    """
+    :returns: The :class:`StepCache` used by all :class:`Step`\\s, if set.
+    """
+    return _STEP_CACHE
@@ -22,7 +22,7 @@ from .step import ViewsUpdate, MetricsUpdate, Step, StepError, DeferredStepError
 
 from ..logging import info, debug, verbose
 from ..config import Variable
-from ..common import Filter, parse_metric_modifiers
+from ..common import Filter, MetricIndex
 from ..state import DesignFormat
 
 
@@ -39,6 +39,8 @@ class NetlistAssignStatements(Step):
 
     inputs = [DesignFormat.NETLIST]
     outputs = []
+    metrics_in = []
+    metrics_out = []
 
     config_vars = [
         Variable(
@@ -73,12 +75,26 @@ class MetricChecker(Step):
 
     inputs = []
     outputs = []
+    metrics_out = []
 
     metric_name: ClassVar[str] = NotImplemented
     metric_description: ClassVar[str] = NotImplemented
     deferred: ClassVar[bool] = True
     error_on_var: Optional[Variable] = None
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.metric_name is not NotImplemented:
+            cls.metrics_in = cls.get_metrics_in()
+
+    @classmethod
+    def get_metrics_in(cls) -> List[str]:
+        """
+        :returns: The names of the metrics read by this checker, used as its
+            ``metrics_in``.
+        """
+        return [cls.metric_name]
+
     @classmethod
     def get_help_md(Self, **kwargs):  # pragma: no cover
         threshold_string = Self.get_threshold_description(None)
@@ -482,6 +498,10 @@ class TimingViolations(MetricChecker):
             variable.default = cls.corner_override
         return variable
 
+    @classmethod
+    def get_metrics_in(cls) -> List[str]:
+        return [f"{cls.metric_name}__corner:*"]
+
     def get_corner_wildcards(self):
         wildcards = self.config.get(self.get_corner_variable().name) or self.config.get(
             self.base_corner_var_name
@@ -504,19 +524,19 @@ class TimingViolations(MetricChecker):
         if not threshold:
             threshold = Decimal(0)
 
+        base, _, modifier = metric_basename.rpartition("__")
+        metric_by_corner = MetricIndex(state_in.metrics.keys()).get_modifier_values(
+            base, modifier
+        )
         metrics = {
-            key: value
-            for key, value in state_in.metrics.items()
-            if metric_basename in key
+            corner: state_in.metrics[name] for corner, name in metric_by_corner.items()
         }
         debug("Metrics ▶")
         debug(metrics)
         if not metrics:
             self.warn(f"No metrics found for {metric_basename}.")
         else:
-            metric_corners = set(
-                [parse_metric_modifiers(key)[1]["corner"] for key in metrics.keys()]
-            )
+            metric_corners = set(metrics.keys())
 
             all_config_wildcards = set(self.get_corner_wildcards())
             corner_filter = Filter(all_config_wildcards)
@@ -531,11 +551,7 @@ class TimingViolations(MetricChecker):
             unmatched_corners = metric_corners - matched_corners
 
             all_violating_corners = set(
-                [
-                    corner
-                    for corner in metric_corners
-                    if metrics[f"{metric_basename}:{corner}"] > threshold
-                ]
+                [corner for corner in metric_corners if metrics[corner] > threshold]
             )
 
             matched_violating_corners = all_violating_corners.intersection(
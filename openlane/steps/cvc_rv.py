@@ -110,6 +110,7 @@ class ERC(Step):
         DesignFormat.SPICE,
     ]
     outputs = []
+    metrics_in = []
 
     config_vars = [
         Variable(
@@ -17,19 +17,31 @@ import site
 import shlex
 import shutil
 import subprocess
+from decimal import Decimal
 from os.path import abspath
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from base64 import b64encode
 from typing import Any, Dict, Optional, List, Sequence, Tuple, Union
 
 from .step import ViewsUpdate, MetricsUpdate, Step, StepError, StepException
 
 from ..config import Variable
-from ..logging import info
+from ..logging import debug, info
 from ..state import DesignFormat, State
-from ..common import Path, get_script_dir, mkdirp, _get_process_limit
+from ..common import (
+    Path,
+    Tile,
+    get_script_dir,
+    get_tiles,
+    mkdirp,
+    get_scheduler,
+    merge_klayout_xml,
+    DRC as DRCObject,
+)
 
 
 class KLayoutStep(Step):
+    metrics_in = []
     config_vars = [
         Variable(
             "KLAYOUT_TECH",
@@ -146,6 +158,7 @@ class Render(KLayoutStep):
 
     inputs = [DesignFormat.DEF]
     outputs = []
+    metrics_out = []
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         input_view = state_in[DesignFormat.DEF]
@@ -187,6 +200,7 @@ class StreamOut(KLayoutStep):
 
     inputs = [DesignFormat.DEF]
     outputs = [DesignFormat.GDS, DesignFormat.KLAYOUT_GDS]
+    metrics_out = []
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         views_updates: ViewsUpdate = {}
@@ -242,6 +256,20 @@ class XOR(KLayoutStep):
     Performs an XOR operation on the Magic and KLayout GDS views. The idea is:
     if there's any difference between the GDSII streams between the two tools,
     one of them have it wrong and that may lead to ambiguity.
+
+    If ``KLAYOUT_XOR_PARTITION_SIZE`` is set, the die area is partitioned into
+    square regions that are XORed by separate KLayout processes, each of which
+    also covers some overlap with its neighbors. Each difference is then only
+    reported by the partition containing its center, so differences smaller
+    than the overlap are counted exactly once, and the per-partition reports
+    are merged into a single report. As every process still loads both
+    layouts in full, partitions are XORed one at a time unless
+    ``KLAYOUT_XOR_WORKERS`` is set or previous runs have shown that enough
+    memory is available for more.
+
+    As any difference fails `the relevant checker <#Checker.XOR>`_, the
+    remaining partitions can be skipped once ``KLAYOUT_XOR_MAX_DIFFERENCES``
+    is exceeded, in which case the reported count is a lower bound.
     """
 
     id = "KLayout.XOR"
@@ -252,12 +280,14 @@ class XOR(KLayoutStep):
         DesignFormat.KLAYOUT_GDS,
     ]
     outputs = []
+    metrics_in = ["design__die__bbox"]
+    metrics_out = ["design__xor_difference__count"]
 
     config_vars = KLayoutStep.config_vars + [
         Variable(
             "KLAYOUT_XOR_THREADS",
             Optional[int],
-            "Specifies number of threads used in the KLayout XOR check. If unset, this will be equal to your machine's thread count.",
+            "Specifies number of threads used in the KLayout XOR check. If unset, this will be equal to the number of CPU slots available to OpenLane (see `--jobs`).",
         ),
         Variable(
             "KLAYOUT_XOR_IGNORE_LAYERS",
@@ -271,8 +301,145 @@ class XOR(KLayoutStep):
             "A tile size for the XOR process in µm.",
             pdk=True,
         ),
+        Variable(
+            "KLAYOUT_XOR_PARTITION_SIZE",
+            Optional[Decimal],
+            "If set, the die area is partitioned into square regions of this size, each of which is XORed by a separate KLayout process. Requires the `design__die__bbox` metric.",
+            units="µm",
+        ),
+        Variable(
+            "KLAYOUT_XOR_PARTITION_OVERLAP",
+            Decimal,
+            "How far beyond its partition each KLayout process XORs the layouts. Differences are only counted by the partition containing their center, so differences smaller than this are counted exactly once.",
+            default=10,
+            units="µm",
+        ),
+        Variable(
+            "KLAYOUT_XOR_WORKERS",
+            Optional[int],
+            "The number of partitions XORed in parallel when `KLAYOUT_XOR_PARTITION_SIZE` is set. The threads specified by `KLAYOUT_XOR_THREADS` are divided among them. As each process loads both layouts in full, if unset, this will be 1 unless the peak memory recorded for previous partitions allows for more.",
+        ),
+        Variable(
+            "KLAYOUT_XOR_MAX_DIFFERENCES",
+            Optional[int],
+            "When `KLAYOUT_XOR_PARTITION_SIZE` is set, partitions that have not started yet are skipped once more than this many differences have been found.",
+        ),
     ]
 
+    def __get_partitions(self, state_in: State) -> Optional[List[Tile]]:
+        partition_size = self.config["KLAYOUT_XOR_PARTITION_SIZE"]
+        if partition_size is None:
+            return None
+        die_bbox = state_in.metrics.get("design__die__bbox")
+        if die_bbox is None:
+            self.warn(
+                "'KLAYOUT_XOR_PARTITION_SIZE' is set, but the die area is unknown. The layouts will be XORed as a whole."
+            )
+            return None
+        lx, ly, ux, uy = [Decimal(coord) for coord in str(die_bbox).split()]
+        return get_tiles(
+            (lx, ly, ux, uy),
+            partition_size,
+            self.config["KLAYOUT_XOR_PARTITION_OVERLAP"],
+        )
+
+    def __get_default_workers(self, thread_count: int) -> int:
+        # Same key as run_subprocess uses for the partitions' logs
+        scheduler = get_scheduler()
+        peak_memory = scheduler.get_peak_memory(
+            f"{self.get_implementation_id()}/xor.log"
+        )
+        if not peak_memory:
+            return 1
+        return max(1, min(thread_count, scheduler.memory // peak_memory))
+
+    def __run_partitioned(
+        self,
+        partitions: List[Tile],
+        command: List[str],
+        thread_count: int,
+        env: dict,
+    ) -> MetricsUpdate:
+        workers = self.config["KLAYOUT_XOR_WORKERS"] or self.__get_default_workers(
+            thread_count
+        )
+        threads_per_worker = max(1, thread_count // workers)
+        max_differences = self.config["KLAYOUT_XOR_MAX_DIFFERENCES"]
+        info(
+            f"Running XOR for {len(partitions)} partitions using up to {workers} processes…"
+        )
+
+        def run_partition(index: int, partition: Tile) -> Tuple[str, int]:
+            partition_dir = os.path.join(self.step_dir, "partitions", str(index))
+            mkdirp(partition_dir)
+            output = os.path.join(partition_dir, "xor.xml")
+            # Partitions on the edges extend to the edges of the layouts
+            core = " ".join(
+                "*" if coord.is_infinite() else str(coord) for coord in partition.core
+            )
+            window = " ".join(
+                "*" if core_coord.is_infinite() else str(coord)
+                for core_coord, coord in zip(partition.core, partition.window)
+            )
+            subprocess_result = self.run_subprocess(
+                command
+                + [
+                    "--output",
+                    abspath(output),
+                    "--threads",
+                    str(threads_per_worker),
+                    "--window",
+                    window,
+                    "--core",
+                    core,
+                ],
+                env=env,
+                cpus=threads_per_worker,
+                log_to=os.path.join(partition_dir, "xor.log"),
+                silent=True,
+                report_dir=partition_dir,
+            )
+            metrics = subprocess_result["generated_metrics"]
+            return output, int(metrics["design__xor_difference__count"])
+
+        total = 0
+        outputs: Dict[int, str] = {}
+        stopped_early = False
+        with ThreadPoolExecutor(max_workers=workers) as tpe:
+            futures: Dict[Future[Tuple[str, int]], int] = {
+                tpe.submit(run_partition, i, partition): i
+                for i, partition in enumerate(partitions)
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                output, count = future.result()
+                index = futures[future]
+                outputs[index] = output
+                total += count
+                debug(
+                    f"Partition {index}: {count} differences ({len(outputs)}/{len(partitions)} done, {total} total)"
+                )
+                if (
+                    not stopped_early
+                    and max_differences is not None
+                    and total > max_differences
+                ):
+                    stopped_early = True
+                    for pending in futures:
+                        pending.cancel()
+
+        if stopped_early:
+            self.warn(
+                f"Found more than {max_differences} XOR differences: skipped {len(partitions) - len(outputs)} partitions."
+            )
+        info(f"Total XOR differences: {total}")
+
+        with open(os.path.join(self.step_dir, "xor.xml"), "wb") as f:
+            merge_klayout_xml([outputs[i] for i in sorted(outputs)], f)
+
+        return {"design__xor_difference__count": total}
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         ignored = ""
         if ignore_list := self.config["KLAYOUT_XOR_IGNORE_LAYERS"]:
@@ -296,7 +463,21 @@ class XOR(KLayoutStep):
         if tile_size := self.config["KLAYOUT_XOR_TILE_SIZE"]:
             tile_size_options += ["--tile-size", str(tile_size)]
 
-        thread_count = self.config["KLAYOUT_XOR_THREADS"] or _get_process_limit()
+        thread_count = self.config["KLAYOUT_XOR_THREADS"] or get_scheduler().cpus
+
+        if partitions := self.__get_partitions(state_in):
+            command = [
+                "ruby",
+                os.path.join(get_script_dir(), "klayout", "xor.drc"),
+                "--top",
+                self.config["DESIGN_NAME"],
+                "--ignore",
+                ignored,
+                abspath(layout_a),
+                abspath(layout_b),
+            ] + tile_size_options
+            return {}, self.__run_partitioned(partitions, command, thread_count, env)
+
         info(f"Running XOR with {thread_count} threads…")
 
         subprocess_result = self.run_subprocess(
@@ -320,6 +501,7 @@ class XOR(KLayoutStep):
             ]
             + tile_size_options,
             env=env,
+            cpus=thread_count,
         )
 
         return {}, subprocess_result["generated_metrics"]
@@ -334,6 +516,7 @@ class DRC(KLayoutStep):
         DesignFormat.GDS,
     ]
     outputs = []
+    metrics_out = ["klayout__drc_error__count", "klayout__drc__database"]
 
     config_vars = KLayoutStep.config_vars + [
         Variable(
@@ -353,7 +536,7 @@ class DRC(KLayoutStep):
             "KLAYOUT_DRC_THREADS",
             Optional[int],
             "Specifies the number of threads to be used in KLayout DRC"
-            + "If unset, this will be equal to your machine's thread count.",
+            + "If unset, this will be equal to the number of CPU slots available to OpenLane (see `--jobs`).",
         ),
     ]
 
@@ -371,7 +554,7 @@ class DRC(KLayoutStep):
         ).lower()
         offgrid = str(self.config["KLAYOUT_DRC_OPTIONS"]["offgrid"]).lower()
         seal = str(self.config["KLAYOUT_DRC_OPTIONS"]["seal"]).lower()
-        threads = self.config["KLAYOUT_DRC_THREADS"] or _get_process_limit()
+        threads = self.config["KLAYOUT_DRC_THREADS"] or get_scheduler().cpus
         info(f"Running KLayout DRC with {threads} threads…")
 
         input_view = state_in[DesignFormat.GDS]
@@ -405,6 +588,7 @@ class DRC(KLayoutStep):
                 f"threads={threads}",
             ],
             env=env,
+            cpus=threads,
         )
 
         subprocess_result = self.run_pya_script(
@@ -421,7 +605,16 @@ class DRC(KLayoutStep):
             env=env,
             log_to=os.path.join(self.step_dir, "xml_drc_report_to_json.log"),
         )
-        return subprocess_result["generated_metrics"]
+
+        with open(xml_report, "rb") as f:
+            drc, _ = DRCObject.from_klayout_xml(f, self.config["DESIGN_NAME"])
+        drc_db_path = os.path.join(reports_dir, "drc_violations.klayout.drcdb")
+        drc.save(drc_db_path)
+
+        return {
+            **subprocess_result["generated_metrics"],
+            "klayout__drc__database": abspath(drc_db_path),
+        }
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         metrics_updates: MetricsUpdate = {}
@@ -17,6 +17,7 @@ import shutil
 import functools
 import subprocess
 from signal import SIGKILL
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from abc import abstractmethod
 from typing import Any, Literal, List, Optional, Tuple
@@ -34,7 +35,17 @@ from .tclstep import TclStep
 from ..state import DesignFormat, State
 
 from ..config import Variable
-from ..common import get_script_dir, DRC as DRCObject, Path, mkdirp
+from ..logging import info
+from ..common import (
+    get_script_dir,
+    get_scheduler,
+    get_tiles,
+    BoundingBoxArray,
+    DRC as DRCObject,
+    Path,
+    Tile,
+    mkdirp,
+)
 
 
 class MagicOutputProcessor(OutputProcessor):
@@ -214,6 +225,7 @@ class WriteLEF(MagicStep):
 
     inputs = [DesignFormat.GDS, DesignFormat.DEF]
     outputs = [DesignFormat.LEF]
+    metrics_out = []
 
     config_vars = MagicStep.config_vars + [
         Variable(
@@ -260,6 +272,8 @@ class StreamOut(MagicStep):
 
     inputs = [DesignFormat.DEF]
     outputs = [DesignFormat.GDS, DesignFormat.MAG_GDS, DesignFormat.MAG]
+    metrics_in = ["design__die__bbox"]
+    metrics_out = []
 
     config_vars = MagicStep.config_vars + [
         Variable(
@@ -364,9 +378,17 @@ class DRC(MagicStep):
 
     This also converts the results to a KLayout database, which can be loaded.
 
+    If ``MAGIC_DRC_TILE_SIZE`` is set, the die area is split into tiles, each of
+    which is checked by a separate Magic process with some overlap with its
+    neighbors. Each violation is then attributed to the tile containing its
+    center, and the per-tile results are merged into a single report. As Magic
+    splits error areas along tile boundaries differently than it would for the
+    whole design, the violation count may differ slightly from an untiled run.
+
     The metrics will be updated with ``magic__drc_error__count``. You can use
     `the relevant checker <#Checker.MagicDRC>`_ to quit if that number is
-    nonzero.
+    nonzero. ``magic__drc__database`` is set to the path of the violations
+    saved in OpenLane's own DRC database format.
     """
 
     id = "Magic.DRC"
@@ -375,6 +397,8 @@ class DRC(MagicStep):
 
     inputs = [DesignFormat.DEF, DesignFormat.GDS]
     outputs = []
+    metrics_in = ["design__die__bbox"]
+    metrics_out = ["magic__drc_error__count", "magic__drc__database"]
 
     config_vars = MagicStep.config_vars + [
         Variable(
@@ -383,33 +407,124 @@ class DRC(MagicStep):
             "A flag to choose whether to run the Magic DRC checks on GDS or not. If not, then the checks will be done on the DEF view of the design, which is a bit faster, but may be less accurate as some DEF/LEF elements are abstract.",
             default=True,
         ),
+        Variable(
+            "MAGIC_DRC_TILE_SIZE",
+            Optional[Decimal],
+            "If set, the die area is split into square tiles of this size, which are checked by separate Magic processes in parallel. Requires the `design__die__bbox` metric.",
+            units="µm",
+        ),
+        Variable(
+            "MAGIC_DRC_TILE_OVERLAP",
+            Decimal,
+            "How far beyond its tile each Magic process checks the layout, so that violations close to tile edges are checked with their full context. Should exceed the largest rule distance of the PDK.",
+            default=10,
+            units="µm",
+        ),
+        Variable(
+            "MAGIC_DRC_WORKERS",
+            Optional[int],
+            "The number of tiles checked in parallel when `MAGIC_DRC_TILE_SIZE` is set. If unset, this will be equal to the number of CPU slots available to OpenLane (see `--jobs`).",
+        ),
     ]
 
     def get_script_path(self):
         return os.path.join(get_script_dir(), "magic", "drc.tcl")
 
+    def __get_tiles(self, state_in: State) -> Optional[List[Tile]]:
+        tile_size = self.config["MAGIC_DRC_TILE_SIZE"]
+        if tile_size is None:
+            return None
+        die_bbox = state_in.metrics.get("design__die__bbox")
+        if die_bbox is None:
+            self.warn(
+                "'MAGIC_DRC_TILE_SIZE' is set, but the die area is unknown. The design will be checked as a whole."
+            )
+            return None
+        lx, ly, ux, uy = [Decimal(coord) for coord in str(die_bbox).split()]
+        return get_tiles(
+            (lx, ly, ux, uy),
+            tile_size,
+            self.config["MAGIC_DRC_TILE_OVERLAP"],
+        )
+
+    def __run_tile(
+        self,
+        state_in: State,
+        env: dict,
+        index: int,
+        tile: Tile,
+        **kwargs,
+    ) -> DRCObject:
+        tile_dir = os.path.join(self.step_dir, "tiles", str(index))
+        mkdirp(tile_dir)
+        report_path = os.path.join(tile_dir, "drc_violations.magic.rpt")
+
+        env = env.copy()
+        env["_DRC_WINDOW"] = " ".join(str(coord) for coord in tile.window)
+        env["_DRC_REPORT"] = report_path
+        super().run(
+            state_in,
+            env=env,
+            log_to=os.path.join(tile_dir, "drc.log"),
+            silent=True,
+            report_dir=tile_dir,
+            **kwargs,
+        )
+
+        with open(report_path, encoding="utf8") as f:
+            drc, _ = DRCObject.from_magic(f)
+        for violation in drc.violations.values():
+            violation.bounding_boxes = BoundingBoxArray(
+                bounding_box
+                for bounding_box in violation.bounding_boxes
+                if tile.owns(bounding_box)
+            )
+        return drc
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         reports_dir = os.path.join(self.step_dir, "reports")
         mkdirp(reports_dir)
 
-        views_updates, metrics_updates = super().run(state_in, **kwargs)
-
         report_path = os.path.join(reports_dir, "drc_violations.magic.rpt")
         klayout_db_path = os.path.join(reports_dir, "drc_violations.magic.xml")
-
-        # report_stats = os.stat(report_path)
-        # drc_db_file = None
-        # if report_stats.st_size >= 0:  # 134217728:
-        #     drc_db_file = os.path.join(reports_dir, "drc.db")
-
-        drc, bbox_count = DRCObject.from_magic(
-            open(report_path, encoding="utf8"),
-            # db_file=drc_db_file,
-        )
-
-        drc.to_klayout_xml(open(klayout_db_path, "wb"))
+        drc_db_path = os.path.join(reports_dir, "drc_violations.magic.drcdb")
+
+        if tiles := self.__get_tiles(state_in):
+            kwargs, env = self.extract_env(kwargs)
+            workers = self.config["MAGIC_DRC_WORKERS"] or get_scheduler().cpus
+            info(f"Checking {len(tiles)} tiles using up to {workers} Magic processes…")
+            with ThreadPoolExecutor(max_workers=workers) as tpe:
+                futures = [
+                    tpe.submit(self.__run_tile, state_in, env, i, tile, **kwargs)
+                    for i, tile in enumerate(tiles)
+                ]
+                drc = DRCObject.merge(
+                    (future.result() for future in futures),
+                    self.config["DESIGN_NAME"],
+                )
+            drc.violations = {
+                name: violation
+                for name, violation in drc.violations.items()
+                if len(violation.bounding_boxes)
+            }
+            bbox_count = sum(
+                len(violation.bounding_boxes) for violation in drc.violations.values()
+            )
+            with open(report_path, "w", encoding="utf8") as f:
+                drc.to_magic(f)
+            views_updates: ViewsUpdate = {}
+            metrics_updates: MetricsUpdate = {}
+        else:
+            views_updates, metrics_updates = super().run(state_in, **kwargs)
+            with open(report_path, encoding="utf8") as f:
+                drc, bbox_count = DRCObject.from_magic(f)
+
+        drc.save(drc_db_path)
+        with open(klayout_db_path, "wb") as f:
+            drc.to_klayout_xml(f)
 
         metrics_updates["magic__drc_error__count"] = bbox_count
+        metrics_updates["magic__drc__database"] = os.path.abspath(drc_db_path)
 
         return views_updates, metrics_updates
 
@@ -431,6 +546,7 @@ class SpiceExtraction(MagicStep):
 
     inputs = [DesignFormat.GDS, DesignFormat.DEF]
     outputs = [DesignFormat.SPICE]
+    metrics_out = ["magic__illegal_overlap__count"]
 
     config_vars = MagicStep.config_vars + [
         Variable(
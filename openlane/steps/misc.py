@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-from typing import Tuple
+from typing import List, Tuple
 
 from .step import ViewsUpdate, MetricsUpdate, Step
-from ..common import Path
+from ..common import Path, DRC as DRCObject
 from ..state import State, DesignFormat
 from ..steps import Netgen, Magic, KLayout, OpenROAD
 from ..logging import options
@@ -37,6 +37,7 @@ class LoadBaseSDC(Step):
 
     inputs = []
     outputs = [DesignFormat.SDC]
+    metrics_in = []
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         path = self.config["FALLBACK_SDC_FILE"]
@@ -83,6 +84,18 @@ class ReportManufacturability(Step):
 
         return "\n".join(report)
 
+    def __get_drc_databases(self, state_in: State) -> List[DRCObject]:
+        databases = []
+        for metric in ["klayout__drc__database", "magic__drc__database"]:
+            path = state_in.metrics.get(metric)
+            if path is None:
+                continue
+            if not os.path.isfile(path):
+                self.warn(f"DRC database '{path}' ({metric}) not found.")
+                continue
+            databases.append(DRCObject.load(path))
+        return databases
+
     def __get_drc_report(self, state_in):
         klayout_step = KLayout.DRC.id
         magic_step = Magic.DRC.id
@@ -117,6 +130,20 @@ class ReportManufacturability(Step):
             report.append(
                 f"Check the report directories of {klayout_step} and {magic_step}."
             )
+            if databases := self.__get_drc_databases(state_in):
+                merged = DRCObject.merge(databases, self.config["DESIGN_NAME"])
+                merged.save(os.path.join(self.step_dir, "drc_violations.drcdb"))
+                xml_path = os.path.join(self.step_dir, "drc_violations.xml")
+                with open(xml_path, "wb") as f:
+                    merged.to_klayout_xml(f)
+                report.append(f"Merged KLayout database: {xml_path}")
+                categories = sorted(
+                    merged.violations.items(),
+                    key=lambda item: len(item[1].bounding_boxes),
+                    reverse=True,
+                )
+                for name, violation in categories[:10]:
+                    report.append(f"{name}: {len(violation.bounding_boxes)}")
         else:
             report.append("Passed ✅")
 
@@ -138,6 +138,7 @@ class LVS(NetgenStep):
     id = "Netgen.LVS"
     name = "Netgen LVS"
     inputs = [DesignFormat.SPICE, DesignFormat.POWERED_NETLIST]
+    metrics_out = ["design__lvs_*"]
     config_vars = NetgenStep.config_vars + [
         Variable(
             "LVS_INCLUDE_MARCO_NETLISTS",
@@ -29,6 +29,7 @@ from .openroad_alerts import (
 )
 from .openroad import DetailedPlacement, GlobalRouting
 from .tclstep import TclStep
+from .odb_server import OdbServer
 from .step import (
     ViewsUpdate,
     MetricsUpdate,
@@ -48,6 +49,7 @@ inf_rx = re.compile(r"\b(-?)inf\b")
 class OdbpyStep(Step):
     inputs = [DesignFormat.ODB]
     outputs = [DesignFormat.ODB, DesignFormat.DEF]
+    metrics_in = []
 
     output_processors = [OpenROADOutputProcessor, DefaultOutputProcessor]
 
@@ -87,11 +89,26 @@ class OdbpyStep(Step):
             f'{os.path.join(get_script_dir(), "odbpy")}:{env.get("PYTHONPATH")}'
         )
 
-        subprocess_result = self.run_subprocess(
-            command,
-            env=env,
-            **kwargs,
-        )
+        # Only steps producing an ODB file leave the in-memory database in a
+        # known state afterwards
+        server = None
+        if DesignFormat.ODB in automatic_outputs:
+            server = OdbServer.acquire(str(state_in[DesignFormat.ODB]), env)
+        if server is not None:
+            command = server.get_command(command)
+
+        try:
+            subprocess_result = self.run_subprocess(
+                command,
+                env=env,
+                **kwargs,
+            )
+        except BaseException:
+            if server is not None:
+                server.release(None)
+            raise
+        if server is not None:
+            server.release(str(views_updates[DesignFormat.ODB]))
 
         metrics_path = os.path.join(self.step_dir, "or_metrics_out.json")
         metrics_updates: MetricsUpdate = subprocess_result["generated_metrics"]
@@ -207,6 +224,8 @@ class ApplyDEFTemplate(OdbpyStep):
     id = "Odb.ApplyDEFTemplate"
     name = "Apply DEF Template"
 
+    metrics_in = ["design__die__bbox"]
+
     config_vars = [
         Variable(
             "FP_DEF_TEMPLATE",
@@ -0,0 +1,221 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import atexit
+import shutil
+import socket
+import tempfile
+import threading
+import subprocess
+from typing import ClassVar, Dict, List, Optional, Tuple
+
+from ..common import get_script_dir
+from ..logging import debug, warn
+
+
+def _get_signature(path: str) -> Tuple[str, int, int]:
+    stat = os.stat(path)
+    return (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+
+
+class OdbServer(object):
+    """
+    A long-lived OpenROAD process that runs the scripts of
+    :class:`openlane.steps.OdbpyStep`\\s on request, keeping the design database
+    in memory between consecutive steps.
+
+    Each step still writes the ODB file it produces to its step directory.
+    If the input ODB of the next step is that very file and it has not been
+    modified since, the in-memory database is used instead of reading the file
+    again.
+
+    At most one server exists at a time. Steps that cannot use it, i.e., ones
+    that do not produce an ODB file or that run while the server is busy with
+    another step, simply run in a new OpenROAD process.
+
+    :param env: The environment to launch OpenROAD with.
+    """
+
+    startup_timeout: ClassVar[float] = 60
+
+    __enabled: ClassVar[bool] = False
+    __current: ClassVar[Optional[OdbServer]] = None
+    __lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, env: Dict[str, str]):
+        self.__dir = tempfile.mkdtemp(prefix="openlane_odb_server_")
+        self.socket_path = os.path.join(self.__dir, "server.sock")
+        self.busy = False
+        self.resident: Optional[Tuple[str, int, int]] = None
+        self.reuse_db: Optional[str] = None
+        self.process = subprocess.Popen(
+            [
+                "openroad",
+                "-exit",
+                "-no_splash",
+                "-python",
+                self.get_script_path(),
+                "serve",
+                self.socket_path,
+            ],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    @classmethod
+    def get_script_path(Self) -> str:
+        return os.path.join(get_script_dir(), "odbpy", "server.py")
+
+    @classmethod
+    def set_enabled(Self, enabled: bool):
+        """
+        Enables or disables the use of an OpenROAD server by
+        :class:`openlane.steps.OdbpyStep`\\s. Disabling it shuts down the
+        current server, if one exists.
+
+        The server is disabled by default.
+
+        :param enabled: Whether to enable the server or not
+        """
+        with Self.__lock:
+            Self.__enabled = enabled
+            if not enabled and Self.__current is not None:
+                Self.__current.stop()
+                Self.__current = None
+
+    @classmethod
+    def acquire(Self, input_odb: str, env: Dict[str, str]) -> Optional[OdbServer]:
+        """
+        Acquires the OpenROAD server for one step, starting a new one if the
+        database in memory is not ``input_odb``.
+
+        :param input_odb: The input ODB file of the step
+        :param env: The environment of the step
+        :returns: The server, or ``None`` if it is disabled or unavailable, in
+            which case the step should run in a new OpenROAD process.
+        """
+        with Self.__lock:
+            if not Self.__enabled:
+                return None
+            server = Self.__current
+            if server is not None and server.busy:
+                return None
+            if server is not None and server.process.poll() is not None:
+                server.stop()
+                server = None
+
+            if not os.path.isfile(input_odb):
+                return None
+            signature = _get_signature(input_odb)
+            if server is None or server.resident != signature:
+                if server is not None:
+                    server.stop()
+                Self.__current = None
+                try:
+                    server = Self(env)
+                except OSError as e:
+                    debug(f"Failed to launch OpenROAD: {e}")
+                    server = None
+                if server is None or not server.wait_ready():
+                    warn(
+                        "Failed to start an OpenROAD server. Odb steps will run in separate processes."
+                    )
+                    if server is not None:
+                        server.stop()
+                    Self.__enabled = False
+                    return None
+                Self.__current = server
+                server.reuse_db = None
+            else:
+                debug(f"Reusing in-memory database '{input_odb}'…")
+                server.reuse_db = signature[0]
+            server.busy = True
+            return server
+
+    def release(self, output_odb: Optional[str]):
+        """
+        Releases the server after a step is done with it.
+
+        :param output_odb: The ODB file written by the step, which the
+            database in memory now corresponds to. If ``None``, e.g. if the step
+            has failed, the database in memory is considered unusable and the
+            server is shut down.
+        """
+        cls = self.__class__
+        with cls.__lock:
+            self.busy = False
+            if (
+                output_odb is None
+                or not os.path.isfile(output_odb)
+                or self.process.poll() is not None
+            ):
+                self.stop()
+                if cls.__current is self:
+                    cls.__current = None
+                return
+            self.resident = _get_signature(output_odb)
+
+    def wait_ready(self) -> bool:
+        deadline = time.time() + self.startup_timeout
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                return False
+            if os.path.exists(self.socket_path):
+                return True
+            time.sleep(0.05)
+        return False
+
+    def get_command(self, command: List[str]) -> List[str]:
+        """
+        :param command: An ``openroad -python`` command as returned by
+            :meth:`openlane.steps.OdbpyStep.get_command`
+        :returns: A command that runs the same script on this server instead.
+        """
+        script_index = command.index("-python") + 1
+        server_command = [
+            sys.executable,
+            self.get_script_path(),
+            "run",
+            "--socket",
+            self.socket_path,
+        ]
+        if "-metrics" in command:
+            server_command += ["--metrics", command[command.index("-metrics") + 1]]
+        if self.reuse_db is not None:
+            server_command += ["--reuse-db", self.reuse_db]
+        return server_command + ["--"] + command[script_index:]
+
+    def stop(self):
+        if self.process.poll() is None:
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                    connection.connect(self.socket_path)
+                    connection.sendall(
+                        (json.dumps({"shutdown": True}) + "\n").encode("utf8")
+                    )
+                self.process.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+        shutil.rmtree(self.__dir, ignore_errors=True)
+
+
+atexit.register(OdbServer.set_enabled, False)
@@ -15,8 +15,10 @@ import io
 import os
 import re
 import json
+import hashlib
 import tempfile
 import functools
+import threading
 import subprocess
 from enum import Enum
 from math import inf
@@ -28,6 +30,7 @@ from dataclasses import dataclass
 from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     Any,
+    ClassVar,
     List,
     Dict,
     Literal,
@@ -50,6 +53,7 @@ from .step import (
     MetricsUpdate,
     Step,
     StepException,
+    view_materializers,
 )
 from .openroad_alerts import (
     OpenROADAlert,
@@ -65,7 +69,7 @@ from .common_variables import (
     routing_layer_variables,
 )
 
-from ..config import Variable, Macro
+from ..config import Config, Variable, Macro
 from ..config.flow import option_variables
 from ..state import State, DesignFormat
 from ..logging import debug, info, verbose, console, options
@@ -76,7 +80,8 @@ from ..common import (
     mkdirp,
     aggregate_metrics,
     process_list_file,
-    _get_process_limit,
+    get_scheduler,
+    Toolbox,
 )
 
 EXAMPLE_INPUT = """
@@ -140,6 +145,7 @@ class CheckSDCFiles(Step):
     name = "Check SDC Files"
     inputs = []
     outputs = []
+    metrics_in = []
 
     config_vars = [
         Variable(
@@ -185,7 +191,21 @@ class OpenROADStep(TclStep):
 
     output_processors = [OpenROADOutputProcessor, DefaultOutputProcessor]
 
+    #: Outputs that are not written if ``OPENROAD_LAZY_VIEWS`` is enabled, but
+    #: rather exported from the step's ODB when a later step requires them.
+    lazy_outputs: ClassVar[List[DesignFormat]] = [
+        DesignFormat.DEF,
+        DesignFormat.NETLIST,
+        DesignFormat.POWERED_NETLIST,
+    ]
+
     config_vars = [
+        Variable(
+            "OPENROAD_LAZY_VIEWS",
+            bool,
+            "If enabled, OpenROAD steps that modify the design database only write the ODB view. The DEF and netlist views are exported from the ODB once a later step requires them.",
+            default=False,
+        ),
         Variable(
             "PDN_CONNECT_MACROS_TO_GRID",
             bool,
@@ -251,6 +271,10 @@ class OpenROADStep(TclStep):
         excluded_cells.update(process_list_file(self.config["PNR_EXCLUDED_CELL_FILE"]))
         env["_PNR_EXCLUDED_CELLS"] = TclUtils.join(excluded_cells)
 
+        if self.config.get("OPENROAD_LAZY_VIEWS") and DesignFormat.ODB in self.outputs:
+            for output in self.lazy_outputs:
+                env.pop(f"SAVE_{output.name}", None)
+
         return env
 
     def run(self, state_in, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
@@ -287,7 +311,12 @@ class OpenROADStep(TclStep):
             if output.value.multiple:
                 # Too step-specific.
                 continue
-            path = Path(env[f"SAVE_{output.name}"])
+            save_path = env.get(f"SAVE_{output.name}")
+            if save_path is None:
+                # Lazy: the view of the input state is outdated
+                views_updates[output] = None
+                continue
+            path = Path(save_path)
             if not path.exists():
                 continue
             views_updates[output] = path
@@ -374,16 +403,18 @@ class OpenSTAStep(OpenROADStep):
         extra_spefs_backcompat: Optional[Tuple[Tuple[str, str], ...]] = None
         current_corner_spef: Optional[str] = None
 
-        def set_env(self, env: Dict[str, Any]):
-            env["_CURRENT_CORNER_LIBS"] = TclStep.value_to_tcl(self.libs)
-            env["_CURRENT_CORNER_NETLISTS"] = TclStep.value_to_tcl(self.netlists)
-            env["_CURRENT_CORNER_SPEFS"] = TclStep.value_to_tcl(self.spefs)
+        def set_env(self, env: Dict[str, Any], suffix: str = ""):
+            env[f"_CURRENT_CORNER_LIBS{suffix}"] = TclStep.value_to_tcl(self.libs)
+            env[f"_CURRENT_CORNER_NETLISTS{suffix}"] = TclStep.value_to_tcl(
+                self.netlists
+            )
+            env[f"_CURRENT_CORNER_SPEFS{suffix}"] = TclStep.value_to_tcl(self.spefs)
             if self.extra_spefs_backcompat is not None:
-                env["_CURRENT_CORNER_EXTRA_SPEFS_BACKCOMPAT"] = TclStep.value_to_tcl(
-                    self.extra_spefs_backcompat
+                env[f"_CURRENT_CORNER_EXTRA_SPEFS_BACKCOMPAT{suffix}"] = (
+                    TclStep.value_to_tcl(self.extra_spefs_backcompat)
                 )
             if self.current_corner_spef is not None:
-                env["_CURRENT_SPEF_BY_CORNER"] = self.current_corner_spef
+                env[f"_CURRENT_SPEF_BY_CORNER{suffix}"] = self.current_corner_spef
 
     inputs = [DesignFormat.NETLIST]
 
@@ -544,7 +575,13 @@ class MultiCornerSTA(OpenSTAStep):
         Variable(
             "STA_THREADS",
             Optional[int],
-            "The maximum number of STA corners to run in parallel. If unset, this will be equal to your machine's thread count.",
+            "The maximum number of STA processes to run in parallel. If unset, this will be equal to the number of CPU slots available to OpenLane (see `--jobs`).",
+        ),
+        Variable(
+            "STA_CORNERS_PER_PROCESS",
+            int,
+            "The maximum number of timing corners analyzed by a single STA process. Corners sharing a process only read and link the design once, at the cost of higher memory usage per process. Corners may only share a process if they use the same set of netlists.",
+            default=1,
         ),
     ]
 
@@ -580,15 +617,59 @@ class MultiCornerSTA(OpenSTAStep):
 
         return generated_metrics
 
+    def run_corners(
+        self,
+        state_in: State,
+        current_env: Dict[str, Any],
+        corners: List[str],
+    ) -> Dict[str, Any]:
+        """
+        Runs STA for multiple timing corners in a single process.
+
+        The reports for each corner are created in a subdirectory of the step
+        directory with the corner's name, and the log is written to the
+        subdirectory of the first corner.
+
+        :param state_in: The input state
+        :param current_env: The environment, with per-corner file lists
+            suffixed with ``__<corner name>``
+        :param corners: The names of the corners to analyze
+        :returns: The metrics generated for all corners
+        """
+        corners_str = ", ".join(corners)
+        info(f"Starting STA for the {corners_str} timing corners…")
+        current_env["_CURRENT_CORNER_NAMES"] = TclStep.value_to_tcl(corners)
+        log_path = os.path.join(self.step_dir, corners[0], "sta.log")
+
+        try:
+            subprocess_result = self.run_subprocess(
+                self.get_command(),
+                log_to=log_path,
+                env=current_env,
+                silent=True,
+                report_dir=self.step_dir,
+            )
+
+            generated_metrics = subprocess_result["generated_metrics"]
+
+            info(f"Finished STA for the {corners_str} timing corners.")
+        except subprocess.CalledProcessError as e:
+            self.err(f"Failed STA for the {corners_str} timing corners:")
+            raise e
+
+        return generated_metrics
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         kwargs, env = self.extract_env(kwargs)
         env = self.prepare_env(env, state_in)
 
         tpe = ThreadPoolExecutor(
-            max_workers=self.config["STA_THREADS"] or _get_process_limit()
+            max_workers=self.config["STA_THREADS"] or get_scheduler().cpus
         )
+        corners_per_process = max(1, self.config["STA_CORNERS_PER_PROCESS"])
 
-        futures: Dict[str, Future[MetricsUpdate]] = {}
+        groups: List[List[Tuple[str, OpenSTAStep.CornerFileList]]] = []
+        open_groups: Dict[Tuple[str, ...], List] = {}
         files_so_far: Dict[OpenSTAStep.CornerFileList, str] = {}
         corners_used: Set[str] = set()
         for corner in self.config["STA_CORNERS"]:
@@ -603,22 +684,48 @@ class MultiCornerSTA(OpenSTAStep):
             files_so_far[file_list] = corner
             corners_used.add(corner)
 
-            current_env = env.copy()
-            file_list.set_env(current_env)
+            mkdirp(os.path.join(self.step_dir, corner))
 
-            corner_dir = os.path.join(self.step_dir, corner)
-            mkdirp(corner_dir)
+            # A single process can only link one set of netlists
+            group = open_groups.get(file_list.netlists)
+            if group is None or len(group) >= corners_per_process:
+                group = []
+                groups.append(group)
+                open_groups[file_list.netlists] = group
+            group.append((corner, file_list))
 
-            futures[corner] = tpe.submit(
-                self.run_corner,
-                state_in,
-                current_env,
-                corner,
-                corner_dir,
-            )
+        futures: List[Future[MetricsUpdate]] = []
+        for group in groups:
+            current_env = env.copy()
+            if len(group) == 1:
+                corner, file_list = group[0]
+                file_list.set_env(current_env)
+                futures.append(
+                    tpe.submit(
+                        self.run_corner,
+                        state_in,
+                        current_env,
+                        corner,
+                        os.path.join(self.step_dir, corner),
+                    )
+                )
+            else:
+                for corner, file_list in group:
+                    file_list.set_env(current_env, suffix=f"__{corner}")
+                current_env["_CURRENT_CORNER_NETLISTS"] = TclStep.value_to_tcl(
+                    file_list.netlists
+                )
+                futures.append(
+                    tpe.submit(
+                        self.run_corners,
+                        state_in,
+                        current_env,
+                        [corner for corner, _ in group],
+                    )
+                )
 
         metrics_updates: MetricsUpdate = {}
-        for corner, updates_future in futures.items():
+        for updates_future in futures:
             metrics_updates.update(updates_future.result())
 
         metric_updates_with_aggregates = aggregate_metrics(metrics_updates)
@@ -726,6 +833,12 @@ class STAPrePNR(MultiCornerSTA):
         current_env["_SDF_SAVE_DIR"] = corner_dir
         return super().run_corner(state_in, current_env, corner, corner_dir)
 
+    def run_corners(
+        self, state_in: State, current_env: Dict[str, Any], corners: List[str]
+    ) -> Dict[str, Any]:
+        current_env["_SDF_SAVE_DIR"] = self.step_dir
+        return super().run_corners(state_in, current_env, corners)
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         views_updates, metrics_updates = super().run(state_in, **kwargs)
 
@@ -861,6 +974,30 @@ class STAPostPNR(STAPrePNR):
             raise e
         return {**metrics_updates, **filter_unannotated_metrics}
 
+    def run_corners(
+        self, state_in: State, current_env: Dict[str, Any], corners: List[str]
+    ) -> MetricsUpdate:
+        current_env["_LIB_SAVE_DIR"] = self.step_dir
+        metrics_updates = super().run_corners(state_in, current_env, corners)
+        for corner in corners:
+            corner_dir = os.path.join(self.step_dir, corner)
+            try:
+                metrics_updates.update(
+                    self.filter_unannotated_report(
+                        corner=corner,
+                        checks_report=os.path.join(corner_dir, "checks.rpt"),
+                        corner_dir=corner_dir,
+                        env=current_env,
+                        odb_design=str(state_in[DesignFormat.ODB]),
+                    )
+                )
+            except subprocess.CalledProcessError as e:
+                self.err(
+                    f"Failed filtering unannotated nets for the {corner} timing corner."
+                )
+                raise e
+        return metrics_updates
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         views_updates, metrics_updates = super().run(state_in, **kwargs)
         lib_dict = state_in[DesignFormat.LIB] or {}
@@ -1189,6 +1326,7 @@ class GeneratePDN(OpenROADStep):
 
 
 class _GlobalPlacement(OpenROADStep):
+    metrics_in = ["design__instance__utilization"]
     config_vars = (
         OpenROADStep.config_vars
         + routing_layer_variables
@@ -1594,7 +1732,7 @@ class DetailedRouting(OpenROADStep):
         Variable(
             "DRT_THREADS",
             Optional[int],
-            "Specifies the number of threads to be used in OpenROAD Detailed Routing. If unset, this will be equal to your machine's thread count.",
+            "Specifies the number of threads to be used in OpenROAD Detailed Routing. If unset, this will be equal to the number of CPU slots available to OpenLane (see `--jobs`).",
             deprecated_names=["ROUTING_CORES"],
         ),
         Variable(
@@ -1620,9 +1758,10 @@ class DetailedRouting(OpenROADStep):
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         kwargs, env = self.extract_env(kwargs)
-        env["DRT_THREADS"] = env.get("DRT_THREADS", str(_get_process_limit()))
-        info(f"Running TritonRoute with {env['DRT_THREADS']} threads…")
-        return super().run(state_in, env=env, **kwargs)
+        env["DRT_THREADS"] = env.get("DRT_THREADS", str(get_scheduler().cpus))
+        threads = int(self.config["DRT_THREADS"] or env["DRT_THREADS"])
+        info(f"Running TritonRoute with {threads} threads…")
+        return super().run(state_in, env=env, cpus=threads, **kwargs)
 
 
 @Step.factory.register()
@@ -1697,7 +1836,7 @@ class RCX(OpenROADStep):
         Variable(
             "STA_THREADS",
             Optional[int],
-            "The maximum number of STA corners to run in parallel. If unset, this will be equal to your machine's thread count.",
+            "The maximum number of STA corners to run in parallel. If unset, this will be equal to the number of CPU slots available to OpenLane (see `--jobs`).",
         ),
     ]
 
@@ -1767,7 +1906,7 @@ class RCX(OpenROADStep):
             return out
 
         tpe = ThreadPoolExecutor(
-            max_workers=self.config["STA_THREADS"] or _get_process_limit()
+            max_workers=self.config["STA_THREADS"] or get_scheduler().cpus
         )
 
         futures: Dict[str, Future[str]] = {}
@@ -1959,10 +2098,86 @@ class WriteViews(OpenROADStep):
         )
     ]
 
+    lazy_outputs = []
+
     def get_script_path(self):
         return os.path.join(get_script_dir(), "openroad", "write_views.tcl")
 
 
+_lazy_views_locks: Dict[str, threading.Lock] = {}
+_lazy_views_locks_lock = threading.Lock()
+
+
+def _export_lazy_views(
+    config: Config,
+    toolbox: Toolbox,
+    state: State,
+    formats: List[DesignFormat],
+    export_dir: str,
+) -> ViewsUpdate:
+    odb = state[DesignFormat.ODB]
+    formats = [format for format in formats if format in OpenROADStep.lazy_outputs]
+    if not isinstance(odb, Path) or len(formats) == 0:
+        return {}
+
+    # Views are exported once per version of each ODB file and shared by all
+    # steps of the run requiring them
+    odb_real = os.path.realpath(odb)
+    odb_key = hashlib.sha256(
+        f"{odb_real}\0{os.stat(odb_real).st_mtime_ns}".encode("utf8")
+    ).hexdigest()[:16]
+    odb_export_dir = os.path.join(export_dir, odb_key)
+    with _lazy_views_locks_lock:
+        lock = _lazy_views_locks.setdefault(odb_export_dir, threading.Lock())
+
+    with lock:
+        step = WriteViews(config, state, _config_quiet=True)
+        step.step_dir = odb_export_dir
+        step.toolbox = toolbox
+
+        views_updates: ViewsUpdate = {}
+        missing = []
+        for format in formats:
+            path = os.path.join(
+                odb_export_dir,
+                f"{step.config['DESIGN_NAME']}.{format.value.extension}",
+            )
+            views_updates[format] = Path(path)
+            if not os.path.exists(path):
+                missing.append(format)
+
+        if len(missing) == 0:
+            return views_updates
+
+        info(
+            f"Exporting {', '.join(format.value.name for format in missing)} from '{os.path.relpath(str(odb))}'…"
+        )
+        mkdirp(odb_export_dir)
+        env = {
+            key: value
+            for key, value in step.prepare_env(os.environ.copy(), state).items()
+            if not key.startswith("SAVE_")
+        }
+        for format in missing:
+            env[f"SAVE_{format.name}"] = str(views_updates[format])
+        try:
+            step.run_subprocess(step.get_command(), env=env, silent=True)
+        except subprocess.CalledProcessError as e:
+            # Partially written views must not be reused
+            for format in missing:
+                path = str(views_updates[format])
+                if os.path.exists(path):
+                    os.unlink(path)
+            raise StepException(
+                f"Failed to export {', '.join(format.value.name for format in missing)} from '{odb}': {e}"
+            ) from None
+
+    return views_updates
+
+
+view_materializers.append(_export_lazy_views)
+
+
 # Resizer Steps
 
 
@@ -2415,6 +2630,7 @@ class OpenGUI(Step):
 
     inputs = [DesignFormat.ODB]
     outputs = []
+    metrics_in = []
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         with tempfile.NamedTemporaryFile("a+", suffix=".tcl") as f:
@@ -13,7 +13,15 @@
 # limitations under the License.
 import re
 from dataclasses import dataclass
-from typing import Literal, Optional, Protocol, List, runtime_checkable
+from typing import (
+    ClassVar,
+    Literal,
+    Optional,
+    Protocol,
+    List,
+    Tuple,
+    runtime_checkable,
+)
 
 from .step import OutputProcessor
 
@@ -63,6 +71,7 @@ class OpenROADOutputProcessor(OutputProcessor):
     """
 
     key = "openroad_alerts"
+    prefixes: ClassVar[Optional[Tuple[str, ...]]] = ("[WARNING", "[ERROR")
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -95,6 +104,9 @@ class OpenROADOutputProcessor(OutputProcessor):
             return True  # munch
         return False  # pass on to next output processor
 
+    def process_plain_lines(self, lines: List[str]) -> List[str]:
+        return lines
+
     def result(self) -> List[OpenROADAlert]:
         """
         :returns: A list of OpenROAD alerts captured by this output processor
@@ -135,6 +135,7 @@ verilog_rtl_cfg_vars = [
 
 
 class PyosysStep(Step):
+    metrics_in = []
     config_vars = [
         Variable(
             "SYNTH_LATCH_MAP",
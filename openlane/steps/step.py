@@ -21,10 +21,11 @@ import psutil
 import shutil
 import textwrap
 import datetime
+import codecs
 import subprocess
 from signal import Signals
 from decimal import Decimal
-from io import TextIOWrapper
+from io import TextIOWrapper, IncrementalNewlineDecoder
 from threading import Thread
 from inspect import isabstract
 from itertools import zip_longest
@@ -44,6 +45,9 @@ from typing import (
     Type,
     Generic,
     TypeVar,
+    IO,
+    Iterable,
+    Iterator,
 )
 
 from rich.markup import escape
@@ -68,6 +72,7 @@ from ..common import (
     copy_recursive,
     format_size,
     format_elapsed_time,
+    get_scheduler,
 )
 from .. import logging
 from ..logging import (
@@ -79,6 +84,7 @@ from ..logging import (
     debug,
 )
 from ..__version__ import __version__
+from .cache import get_step_cache
 
 
 VT = TypeVar("VT")
@@ -97,9 +103,15 @@ class OutputProcessor(ABC, Generic[VT]):
         not.
     :cvar key: The fixed key to be added to the return value of
         ``run_subprocess``. Must be implemented by subclasses.
+    :cvar prefixes: If set, lines not starting with any of these prefixes are
+        handed to :meth:`process_plain_lines` in bulk instead of
+        :meth:`process_line`, which allows ``run_subprocess`` to skip the
+        line-by-line processing of most output. If ``None``, every line is
+        processed by :meth:`process_line`.
     """
 
     key: ClassVar[str] = NotImplemented
+    prefixes: ClassVar[Optional[Tuple[str, ...]]] = None
 
     def __init__(self, step: Step, report_dir: str, silent: bool) -> None:
         self.step = step
@@ -120,6 +132,20 @@ class OutputProcessor(ABC, Generic[VT]):
         """
         pass
 
+    def process_plain_lines(self, lines: List[str]) -> List[str]:
+        """
+        Processes a batch of lines, none of which start with any of
+        :attr:`prefixes`.
+
+        The default implementation calls :meth:`process_line` for each line,
+        but subclasses may override it with a faster implementation.
+
+        :param lines: The lines emitted by the subprocess
+        :returns: The lines that were not "consumed", in order, to be passed on
+            to later output processors.
+        """
+        return [line for line in lines if not self.process_line(line)]
+
     @abstractmethod
     def result(self) -> VT:
         """
@@ -148,6 +174,7 @@ class DefaultOutputProcessor(OutputProcessor[Dict[str, Any]]):
     """
 
     key = "generated_metrics"
+    prefixes: ClassVar[Optional[Tuple[str, ...]]] = ("%OL_",)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -185,6 +212,14 @@ class DefaultOutputProcessor(OutputProcessor[Dict[str, Any]]):
             logging.subprocess(line.strip())
         return True
 
+    def process_plain_lines(self, lines: List[str]) -> List[str]:
+        if self.current_rpt is not None:
+            self.current_rpt.write("".join(lines))
+        elif not self.silent:
+            for line in lines:
+                logging.subprocess(line.strip())
+        return []
+
     def result(self) -> Dict[str, Any]:
         """
         A dictionary of all generated metrics.
@@ -192,6 +227,84 @@ class DefaultOutputProcessor(OutputProcessor[Dict[str, Any]]):
         return self.generated_metrics
 
 
+SUBPROCESS_CHUNK_SIZE = 1024 * 1024
+
+
+def _read_line_batches(stream: IO[str]) -> Iterator[Tuple[str, List[str]]]:
+    # Reads all currently available output at once (up to a limit), decoding
+    # it the same way a text-mode stream would. Incomplete lines are held back
+    # until the rest of the line arrives or the stream ends.
+    #
+    # Yields the text of the complete lines read alongside the lines themselves.
+    raw = getattr(stream, "buffer", None)
+    if raw is None or not hasattr(raw, "read1"):
+        for line in stream:
+            yield line, [line]
+        return
+
+    decoder = IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf8")(), translate=True
+    )
+    partial = ""
+    while True:
+        chunk = raw.read1(SUBPROCESS_CHUNK_SIZE)
+        final = len(chunk) == 0
+        text = partial + decoder.decode(chunk, final=final)
+        parts = text.split("\n")
+        partial = parts.pop()
+        lines = [f"{part}\n" for part in parts]
+        if final:
+            if partial != "":
+                lines.append(partial)
+        elif partial != "":
+            text = text[: -len(partial)]
+        if len(lines) != 0:
+            yield text, lines
+        if final:
+            return
+
+
+def _process_lines(
+    text: str,
+    lines: List[str],
+    output_processors: List[OutputProcessor],
+):
+    def process_line(line: str):
+        for processor in output_processors:
+            if processor.process_line(line):
+                break
+
+    def process_plain_lines(lines: List[str]):
+        for processor in output_processors:
+            if len(lines) == 0:
+                break
+            lines = processor.process_plain_lines(lines)
+
+    prefixes: Tuple[str, ...] = ()
+    for processor in output_processors:
+        if processor.prefixes is None:
+            for line in lines:
+                process_line(line)
+            return
+        prefixes += processor.prefixes
+
+    # Fast path: lines that no output processor is interested in individually
+    # are processed in bulk
+    if not any(prefix in text for prefix in prefixes):
+        process_plain_lines(lines)
+        return
+
+    plain_start = 0
+    for i, line in enumerate(lines):
+        if line.startswith(prefixes):
+            if plain_start != i:
+                process_plain_lines(lines[plain_start:i])
+            process_line(line)
+            plain_start = i + 1
+    if plain_start != len(lines):
+        process_plain_lines(lines[plain_start:])
+
+
 class StepError(RuntimeError):
     """
     A ``RuntimeError`` that occurs when a Step fails to finish execution
@@ -244,6 +357,52 @@ GlobalToolbox = Toolbox(os.path.join(os.getcwd(), "openlane_run", "tmp"))
 ViewsUpdate = Dict[DesignFormat, StateElement]
 MetricsUpdate = Dict[str, Any]
 
+ViewMaterializer = Callable[
+    [Config, Toolbox, State, List[DesignFormat], str], ViewsUpdate
+]
+"""
+A function that exports views missing from a state from other views in it,
+e.g. a DEF file from an ODB file. It receives a configuration, a toolbox, the
+state, the missing formats and a directory to export them to, and returns the
+views it could export.
+"""
+
+view_materializers: List[ViewMaterializer] = []
+
+
+def materialize_views(
+    config: Config,
+    toolbox: Toolbox,
+    state: State,
+    formats: Iterable[DesignFormat],
+    export_dir: str,
+) -> State:
+    """
+    Exports views that are missing from a state using the functions in
+    :data:`view_materializers`. This allows steps to defer writing views that
+    can be derived from their other outputs until another step requires them.
+
+    :param config: The configuration to export views with.
+    :param toolbox: The toolbox to export views with.
+    :param state: The state with missing views.
+    :param formats: The formats to export if they are missing.
+    :param export_dir: The directory to export views to, which should be
+        shared by the steps of a run so views are only exported once.
+    :returns: ``state`` if no views were exported, otherwise a new state with
+        the exported views.
+    """
+    missing = [format for format in formats if state[format] is None]
+    updates: ViewsUpdate = {}
+    for materializer in view_materializers:
+        if not missing:
+            break
+        updates.update(materializer(config, toolbox, state, missing, export_dir))
+        missing = [format for format in missing if updates.get(format) is None]
+
+    if not updates:
+        return state
+    return State(state, overrides=updates, metrics=state.metrics)
+
 
 class ProcessStatsThread(Thread):
     def __init__(self, process: psutil.Popen, interval: float = 0.1):
@@ -418,6 +577,21 @@ class Step(ABC):
     :cvar config_vars: A list of configuration :class:`openlane.config.Variable` objects
         to be used to alter the behavior of this Step.
 
+    :cvar metrics_in: A list of metric names (or wildcards thereof) read from
+        the input state by this step. ``None`` signifies that the step may read
+        any metric.
+
+        Flows that run steps concurrently use this alongside ``inputs`` and
+        ``outputs`` to determine which Steps depend on one another, so Steps
+        that read metrics from their input state must declare it here.
+
+    :cvar metrics_out: A list of metric names (or wildcards thereof) that may
+        be emitted by this step. ``None`` signifies that the step may emit any
+        metric.
+
+        Flows that run steps concurrently only make Steps reading metrics wait
+        for preceding Steps that may emit them.
+
     :cvar output_processors: A default set of
         :class:`openlane.steps.OutputProcessor` classes for use with
         :meth:`run_subprocess`.
@@ -456,6 +630,8 @@ class Step(ABC):
     outputs: ClassVar[List[DesignFormat]] = NotImplemented
     output_processors: ClassVar[List[Type[OutputProcessor]]] = [DefaultOutputProcessor]
     config_vars: ClassVar[List[Variable]] = []
+    metrics_in: ClassVar[Optional[List[str]]] = None
+    metrics_out: ClassVar[Optional[List[str]]] = None
 
     # Instance Variables
     name: str
@@ -817,7 +993,8 @@ class Step(ABC):
         if not isinstance(config, Config):
             config = Self._load_config_from_file(config, pdk_root)
         if not isinstance(state_in, State):
-            state_in = State.loads(open(state_in).read())
+            # Copied so the step's own state files do not reference state_in
+            state_in = State.load(state_in).copy()
         return Self(
             config=config,
             state_in=state_in,
@@ -854,7 +1031,7 @@ class Step(ABC):
             else:
                 raise e from None
         step_object.step_dir = step_dir
-        step_object.state_out = State.loads(open(state_out_path).read())
+        step_object.state_out = State.load(state_out_path)
         return step_object
 
     @classmethod
@@ -1123,9 +1300,25 @@ class Step(ABC):
             f"Running '{self.id}' at {link_start}'{os.path.relpath(self.step_dir)}'{link_end}…"
         )
 
+        state_in_result = materialize_views(
+            self.config,
+            self.toolbox,
+            state_in_result,
+            self.inputs,
+            # Shared with the other steps of the same run
+            os.path.join(os.path.dirname(os.path.abspath(self.step_dir)), "lazy-views"),
+        )
+
+        # Deltas only refer to the states of the same run, so the states of
+        # other runs (e.g. --with-initial-state) may be moved or deleted
+        delta_root: Optional[str] = None
+        if self.config.get("SAVE_STATE_DELTAS"):
+            delta_root = os.path.dirname(os.path.abspath(self.step_dir))
+
         mkdirp(self.step_dir)
-        with open(os.path.join(self.step_dir, "state_in.json"), "w") as f:
-            f.write(state_in_result.dumps())
+        state_in_result.save(
+            os.path.join(self.step_dir, "state_in.json"), delta_root=delta_root
+        )
 
         self.config_path = os.path.join(self.step_dir, "config.json")
         with open(self.config_path, "w") as f:
@@ -1146,17 +1339,28 @@ class Step(ABC):
                     f"{type(self).__name__}: missing required input '{input.name}'"
                 ) from None
 
-        try:
-            views_updates, metrics_updates = self.run(state_in_result, **kwargs)
-        except subprocess.CalledProcessError as e:
-            if e.returncode is not None and e.returncode < 0:
-                raise StepSignalled(
-                    f"{self.name}: Interrupted ({Signals(-e.returncode).name})"
-                ) from None
-            else:
-                raise StepError(
-                    f"{self.name}: subprocess {e.args} failed", underlying_error=e
-                ) from None
+        cache = get_step_cache()
+        cache_key: Optional[str] = None
+        cached_result = None
+        if cache is not None:
+            cache_key = cache.get_key(self, state_in_result)
+            cached_result = cache.restore(cache_key, self.step_dir)
+
+        if cached_result is not None:
+            info(f"Restored the result of '{self.id}' from the step cache.")
+            views_updates, metrics_updates = cached_result
+        else:
+            try:
+                views_updates, metrics_updates = self.run(state_in_result, **kwargs)
+            except subprocess.CalledProcessError as e:
+                if e.returncode is not None and e.returncode < 0:
+                    raise StepSignalled(
+                        f"{self.name}: Interrupted ({Signals(-e.returncode).name})"
+                    ) from None
+                else:
+                    raise StepError(
+                        f"{self.name}: subprocess {e.args} failed", underlying_error=e
+                    ) from None
 
         metrics = GenericImmutableDict(
             state_in_result.metrics, overrides=metrics_updates
@@ -1173,8 +1377,14 @@ class Step(ABC):
                 f"Step {self.name} generated invalid state: {e}"
             ) from None
 
-        with open(os.path.join(self.step_dir, "state_out.json"), "w") as f:
-            f.write(self.state_out.dumps())
+        if cache is not None and cache_key is not None and cached_result is None:
+            cache.store(cache_key, self.step_dir, views_updates, metrics_updates)
+
+        self.state_out.save(
+            os.path.join(self.step_dir, "state_out.json"),
+            base=state_in_result,
+            delta_root=delta_root,
+        )
 
         self.end_time = time.time()
         with open(os.path.join(self.step_dir, "runtime.txt"), "w") as f:
@@ -1226,6 +1436,7 @@ class Step(ABC):
         *,
         check: bool = True,
         output_processing: Optional[Sequence[Type[OutputProcessor]]] = None,
+        cpus: int = 1,
         _popen_callable: Callable[..., psutil.Popen] = psutil.Popen,
         **kwargs,
     ) -> Dict[str, Any]:
@@ -1250,6 +1461,10 @@ class Step(ABC):
             to do further processing on the output(s).
         :param output_processing: An override for the class's list of
             :class:`openlane.steps.OutputProcessor` classes.
+        :param cpus: The number of CPU slots the subprocess uses, e.g. its
+            thread count. The subprocess is not started until this many slots
+            (and the memory it used in previous runs) are available from the
+            global :class:`openlane.common.ResourceScheduler`.
         :param \\*\\*kwargs: Passed on to subprocess execution: useful if you want to
             redirect stdin, stdout, etc.
         :returns: A dictionary of output processor results.
@@ -1270,7 +1485,7 @@ class Step(ABC):
         mkdirp(report_dir)
 
         log_path = log_to or self.get_log_path()
-        log_file = open(log_path, "w")
+        log_file = open(log_path, "w", buffering=SUBPROCESS_CHUNK_SIZE)
         cmd_str = [str(arg) for arg in cmd]
 
         with open(os.path.join(self.step_dir, "COMMANDS"), "a+") as f:
@@ -1318,41 +1533,49 @@ class Step(ABC):
         verbose(
             f"Logging subprocess to [repr.filename]{link_start}'{os.path.relpath(log_path)}'{link_end}[/repr.filename]…"
         )
-        process = _popen_callable(
-            cmd_str,
-            encoding="utf8",
-            env=env,
-            **kwargs,
-        )
+        scheduler = get_scheduler()
+        memory_key = f"{self.get_implementation_id()}/{os.path.basename(log_path)}"
+        with scheduler.reserve(
+            cpus=cpus,
+            memory=scheduler.get_peak_memory(memory_key),
+        ):
+            process = _popen_callable(
+                cmd_str,
+                encoding="utf8",
+                env=env,
+                **kwargs,
+            )
 
-        process_stats_thread = ProcessStatsThread(process)
-        process_stats_thread.start()
+            process_stats_thread = ProcessStatsThread(process)
+            process_stats_thread.start()
+
+            line_buffer = RingBuffer(str, 10)
+            if process_stdout := process.stdout:
+                try:
+                    for text, lines in _read_line_batches(process_stdout):
+                        log_file.write(text)
+                        for line in lines[-10:]:
+                            line_buffer.push(line)
+                        _process_lines(text, lines, output_processors)
+                except UnicodeDecodeError as e:
+                    raise StepException(f"Subprocess emitted non-UTF-8 output: {e}")
+            process_stats_thread.join()
+
+            json_stats = f"{os.path.splitext(log_path)[0]}.process_stats.json"
+
+            with open(json_stats, "w") as f:
+                json.dump(
+                    process_stats_thread.stats_as_dict(),
+                    f,
+                    indent=4,
+                )
+            if peak_memory := int(process_stats_thread.peak_resources["memory_rss"]):
+                scheduler.record_peak_memory(memory_key, peak_memory)
 
-        line_buffer = RingBuffer(str, 10)
-        if process_stdout := process.stdout:
-            try:
-                for line in process_stdout:
-                    log_file.write(line)
-                    line_buffer.push(line)
-                    for processor in output_processors:
-                        if processor.process_line(line):
-                            break
-            except UnicodeDecodeError as e:
-                raise StepException(f"Subprocess emitted non-UTF-8 output: {e}")
-        process_stats_thread.join()
-
-        json_stats = f"{os.path.splitext(log_path)[0]}.process_stats.json"
-
-        with open(json_stats, "w") as f:
-            json.dump(
-                process_stats_thread.stats_as_dict(),
-                f,
-                indent=4,
-            )
+            returncode = process.wait()
+            log_file.close()
 
         result: Dict[str, Any] = {}
-        returncode = process.wait()
-        log_file.close()
         result["returncode"] = returncode
         result["log_path"] = log_path
 
@@ -1480,8 +1703,8 @@ class CompositeStep(Step):
     Composite steps are currently considered an internal object that is not
     ready to be part of the API. The API may change at any time for any reason.
 
-    ``inputs`` and ``config_vars`` are automatically generated based on the
-    constituent steps.
+    ``inputs``, ``metrics_in``, ``metrics_out`` and ``config_vars`` are
+    automatically generated based on the constituent steps.
 
     ``outputs`` may be set explicitly. If not set, it is automatically generated
     based on the constituent steps.
@@ -1495,8 +1718,18 @@ class CompositeStep(Step):
 
         input_set: Set[DesignFormat] = set()
         output_set: Set[DesignFormat] = set()
+        metrics_in_set: Optional[Set[str]] = set()
+        metrics_out_set: Optional[Set[str]] = set()
         config_var_dict: Dict[str, Variable] = {}
         for step in Self.Steps:
+            if step.metrics_in is None:
+                metrics_in_set = None
+            elif metrics_in_set is not None:
+                metrics_in_set.update(step.metrics_in)
+            if step.metrics_out is None:
+                metrics_out_set = None
+            elif metrics_out_set is not None:
+                metrics_out_set.update(step.metrics_out)
             for input in step.inputs:
                 if input not in available_inputs:
                     input_set.add(input)
@@ -1516,6 +1749,8 @@ class CompositeStep(Step):
         if Self.outputs == NotImplemented:  # Allow for setting explicit outputs
             Self.outputs = list(output_set)
         Self.config_vars = list(config_var_dict.values())
+        Self.metrics_in = None if metrics_in_set is None else list(metrics_in_set)
+        Self.metrics_out = None if metrics_out_set is None else list(metrics_out_set)
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         state = state_in
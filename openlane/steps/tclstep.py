@@ -56,6 +56,7 @@ class TclStep(Step):
     """
 
     reproducibles_allowed: ClassVar[bool] = True
+    metrics_in = []
 
     @staticmethod
     def value_to_tcl(value: Any) -> str:
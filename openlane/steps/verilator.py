@@ -35,6 +35,7 @@ class Lint(Step):
     long_name = "Verilator Lint"
     inputs = []  # The input RTL is part of the configuration
     outputs = []
+    metrics_in = []
 
     config_vars = [
         Variable(
@@ -254,6 +254,7 @@ class EQY(Step):
 
     inputs = [DesignFormat.NETLIST]
     outputs = []
+    metrics_in = []
 
     config_vars = (
         YosysStep.config_vars
@@ -99,6 +99,50 @@ def test_aggregate_metrics(input, aggregators, expected):
     ), "aggregate_metrics() returned unexpected output"
 
 
+def test_metric_index():
+    from openlane.common import MetricIndex
+
+    index = MetricIndex(
+        [
+            "timing__setup__ws",
+            "timing__setup__ws__corner:nom_tt_025C_1v80",
+            "timing__setup__ws__corner:max_ss_100C_1v60",
+            "timing__setup__ws__corner:nom_tt_025C_1v80__clock:clk",
+            "timing__hold__ws__corner:nom_tt_025C_1v80",
+        ]
+    )
+
+    assert index.get("timing__setup__ws") == [
+        ("timing__setup__ws", {}),
+        ("timing__setup__ws__corner:nom_tt_025C_1v80", {"corner": "nom_tt_025C_1v80"}),
+        ("timing__setup__ws__corner:max_ss_100C_1v60", {"corner": "max_ss_100C_1v60"}),
+        (
+            "timing__setup__ws__corner:nom_tt_025C_1v80__clock:clk",
+            {"corner": "nom_tt_025C_1v80", "clock": "clk"},
+        ),
+    ], "Improperly indexed metrics by base name"
+    assert index.get_modifier_values("timing__setup__ws", "corner") == {
+        "nom_tt_025C_1v80": "timing__setup__ws__corner:nom_tt_025C_1v80",
+        "max_ss_100C_1v60": "timing__setup__ws__corner:max_ss_100C_1v60",
+    }, "Improperly looked up metrics by modifier"
+    assert (
+        index.get_modifier_values("timing__setup__ws", "clock") == {}
+    ), "Matched metrics with other modifiers"
+    assert index.get("design__instance__count") == [], "Matched nonexistent metric"
+
+
+def test_aggregate_metrics_zero():
+    from openlane.common import aggregate_metrics
+
+    assert aggregate_metrics(
+        {
+            "timing__hold__ws__corner:a": Decimal("0"),
+            "timing__hold__ws__corner:b": Decimal("0.5"),
+        },
+        {"timing__hold__ws": (math.inf, min)},
+    )["timing__hold__ws"] == Decimal("0"), "Aggregate discarded a zero value"
+
+
 def test_generic_dict():
     from openlane.common import GenericDict
 
@@ -130,6 +174,29 @@ def test_immutable_generic_dict():
         test_dict.update({"a": "g"})
 
 
+def test_immutable_generic_dict_overlay():
+    from openlane.common import GenericImmutableDict
+
+    expected = {f"key{i}": i for i in range(10)}
+    test_dict = GenericImmutableDict(expected)
+    for i in range(100):
+        overrides = {f"key{i % 13}": -i, f"new{i % 7}": i}
+        test_dict = GenericImmutableDict(test_dict, overrides=overrides)
+        expected = {**expected, **overrides}
+
+        if i % 10 == 0:
+            assert list(test_dict) == list(
+                expected
+            ), "Derived immutable dict has the wrong key order"
+    assert len(test_dict) == len(expected), "Derived immutable dict has wrong length"
+    assert test_dict.to_raw_dict() == expected, "Derived immutable dict is wrong"
+    assert test_dict.check("key3") == ("key3", expected["key3"])
+    assert test_dict.check("missing") == (None, None)
+
+    with pytest.raises(TypeError, match="is immutable"):
+        test_dict["key0"] = 4
+
+
 class MyEnum(enum.Enum):
     A = 4
     B = "Horse"
@@ -229,3 +296,57 @@ def test_immutable_dict():
         del immutable_dict["a"]
 
     assert e is not None, "Was able to delete from immutable dict"
+
+
+def test_metric_diff_csv():
+    import io
+    from openlane.common.metrics import MetricDiff
+
+    diff = MetricDiff.from_metrics(
+        {
+            "design__instance__count": 10,
+            "timing__setup__ws__corner:nom_tt_025C_1v80": Decimal("1.5"),
+        },
+        {
+            "design__instance__count": 12,
+            "timing__setup__ws__corner:nom_tt_025C_1v80": Decimal("1.5"),
+        },
+        4,
+    )
+    out = io.StringIO()
+    diff.render_csv(out)
+    assert out.getvalue().splitlines() == [
+        "metric,corner,before,after,delta,delta_pct,better,critical",
+        "design__instance__count,,10,12,2,20,False,False",
+        "timing__setup__ws,nom_tt_025C_1v80,1.5,1.5,0.0,0,True,False",
+    ], "Improperly rendered metric differences as CSV"
+
+
+def test_compare_multiple_csv(tmp_path):
+    import json
+    from click.testing import CliRunner
+    from openlane.common.metrics.__main__ import compare_multiple
+
+    folders = []
+    for name, count in [("a", 10), ("b", 12)]:
+        folder = tmp_path / name
+        folder.mkdir()
+        for design in ["spm", "aes"]:
+            with open(
+                folder / f"sky130A-sky130_fd_sc_hd-{design}.metrics.json", "w"
+            ) as f:
+                json.dump({"design__instance__count": count}, f)
+        folders.append(str(folder))
+    (tmp_path / "b" / "notes.txt").write_text("ignored\n")
+
+    csv_out = tmp_path / "diff.csv"
+    result = CliRunner().invoke(
+        compare_multiple,
+        ["-f", "design__instance__count", "--csv-out", str(csv_out)] + folders,
+    )
+    assert result.exit_code == 0, result.output
+    assert csv_out.read_text().splitlines() == [
+        "pdk,scl,design,metric,corner,before,after,delta,delta_pct,better,critical",
+        "sky130A,sky130_fd_sc_hd,aes,design__instance__count,,10,12,2,20,False,False",
+        "sky130A,sky130_fd_sc_hd,spm,design__instance__count,,10,12,2,20,False,False",
+    ], "Improperly rendered metric folder differences as CSV"
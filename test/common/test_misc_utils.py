@@ -340,6 +340,57 @@ def test_magic_feedback():
     ), "Violations extracted have one or more critical data mismatches"
 
 
+def test_magic_feedback_syntax():
+    from openlane.common import DRC
+    from openlane.common.drc import _tokenize_magic_feedback
+
+    feedback = "\n".join(
+        [
+            "# Generated by Magic",
+            "box -20 -40 100 200",
+            'feedback add "rule spanning',
+            ' two lines" medium',
+            "box 0 0 10 10 # trailing comment",
+            'feedback add "Illegal overlap between obsm4 and metal4 (types do not connect)" pale',
+            "",
+        ]
+    )
+    assert list(_tokenize_magic_feedback(io.StringIO(feedback))) == [
+        "box",
+        "-20",
+        "-40",
+        "100",
+        "200",
+        "feedback",
+        "add",
+        "rule spanning\n two lines",
+        "medium",
+        "box",
+        "0",
+        "0",
+        "10",
+        "10",
+        "feedback",
+        "add",
+        "Illegal overlap between obsm4 and metal4 (types do not connect)",
+        "pale",
+    ], "Wrong tokens for feedback with comments and multi-line strings"
+
+    drc_object, count = DRC.from_magic_feedback(
+        io.StringIO(feedback), Decimal("0.05"), "EXAMPLE"
+    )
+    assert count == 2, "Incorrect number of violations extracted"
+    assert drc_object.violations["UNKNOWN.UNKNOWN0"].description == (
+        "rule spanning\n two lines"
+    ), "Multi-line description not parsed"
+    assert drc_object.violations["UNKNOWN.UNKNOWN0"].bounding_boxes == [
+        (Decimal("-1"), Decimal("-2"), Decimal("5"), Decimal("10"))
+    ], "Box with negative coordinates not parsed"
+    assert drc_object.violations["obsm4-metal4.ILLEGAL_OVERLAP"].bounding_boxes == [
+        (Decimal("0"), Decimal("0"), Decimal("0.5"), Decimal("0.5"))
+    ], "Box followed by a comment not parsed"
+
+
 def test_klayout_xml():
     from openlane.common import DRC
     from xml.etree import ElementTree as ET
@@ -357,6 +408,161 @@ def test_klayout_xml():
     assert parsed.find(".//categories/category[1]/name").text == "LU.3"
 
 
+def test_klayout_xml_roundtrip():
+    from openlane.common import DRC
+
+    drc_object, count = DRC.from_magic(io.StringIO(MAGIC_EXAMPLE))
+
+    bio = io.BytesIO()
+    drc_object.to_klayout_xml(bio)
+    bio.seek(0)
+
+    parsed, parsed_count = DRC.from_klayout_xml(bio)
+    assert parsed_count == count, "Incorrect number of violations read back"
+    assert parsed.module == "RAM8", "Failed to read module name back"
+    assert (
+        parsed.violations == drc_object.violations
+    ), "Violations read back from KLayout XML do not match"
+
+
+def test_magic_drc_roundtrip():
+    from openlane.common import DRC
+
+    drc_object, count = DRC.from_magic(io.StringIO(MAGIC_EXAMPLE))
+
+    sio = io.StringIO()
+    drc_object.to_magic(sio)
+    sio.seek(0)
+
+    parsed, parsed_count = DRC.from_magic(sio)
+    assert parsed_count == count, "Incorrect number of violations read back"
+    assert parsed == drc_object, "Magic report did not round-trip"
+
+
+def test_drc_save_load(tmp_path):
+    import json
+    from openlane.common import DRC
+
+    drc_object, _ = DRC.from_magic_feedback(
+        io.StringIO(FEEDBACK_EXAMPLE), Decimal("0.05"), "EXAMPLE"
+    )
+    path = str(tmp_path / "drc.drcdb")
+    drc_object.save(path)
+    assert DRC.load(path) == drc_object, "DRC object changed after save/load"
+
+    violations = json.loads(drc_object.dumps())["violations"]
+    bounding_boxes = violations["obsm4-metal4.ILLEGAL_OVERLAP"]["bounding_boxes"]
+    assert len(bounding_boxes) == 9, "JSON export has incorrect bounding box count"
+    assert bounding_boxes[0] == [
+        11137.8,
+        4449.7,
+        11153.8,
+        4458.8,
+    ], "JSON export has incorrect bounding boxes"
+
+
+def test_drc_merge():
+    from openlane.common import DRC, Violation
+
+    box_a = (Decimal("0"), Decimal("0"), Decimal("1"), Decimal("1"))
+    box_b = (Decimal("2"), Decimal("2"), Decimal("3.5"), Decimal("3"))
+    magic = DRC("top", {"m1.1": Violation([("m1", "1")], "Width", [box_a, box_b])})
+    klayout = DRC(
+        "top",
+        {
+            "m1.1": Violation([("m1", "1")], "Spacing", [box_b]),
+            "m2.1": Violation([("m2", "1")], "Width", [box_a]),
+        },
+    )
+
+    merged = DRC.merge([magic, klayout])
+    assert list(merged.violations) == ["m1.1", "m2.1"], "Categories not merged"
+    assert merged.violations["m1.1"] == Violation(
+        [("m1", "1")], "Width", [box_a, box_b]
+    ), "Duplicate bounding boxes not removed"
+
+    merged = DRC.merge([magic, klayout], deduplicate=False)
+    assert (
+        len(merged.violations["m1.1"].bounding_boxes) == 3
+    ), "Bounding boxes removed without deduplication"
+
+
+def test_merge_klayout_xml(tmp_path):
+    from openlane.common import DRC, Violation, merge_klayout_xml
+
+    box_a = (Decimal("0"), Decimal("0"), Decimal("1"), Decimal("1"))
+    box_b = (Decimal("2"), Decimal("2"), Decimal("3.5"), Decimal("3"))
+    reports = []
+    for i, violations in enumerate(
+        [
+            {"m1.1": Violation([("m1", "1")], "Width", [box_a])},
+            {
+                "m1.1": Violation([("m1", "1")], "Width", [box_b]),
+                "m2.1": Violation([("m2", "1")], "Width", [box_a, box_b]),
+            },
+        ]
+    ):
+        path = str(tmp_path / f"{i}.xml")
+        with open(path, "wb") as f:
+            DRC("top", violations).to_klayout_xml(f)
+        reports.append(path)
+
+    bio = io.BytesIO()
+    merge_klayout_xml(reports, bio)
+    bio.seek(0)
+
+    merged, count = DRC.from_klayout_xml(bio)
+    assert count == 4, "Items lost while merging"
+    assert merged.violations == {
+        "m1.1": Violation([("m1", "1")], "Width", [box_a, box_b]),
+        "m2.1": Violation([("m2", "1")], "Width", [box_a, box_b]),
+    }, "Merged report has incorrect violations"
+
+
+def test_drc_query():
+    import random
+    from openlane.common import DRC, Violation
+
+    rng = random.Random(0)
+    violations = {}
+    for layer in ["m1", "m2", "m3"]:
+        boxes = []
+        for _ in range(500):
+            x, y = rng.randint(0, 10000), rng.randint(0, 10000)
+            boxes.append(
+                (
+                    Decimal(x) / 10,
+                    Decimal(y) / 10,
+                    Decimal(x + rng.randint(0, 100)) / 10,
+                    Decimal(y + rng.randint(0, 100)) / 10,
+                )
+            )
+        violations[f"{layer}.1"] = Violation([(layer, "1")], "Width", boxes)
+    drc_object = DRC("top", violations)
+
+    for window in [
+        (Decimal("100"), Decimal("100"), Decimal("250"), Decimal("180")),
+        (Decimal("0"), Decimal("0"), Decimal("1010"), Decimal("1010")),
+        (Decimal("-5"), Decimal("-5"), Decimal("-1"), Decimal("-1")),
+    ]:
+        lx, ly, ux, uy = window
+        expected = sorted(
+            (name, box)
+            for name, violation in violations.items()
+            for box in violation.bounding_boxes
+            if box[0] <= ux and box[2] >= lx and box[1] <= uy and box[3] >= ly
+        )
+        assert (
+            sorted(drc_object.query(window)) == expected
+        ), f"Query returned incorrect results for window {window}"
+
+    box = (Decimal("-3"), Decimal("-3"), Decimal("-2"), Decimal("-2"))
+    violations["m1.1"].bounding_boxes.append(box)
+    assert list(drc_object.query(box)) == [
+        ("m1.1", box)
+    ], "Spatial index not rebuilt after a bounding box was added"
+
+
 def test_filter_filter():
     from openlane.common import Filter
 
@@ -387,3 +593,120 @@ def test_filter_all_matching():
     assert list(Filter(["*", "!c"]).get_matching_wildcards("c")) == [
         "*",
     ], "filter did not accurately return accepting wildcard"
+
+
+def test_get_tiles():
+    from openlane.common import get_tiles
+
+    tiles = get_tiles(
+        (Decimal("0"), Decimal("0"), Decimal("250"), Decimal("100")),
+        Decimal("100"),
+        Decimal("10"),
+    )
+    assert len(tiles) == 3, "Incorrect number of tiles"
+    assert tiles[2].window == (
+        Decimal("190"),
+        Decimal("-10"),
+        Decimal("260"),
+        Decimal("110"),
+    ), "Last tile has incorrect window"
+
+    for box in [
+        (Decimal("0"), Decimal("0"), Decimal("1"), Decimal("1")),
+        (Decimal("99"), Decimal("50"), Decimal("101"), Decimal("51")),
+        (Decimal("199"), Decimal("99"), Decimal("201"), Decimal("101")),
+        (Decimal("-20"), Decimal("-20"), Decimal("-10"), Decimal("-10")),
+        (Decimal("240"), Decimal("90"), Decimal("300"), Decimal("300")),
+    ]:
+        owners = [tile for tile in tiles if tile.owns(box)]
+        assert len(owners) == 1, f"{box} is not owned by exactly one tile"
+
+
+def test_clone_files(tmp_path):
+    import os
+    from openlane.common import clone_file, clone_files
+
+    sources = []
+    for i in range(4):
+        source = tmp_path / f"in{i}.txt"
+        source.write_text(f"file {i}\n")
+        sources.append(source)
+    os.symlink(sources[0], tmp_path / "symlink.txt")
+    sources.append(tmp_path / "symlink.txt")
+
+    for mode in ["copy", "reflink", "link"]:
+        out_dir = tmp_path / mode
+        out_dir.mkdir()
+        pairs = [(source, out_dir / source.name) for source in sources]
+        stats = clone_files(pairs, mode=mode, max_workers=2)
+        assert stats.files == len(sources), "Not all files were cloned"
+        assert stats.bytes_total == sum(
+            os.path.getsize(source) for source in sources
+        ), "Incorrect total size"
+        for source, target in pairs:
+            assert not os.path.islink(target), "Symlink was not followed"
+            assert target.read_text() == source.read_text(), "Content mismatch"
+        if mode == "copy":
+            assert stats.bytes_saved == 0, "Copied files reported as saved"
+            assert not os.path.samefile(
+                sources[0], out_dir / sources[0].name
+            ), "File was linked instead of copied"
+        elif mode == "link":
+            assert (
+                stats.bytes_saved == stats.bytes_total
+            ), "Hardlinked files not reported as saved"
+
+        # Overwriting existing targets
+        clone_files(pairs, mode=mode)
+
+    # Cloning a file onto itself, directly, through a symlink or a hardlink
+    os.link(sources[1], tmp_path / "hardlink.txt")
+    for source, target in [
+        (sources[0], sources[0]),
+        (sources[0], tmp_path / "symlink.txt"),
+        (sources[1], tmp_path / "hardlink.txt"),
+    ]:
+        content = source.read_text()
+        assert clone_file(source, target) == "none", "File was cloned onto itself"
+        assert source.read_text() == content, "Source was modified"
+
+
+def test_resource_scheduler(tmp_path):
+    import time
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from openlane.common import ResourceScheduler
+
+    scheduler = ResourceScheduler(cpus=4, memory=1000)
+
+    lock = threading.Lock()
+    current = {"cpus": 0, "memory": 0}
+    peak = {"cpus": 0, "memory": 0}
+
+    def job(cpus: int, memory: int):
+        with scheduler.reserve(cpus=cpus, memory=memory) as reservation:
+            with lock:
+                for key in current:
+                    current[key] += getattr(reservation, key)
+                    peak[key] = max(peak[key], current[key])
+            time.sleep(0.01)
+            with lock:
+                for key in current:
+                    current[key] -= getattr(reservation, key)
+
+    jobs = [(1, 100), (2, 300), (3, 600), (1, 50), (8, 0), (2, 2000)] * 4
+    with ThreadPoolExecutor(max_workers=8) as tpe:
+        for future in [tpe.submit(job, *args) for args in jobs]:
+            future.result()
+
+    assert peak["cpus"] <= 4, "CPU slots were oversubscribed"
+    assert peak["memory"] <= 1000, "Memory was oversubscribed"
+
+    history_path = str(tmp_path / "history.json")
+    scheduler = ResourceScheduler(history_path=history_path)
+    assert scheduler.get_peak_memory("Step/a.log") is None, "Unexpected record"
+    scheduler.record_peak_memory("Step/a.log", 1024)
+    assert (
+        ResourceScheduler(history_path=history_path).get_peak_memory("Step/a.log")
+        == 1024
+    ), "Peak memory record was not persisted"
@@ -758,6 +758,215 @@ def test_remove_cells_from_lib(lib_trim_result):
         ), "remove_cells_from_lib produced unexpected result"
 
 
+@pytest.mark.usefixtures("_lib_mock_fs")
+def test_remove_cells_from_lib_artifact_cache(lib_trim_result):
+    from openlane.common import Toolbox, ArtifactCache, set_artifact_cache
+
+    set_artifact_cache(ArtifactCache("/cache"))
+
+    excluded_cells = frozenset(
+        open("/cwd/bad_cell_list.txt", encoding="utf8").read().strip().splitlines()
+    )
+    input_lib_files = frozenset(["/cwd/example_lib.lib", "/cwd/example_lib2.lib"])
+
+    first = Toolbox("/cwd/run1/tmp").remove_cells_from_lib(
+        input_lib_files,
+        excluded_cells=excluded_cells,
+    )
+    with mock.patch.object(
+        Toolbox,
+        "_Toolbox__remove_cells",
+        side_effect=AssertionError("cached lib file was recreated"),
+    ):
+        second = Toolbox("/cwd/run2/tmp").remove_cells_from_lib(
+            input_lib_files,
+            excluded_cells=excluded_cells,
+        )
+
+    for first_file, second_file in zip(first, second):
+        assert os.path.dirname(second_file) == "/cwd/run2/tmp"
+        contents = open(second_file, encoding="utf8").read()
+        assert (
+            contents == open(first_file, encoding="utf8").read()
+        ), "artifact cache returned a different lib file"
+        assert (
+            contents.strip() in lib_trim_result
+        ), "remove_cells_from_lib produced unexpected result"
+
+
+def test_remove_cells_from_lib_gzipped(tmp_path, sample_lib_files, lib_trim_result):
+    import gzip
+    from openlane.common import Toolbox
+
+    toolbox = Toolbox(str(tmp_path / "tmp"))
+
+    input_lib_files = []
+    for path, contents in sample_lib_files.items():
+        if path == "example_lib.lib":
+            with gzip.open(tmp_path / f"{path}.gz", "wt", encoding="utf8") as f:
+                f.write(contents)
+            input_lib_files.append(str(tmp_path / f"{path}.gz"))
+        else:
+            (tmp_path / path).write_text(contents, encoding="utf8")
+            input_lib_files.append(str(tmp_path / path))
+
+    result = toolbox.remove_cells_from_lib(
+        frozenset(input_lib_files),
+        excluded_cells=frozenset(["example_lib__cell0", "example_lib2__cell[12]"]),
+    )
+    assert len(result) == 3, "remove_cells_from_lib returned the wrong file count"
+    for file in result:
+        contents = open(file, encoding="utf8").read()
+        if "example_lib3" in contents:
+            assert (
+                contents == sample_lib_files["example_lib3.lib"]
+            ), "remove_cells_from_lib modified a lib file without excluded cells"
+        else:
+            assert (
+                contents.strip() in lib_trim_result
+            ), "remove_cells_from_lib produced unexpected result"
+
+
+def test_liberty_cell_index(tmp_path):
+    from openlane.common import get_liberty_cell_index
+
+    lib = tmp_path / "nested.lib"
+    lib.write_bytes(
+        textwrap.dedent(
+            """
+            library (nested) {
+                cell(a) { area : 1; }
+                cell ("b") {
+                    pin (A) { direction : input; }
+                    pin (Y) {
+                        timing () {
+                            related_pin : "A";
+                        }
+                    }
+                }
+                type (bus) {
+                }
+                cell (c) {
+                }
+            }"""
+        ).encode("utf8")
+    )
+    data = lib.read_bytes()
+
+    index = get_liberty_cell_index(str(lib))
+    assert index.size == len(data)
+    assert [cell.name for cell in index.cells] == ["a", "b", "c"]
+    b = index.cells[1]
+    assert data[b.start : b.end].startswith(b'    cell ("b") {\n')
+    assert data[b.start : b.end].endswith(b"        }\n    }\n")
+    assert index.cells[2].end == len(data) - 1, "last cell not closed correctly"
+    assert get_liberty_cell_index(str(lib)) is index, "index was not memoized"
+
+
+@pytest.mark.usefixtures("_lib_mock_fs")
+def test_lib_index():
+    from openlane.common import (
+        Toolbox,
+        ArtifactCache,
+        LibertyIndex,
+        LibertyCellInfo,
+        set_artifact_cache,
+    )
+
+    with open("/cwd/cells.lib", "w", encoding="utf8") as f:
+        f.write(
+            textwrap.dedent(
+                """
+                /* cell (commented_out) { */
+                library (cells) {
+                    nom_voltage : 1.8;
+                    lu_table_template (t) { variable_1 : x; }
+                    cell ("inv") {
+                        area : 3.75;
+                        cell_footprint : "inv";
+                        pin (A) {
+                            direction : "input";
+                        }
+                        pin (Y) {
+                            direction : output;
+                            timing () {
+                                related_pin : "A";
+                                cell_rise (t) { values ("1, 2"); }
+                            }
+                        }
+                    }
+                    cell (fill) {
+                        area : 1;
+                    }
+                }
+                """
+            )
+        )
+
+    index = Toolbox("/cwd/run1/tmp").get_lib_index("/cwd/cells.lib")
+    assert index.name == "cells"
+    assert index.nom_voltage == "1.8"
+    assert index.cells == {
+        "inv": LibertyCellInfo(
+            area="3.75",
+            footprint="inv",
+            pins={"A": "input", "Y": "output"},
+        ),
+        "fill": LibertyCellInfo(area="1"),
+    }, "lib index has unexpected cells"
+    assert index.has_cell("fill") and not index.has_cell("commented_out")
+    with pytest.raises(KeyError):
+        LibertyIndex(operating_conditions={"tt": {}}).get_voltage()
+
+    set_artifact_cache(ArtifactCache("/cache"))
+    first = Toolbox("/cwd/run1/tmp").get_lib_index("/cwd/example_lib2.lib")
+    with mock.patch.object(
+        LibertyIndex,
+        "build",
+        side_effect=AssertionError("cached lib index was recreated"),
+    ):
+        second = Toolbox("/cwd/run2/tmp").get_lib_index("/cwd/example_lib2.lib")
+    assert first == second, "artifact cache returned a different lib index"
+    assert second.get_voltage() == 4
+    assert os.listdir("/cwd/run2/tmp") == [], "temporary index file not removed"
+
+
+def test_artifact_cache_eviction(tmp_path):
+    from openlane.common import ArtifactCache
+
+    cache = ArtifactCache(str(tmp_path / "cache"), max_size=30)
+
+    keys = {}
+    for name in ["a", "b", "c", "d"]:
+        source = tmp_path / name
+        source.write_text(name * 10)
+        keys[name] = cache.get_key("test", [str(source)], None)
+
+    for i, name in enumerate(["a", "b", "c"]):
+        assert cache.put(keys[name], str(tmp_path / name)), "failed to store entry"
+        entry = os.path.join(cache.path, keys[name][:2], keys[name])
+        os.utime(entry, (i, i))
+
+    assert cache.get(keys["a"], str(tmp_path / "a_out")), "entry not found"
+    assert cache.put(keys["d"], str(tmp_path / "d")), "failed to store entry"
+
+    assert not cache.get(
+        keys["b"], str(tmp_path / "b_out")
+    ), "least recently used entry not evicted"
+    for name in ["a", "c", "d"]:
+        out = tmp_path / f"{name}_out"
+        assert cache.get(keys[name], str(out)), f"entry {name} wrongly evicted"
+        assert out.read_text() == name * 10, "cached entry has the wrong contents"
+
+    # Entries handed out must not share their contents with the cache
+    with open(tmp_path / "a_out", "a") as f:
+        f.write("modified")
+    assert cache.get(keys["a"], str(tmp_path / "a_out2")), "entry not found"
+    assert (
+        tmp_path / "a_out2"
+    ).read_text() == "a" * 10, "modifying a handed out entry modified the cache"
+
+
 @mock.patch.dict(os.environ, {"PATH": "/bin"})
 @pytest.mark.usefixtures("_chdir_tmp")
 def test_blackbox_creation_no_yosys(model_blackboxing):
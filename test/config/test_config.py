@@ -574,6 +574,45 @@ def test_pdk():
     ], "invalid PDK did not return suggestions in warnings"
 
 
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables()
+def test_pdk_artifact_cache():
+    from unittest import mock
+    from openlane.config import Config
+    from openlane.common import ArtifactCache, TclUtils, set_artifact_cache
+
+    set_artifact_cache(ArtifactCache("/cache"))
+
+    def load():
+        Config._Config__get_pdk_raw.cache_clear()
+        cfg, _ = Config.load(
+            {
+                "DESIGN_NAME": "whatever",
+                "VERILOG_FILES": "dir::src/*.v",
+            },
+            config.flow_common_variables,
+            pdk="dummy",
+            design_dir="/cwd",
+            pdk_root="/pdk",
+        )
+        return cfg
+
+    first = load()
+    with mock.patch.object(
+        TclUtils,
+        "_eval_env",
+        side_effect=AssertionError("PDK configuration was evaluated again"),
+    ):
+        second = load()
+    assert first == second, "cached PDK configuration differs"
+
+    with open("/pdk/dummy/libs.tech/openlane/config.tcl", "a") as f:
+        f.write('set ::env(LIB_SYNTH) "changed.lib"\n')
+    with mock.patch.object(TclUtils, "_eval_env", wraps=TclUtils._eval_env) as eval_env:
+        load()
+    assert eval_env.called, "changed PDK configuration was not re-evaluated"
+
+
 @pytest.mark.usefixtures("_mock_conf_fs")
 @mock_variables()
 def test_invalid_keys(caplog: pytest.LogCaptureFixture):
@@ -309,6 +309,14 @@ def _mock_progress():
         yield
 
 
+@pytest.fixture(autouse=True)
+def _no_artifact_cache():
+    from openlane.common import artifact_cache
+
+    with mock.patch.object(artifact_cache, "_ARTIFACT_CACHE", None):
+        yield
+
+
 def pytest_configure():
     pytest.COMMON_FLOW_VARS = COMMON_FLOW_VARS
     pytest.mock_variables = mock_variables
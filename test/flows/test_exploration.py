@@ -0,0 +1,145 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import csv
+
+import pytest
+
+from openlane.flows import flow as flow_module, sequential as sequential_flow_module
+from openlane.steps import step as step_module
+
+mock_variables = pytest.mock_variables
+
+
+@pytest.fixture
+def DummyExploration():
+    from openlane.config import Variable
+    from openlane.steps import Step
+    from openlane.flows.exploration import Exploration
+
+    class Lint(Step):
+        id = "Test.Lint"
+        inputs = []
+        outputs = []
+
+        def run(self, state_in, **kwargs):
+            return {}, {}
+
+    class Scale(Step):
+        id = "Test.Scale"
+        inputs = []
+        outputs = []
+
+        config_vars = [Variable("FACTOR", int, "x", default=1)]
+
+        def run(self, state_in, **kwargs):
+            return {}, {"value": self.config["FACTOR"] * 2}
+
+    class Count(Step):
+        id = "Test.Count"
+        inputs = []
+        outputs = []
+
+        def run(self, state_in, **kwargs):
+            return {}, {"count": state_in.metrics.get("count", 0) + 1}
+
+    class DummyExploration(Exploration):
+        Steps = [Lint, Scale, Count]
+        config_vars = Exploration.config_vars + [
+            Variable("RUN_COUNT", bool, "x", default=True)
+        ]
+        gating_config_vars = {"Test.Count": ["RUN_COUNT"]}
+
+    return DummyExploration
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_exploration(DummyExploration):
+    flow = DummyExploration(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+            "EXPLORATION_SWEEP": {"FACTOR": [1, 2, 3], "RUN_COUNT": [True, False]},
+            "EXPLORATION_PRUNING": {"Test.Scale": ["value <= 4"]},
+            "EXPLORATION_METRICS": ["value", "count"],
+            "EXPLORATION_MAX_CONCURRENT": 2,
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+    flow.start(tag="explore")
+
+    run_dir = "/cwd/runs/explore"
+    with open(os.path.join(run_dir, "exploration.csv"), encoding="utf8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert [
+        (row["FACTOR"], row["RUN_COUNT"], row["Status"], row["value"], row["count"])
+        for row in rows
+    ] == [
+        ("1", "True", "completed", "2", "1"),
+        ("1", "False", "completed", "2", ""),
+        ("2", "True", "completed", "4", "1"),
+        ("2", "False", "completed", "4", ""),
+        ("3", "True", "pruned", "6", ""),
+        ("3", "False", "pruned", "6", ""),
+    ], "Unexpected exploration results"
+    assert "value <= 4" in rows[4]["Reason"], "Pruning reason not reported"
+    assert os.path.isdir(
+        os.path.join(run_dir, "0", "3-test-count")
+    ), "Candidate step directory not created"
+    assert not os.path.exists(
+        os.path.join(run_dir, "4", "3-test-count")
+    ), "Step was run for a pruned candidate"
+
+    # Lint is shared by all candidates, Scale by candidates with the same
+    # FACTOR, and Count only runs if RUN_COUNT is set
+    assert sorted(step.id for step in flow.step_objects) == [
+        "Test.Count",
+        "Test.Count",
+        "Test.Lint",
+        "Test.Scale",
+        "Test.Scale",
+        "Test.Scale",
+    ], "Shared steps were not run exactly once"
+    assert not os.path.exists(
+        os.path.join(run_dir, "1")
+    ), "Shared steps were run in a candidate's own directory"
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_exploration_bad_sweep(DummyExploration):
+    from openlane.flows import FlowException
+
+    for sweep, message in [
+        ({"NOT_A_VARIABLE": [1]}, "no such variable"),
+        ({"FACTOR": ["not a number"]}, "Invalid value for swept variable"),
+    ]:
+        flow = DummyExploration(
+            {
+                "DESIGN_NAME": "WHATEVER",
+                "VERILOG_FILES": ["/cwd/src/a.v"],
+                "EXPLORATION_SWEEP": sweep,
+            },
+            design_dir="/cwd",
+            pdk="dummy",
+            scl="dummy_scl",
+            pdk_root="/pdk",
+        )
+        with pytest.raises(FlowException, match=message):
+            flow.start()
@@ -339,3 +339,159 @@ def test_run_tags(caplog: pytest.LogCaptureFixture, MockStepTuple):
         FlowException, match="already exists as a file and not a directory"
     ):
         flow.start(tag="MY_TAG3")
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow, step])
+def test_start_step_async_chaining(MockStepTuple):
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from openlane.common import get_tpe, set_tpe
+    from openlane.flows import SequentialFlow
+    from openlane.state import State
+
+    StepA, StepB, _ = MockStepTuple
+
+    class DummySeq(SequentialFlow):
+        Steps = [StepB, StepA]
+
+    def run_override(self, initial_state, **kwargs):
+        pending: Future[State] = Future()
+        waiting_step = StepB(self.config, state_in=pending)
+        waiting_future = self.start_step_async(waiting_step)
+
+        # Only one worker: it must not be occupied by the waiting step
+        ready_step = StepB(self.config, state_in=initial_state)
+        ready_future = self.start_step_async(ready_step)
+        chained_step = StepA(self.config, state_in=ready_future)
+        chained_future = self.start_step_async(chained_step)
+        assert (
+            chained_future.result(timeout=10).metrics["step"] == 1
+        ), "Chained step did not run after its input was realized"
+        assert not waiting_future.done(), "Step ran before its input was realized"
+
+        pending.set_result(initial_state)
+        assert (
+            waiting_future.result(timeout=10).metrics["step"] == 0
+        ), "Waiting step did not run after its input was realized"
+
+        failed: Future[State] = Future()
+        failed.set_exception(ValueError("upstream failure"))
+        failed_future = self.start_step_async(StepB(self.config, state_in=failed))
+        with pytest.raises(ValueError, match="upstream failure"):
+            failed_future.result(timeout=10)
+
+        return initial_state, []
+
+    DummySeq.run = run_override
+
+    previous_tpe = get_tpe()
+    set_tpe(ThreadPoolExecutor(max_workers=1))
+    try:
+        flow = DummySeq(
+            {
+                "DESIGN_NAME": "WHATEVER",
+                "DUMMY_VARIABLE": "PINGAS",
+                "VERILOG_FILES": ["/cwd/src/a.v"],
+            },
+            design_dir="/cwd",
+            pdk="dummy",
+            scl="dummy_scl",
+            pdk_root="/pdk",
+        )
+        flow.start()
+    finally:
+        set_tpe(previous_tpe)
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow, step])
+def test_resume_lazy_steps(MockStepTuple):
+    from unittest import mock
+    from openlane.flows import SequentialFlow
+    from openlane.steps import Step
+
+    StepA, StepB, _ = MockStepTuple
+
+    class DummySeq(SequentialFlow):
+        Steps = [StepB, StepA]
+
+    flow = DummySeq(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "DUMMY_VARIABLE": "PINGAS",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+    flow.start(tag="LAZY")
+
+    with mock.patch.object(
+        Step, "load_finished", wraps=Step.load_finished
+    ) as load_finished:
+        state = flow.start(tag="LAZY")
+        assert state.metrics["step"] == 3, "resumed run did not use the latest state"
+        assert (
+            load_finished.call_count == 0
+        ), "concluded steps were loaded before being accessed"
+
+        assert len(flow.step_objects) == 4
+        assert flow.step_objects[-1].state_out.metrics["step"] == 3
+        assert load_finished.call_count == 0, "new steps were reloaded from disk"
+
+        first = flow.step_objects[0]
+        assert first.id == "Test.StepB"
+        assert first.state_out.metrics["step"] == 0
+        assert flow.step_objects[0] is first, "concluded step was loaded twice"
+        assert load_finished.call_count == 1
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow, step])
+def test_run_manifest(MockStepTuple):
+    from openlane.flows import SequentialFlow
+    from openlane.common import RunManifest
+
+    StepA, StepB, _ = MockStepTuple
+
+    class DummySeq(SequentialFlow):
+        Steps = [StepB, StepA]
+
+    flow = DummySeq(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "DUMMY_VARIABLE": "PINGAS",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+    flow.start(tag="MANIFEST")
+
+    manifest = RunManifest("/cwd/runs/MANIFEST")
+    entries = manifest.get_entries()
+    assert [(entry.ordinal, entry.id, entry.status) for entry in entries] == [
+        (1, "Test.StepB", "success"),
+        (2, "Test.StepA", "success"),
+    ], "manifest has unexpected entries"
+    assert all(entry.runtime is not None for entry in entries)
+    assert manifest.get_latest_state() == os.path.join(
+        "/cwd/runs/MANIFEST", entries[-1].dir, "state_out.json"
+    )
+
+    # Runs without a manifest are indexed on resumption
+    os.unlink(manifest.path)
+    state = flow.start(tag="MANIFEST")
+    assert state.metrics["step"] == 3, "resumed run did not use the latest state"
+    assert [(entry.ordinal, entry.status) for entry in manifest.get_entries()] == [
+        (1, "success"),
+        (2, "success"),
+        (3, "success"),
+        (4, "success"),
+    ], "manifest was not recreated from the run directory"
+    assert manifest.get_entries()[0].id is None
+    assert manifest.get_entries()[-1].id == "Test.StepA"
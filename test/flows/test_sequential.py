@@ -11,7 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Type
+import os
+from typing import List, Set, Type
 
 import pytest
 
@@ -403,3 +404,172 @@ def test_gating_validation(MetricIncrementer):
 
         class _Test2(Dummy):
             gating_config_vars = {"Test.MetricIncrementer": ["BAD_GATING_VARIABLE"]}
+
+
+def test_step_dependencies():
+    from openlane.state import DesignFormat
+    from openlane.flows.sequential import get_step_dependencies
+
+    class Producer(Step):
+        inputs = []
+        outputs = [DesignFormat.NETLIST]
+        metrics_in = []
+
+    class Consumer(Step):
+        inputs = [DesignFormat.NETLIST]
+        outputs = []
+        metrics_in = []
+        metrics_out = []
+
+    class Updater(Step):
+        inputs = []
+        outputs = [DesignFormat.NETLIST, DesignFormat.DEF]
+        metrics_in = []
+        metrics_out = ["design__updated__count"]
+
+    class MetricReader(Step):
+        inputs = []
+        outputs = []
+        metrics_in = ["design__*"]
+        metrics_out = []
+
+    class UpdateReader(Step):
+        inputs = []
+        outputs = []
+        metrics_in = ["design__updated__count"]
+        metrics_out = []
+
+    class UndeclaredReader(Step):
+        inputs = []
+        outputs = []
+
+    assert get_step_dependencies(
+        [
+            Producer,
+            Consumer,
+            Consumer,
+            Updater,
+            Consumer,
+            MetricReader,
+            Consumer,
+            UpdateReader,
+            UndeclaredReader,
+        ]
+    ) == [
+        set(),
+        {0},
+        {0},
+        {0},
+        {3},
+        {0, 3},
+        {3},
+        {0, 3},
+        {0, 3},
+    ], "Step dependencies were not derived properly"
+
+    class OtherUpdater(Updater):
+        metrics_out = ["timing__*"]
+
+    assert get_step_dependencies([OtherUpdater, MetricReader, UpdateReader]) == [
+        set(),
+        set(),
+        set(),
+    ], "Steps depend on steps not emitting the metrics they read"
+
+
+def test_classic_signoff_dependencies():
+    from openlane.flows import Flow
+    from openlane.flows.sequential import get_step_dependencies
+
+    steps = Flow.factory.get("Classic").Steps
+    dependencies = get_step_dependencies(steps)
+    ancestors: List[Set[int]] = []
+    for direct in dependencies:
+        ancestors.append(direct.union(*[ancestors[i] for i in direct]))
+
+    ids = [step.id for step in steps]
+    signoff = [ids.index(id) for id in ["KLayout.XOR", "Magic.DRC", "KLayout.DRC"]]
+    for i in signoff:
+        assert not ancestors[i].intersection(
+            signoff
+        ), f"{ids[i]} waits for another signoff check"
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_parallel_steps(MetricIncrementer):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from openlane.common import Path, get_tpe, set_tpe
+    from openlane.flows import SequentialFlow
+    from openlane.state import DesignFormat
+
+    barrier = threading.Barrier(2, timeout=10)
+
+    class Producer(Step):
+        id = "Test.Producer"
+        inputs = []
+        outputs = [DesignFormat.NETLIST]
+        metrics_in = []
+
+        def run(self, state_in, **kwargs):
+            netlist = os.path.join(self.step_dir, "nl.v")
+            with open(netlist, "w") as f:
+                f.write("module x; endmodule")
+            return {DesignFormat.NETLIST: Path(netlist)}, {"produced": 1}
+
+    class ConsumerA(Step):
+        id = "Test.ConsumerA"
+        inputs = [DesignFormat.NETLIST]
+        outputs = []
+        metrics_in = []
+
+        def run(self, state_in, **kwargs):
+            barrier.wait()
+            return {}, {"consumer_a": 1}
+
+    class ConsumerB(ConsumerA):
+        id = "Test.ConsumerB"
+
+        def run(self, state_in, **kwargs):
+            barrier.wait()
+            return {}, {"consumer_b": 1}
+
+    class Dummy(SequentialFlow):
+        Steps = [Producer, ConsumerA, ConsumerB, MetricIncrementer]
+
+    flow = Dummy(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+            "PARALLEL_STEPS": True,
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+
+    previous_tpe = get_tpe()
+    set_tpe(ThreadPoolExecutor(max_workers=4))
+    try:
+        state = flow.start(tag="parallel")
+    finally:
+        set_tpe(previous_tpe)
+
+    assert state[DesignFormat.NETLIST] is not None, "Produced view was lost"
+    assert state.metrics == {
+        "produced": 1,
+        "consumer_a": 1,
+        "consumer_b": 1,
+        "counter": 1,
+    }, "Parallel flow returned unexpected metrics"
+    assert sorted(
+        entry for entry in os.listdir("/cwd/runs/parallel") if entry[0].isdigit()
+    ) == [
+        "1-test-producer",
+        "2-test-consumera",
+        "3-test-consumerb",
+        "4-test-metricincrementer",
+    ], "Unexpected step directories for parallel flow"
@@ -125,6 +125,28 @@ def test_copy():
     assert state_copy.metrics == test_metrics
 
 
+def test_derived():
+    from openlane.common import GenericImmutableDict
+    from openlane.state import DesignFormat, State
+
+    state = State({"nl": "abc"}, metrics={"metric": "a", "other": 1})
+    derived = State(
+        state,
+        overrides={DesignFormat.DEF: "def"},
+        metrics=GenericImmutableDict(state.metrics, overrides={"metric": "b"}),
+    )
+
+    assert derived[DesignFormat.NETLIST] == "abc"
+    assert derived[DesignFormat.DEF] == "def"
+    assert state[DesignFormat.DEF] is None, "original state was modified"
+    assert list(derived.keys()) == list(
+        state.keys()
+    ), "derived state has different keys"
+    assert derived.metrics == {"metric": "b", "other": 1}
+    assert state.metrics == {"metric": "a", "other": 1}
+    assert State(derived, metrics=derived.metrics).metrics is derived.metrics
+
+
 def test_empty():
     from openlane.state import DesignFormat, State
 
@@ -238,3 +260,88 @@ def test_loads():
 
     new_state = State.loads(json.dumps(state.to_raw_dict()))
     assert new_state.to_raw_dict() == state.to_raw_dict()
+
+
+@pytest.mark.usefixtures("_mock_fs")
+def test_save_delta():
+    import json
+    from openlane.state import State, InvalidState
+
+    for file in ["test.nl.v", "test.def", "test2.def"]:
+        with open(file, "w") as f:
+            f.write("\n")
+
+    os.makedirs("step_1")
+    os.makedirs("step_2")
+
+    state_in = State({"nl": "test.nl.v"}, metrics={"metric": 1})
+    state_in.save("step_1/state_in.json", delta_root=".")
+    assert State.base_key not in json.load(
+        open("step_1/state_in.json")
+    ), "state without a base was not saved in full"
+
+    state_out = State(
+        state_in,
+        overrides={"def": "test.def"},
+        metrics={"metric": 1, "metric2": 2},
+    )
+    state_out.save("step_1/state_out.json", base=state_in)
+    assert State.base_key not in json.load(
+        open("step_1/state_out.json")
+    ), "state was saved as a delta without a delta root"
+
+    state_out.save("step_1/state_out.json", base=state_in, delta_root=".")
+    assert json.load(open("step_1/state_out.json")) == {
+        State.base_key: "state_in.json",
+        "def": "test.def",
+        "metrics": {"metric2": 2},
+    }, "state was not saved as a delta against its base"
+
+    state_2_in = State.load("step_1/state_out.json")
+    assert state_2_in.to_raw_dict() == state_out.to_raw_dict()
+
+    state_2_in.save("step_2/state_in.json", delta_root="step_2")
+    assert State.base_key not in json.load(
+        open("step_2/state_in.json")
+    ), "state was saved as a delta against a state outside the delta root"
+
+    state_2_in.save("step_2/state_in.json", delta_root=".")
+    assert json.load(open("step_2/state_in.json")) == {
+        State.base_key: os.path.join("..", "step_1", "state_out.json"),
+        "metrics": {},
+    }, "loaded state was not saved as a reference to its file"
+
+    state_2_out = State(
+        state_2_in, overrides={"def": "test2.def"}, metrics=state_2_in.metrics
+    )
+    state_2_out.save("step_2/state_out.json", base=state_2_in, delta_root=".")
+    assert (
+        State.load("step_2/state_out.json").to_raw_dict() == state_2_out.to_raw_dict()
+    )
+
+    with pytest.raises(InvalidState, match="must be loaded from a file"):
+        State.loads(open("step_2/state_out.json").read())
+
+
+@pytest.mark.usefixtures("_mock_fs")
+def test_save_delta_depth(monkeypatch):
+    import json
+    from openlane.state import State
+
+    monkeypatch.setattr(State, "max_delta_depth", 2)
+
+    previous = State(metrics={"iteration": 0})
+    previous.save("state_0.json", delta_root=".")
+    for i in range(1, 4):
+        state = State(previous, metrics={"iteration": i})
+        state.save(f"state_{i}.json", base=previous, delta_root=".")
+        previous = state
+
+    saved = [json.load(open(f"state_{i}.json")) for i in range(4)]
+    assert [State.base_key in raw for raw in saved] == [
+        False,
+        True,
+        True,
+        False,
+    ], "delta chain was not limited to the maximum depth"
+    assert State.load("state_3.json").metrics["iteration"] == 3
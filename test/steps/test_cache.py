@@ -0,0 +1,119 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import pytest
+
+from openlane.steps import step
+
+mock_variables = pytest.mock_variables
+
+
+@pytest.fixture
+def CountingStep():
+    from openlane.common import Path
+    from openlane.state import DesignFormat
+    from openlane.steps import Step
+
+    class CountingStep(Step):
+        id = "Test.CountingStep"
+        inputs = [DesignFormat.NETLIST]
+        outputs = [DesignFormat.POWERED_NETLIST]
+        metrics_in = []
+
+        run_count = 0
+
+        def run(self, state_in, **kwargs):
+            CountingStep.run_count += 1
+            out = os.path.join(self.step_dir, "out.pnl.v")
+            with open(out, "w") as f:
+                f.write(open(state_in[DesignFormat.NETLIST]).read().upper())
+            with open(os.path.join(self.step_dir, "report.rpt"), "w") as f:
+                f.write("report\n")
+            return {DesignFormat.POWERED_NETLIST: Path(out)}, {"test__count": 4}
+
+    return CountingStep
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([step])
+def test_step_cache(mock_config, CountingStep):
+    from openlane.common import Path, Toolbox
+    from openlane.state import DesignFormat, State
+    from openlane.steps import StepCache, set_step_cache
+
+    with open("/cwd/in.nl.v", "w") as f:
+        f.write("module a; endmodule\n")
+
+    state_in = State({DesignFormat.NETLIST: Path("/cwd/in.nl.v")})
+    toolbox = Toolbox(tmp_dir="/cwd/tmp")
+
+    set_step_cache(StepCache("/cwd/cache"))
+    try:
+        first = CountingStep(config=mock_config, state_in=state_in).start(
+            toolbox=toolbox, step_dir="/cwd/1-counting"
+        )
+        second = CountingStep(config=mock_config, state_in=state_in).start(
+            toolbox=toolbox, step_dir="/cwd/2-counting"
+        )
+        assert CountingStep.run_count == 1, "Step was re-run despite cache hit"
+        assert (
+            second[DesignFormat.POWERED_NETLIST] == "/cwd/2-counting/out.pnl.v"
+        ), "Cached view was not restored into the new step directory"
+        assert (
+            open(second[DesignFormat.POWERED_NETLIST]).read()
+            == open(first[DesignFormat.POWERED_NETLIST]).read()
+        ), "Restored view does not match original"
+        assert os.path.exists(
+            "/cwd/2-counting/report.rpt"
+        ), "Other step files were not restored"
+        assert second.metrics == first.metrics, "Restored metrics do not match"
+
+        with open("/cwd/in.nl.v", "w") as f:
+            f.write("module b; endmodule\n")
+
+        CountingStep(config=mock_config, state_in=state_in).start(
+            toolbox=toolbox, step_dir="/cwd/3-counting"
+        )
+        assert CountingStep.run_count == 2, "Changed input did not invalidate cache"
+    finally:
+        set_step_cache(None)
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([step])
+def test_step_cache_uncacheable(mock_config):
+    from openlane.common import Path, Toolbox
+    from openlane.state import DesignFormat, State
+    from openlane.steps import Step, StepCache
+
+    with open("/cwd/in.nl.v", "w") as f:
+        f.write("module a; endmodule\n")
+
+    class OutsideStep(Step):
+        id = "Test.OutsideStep"
+        inputs = []
+        outputs = [DesignFormat.POWERED_NETLIST]
+
+        def run(self, state_in, **kwargs):
+            return {DesignFormat.POWERED_NETLIST: Path("/cwd/in.nl.v")}, {}
+
+    cache = StepCache("/cwd/cache")
+    outside = OutsideStep(config=mock_config, state_in=State())
+    outside.start(toolbox=Toolbox(tmp_dir="/cwd/tmp"), step_dir="/cwd/1-outside")
+    key = cache.get_key(outside, State())
+    assert not cache.store(
+        key, "/cwd/1-outside", {DesignFormat.POWERED_NETLIST: Path("/cwd/in.nl.v")}, {}
+    ), "Result with a view outside of the step directory was cached"
+    assert cache.restore(key, "/cwd/2-outside") is None, "Unexpected cache hit"
@@ -0,0 +1,98 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_xor_partitioned():
+    from openlane.common import Path, ResourceScheduler
+    from openlane.state import DesignFormat, State
+    from openlane.steps import klayout
+    from openlane.steps.klayout import XOR
+
+    for name in ["a.gds", "b.gds"]:
+        with open(name, "w") as f:
+            f.write("\n")
+    state_in = State(
+        {
+            DesignFormat.MAG_GDS: Path(os.path.abspath("a.gds")),
+            DesignFormat.KLAYOUT_GDS: Path(os.path.abspath("b.gds")),
+        },
+        metrics={"design__die__bbox": "0 0 100 100"},
+    )
+
+    step = XOR.__new__(XOR)
+    step.config = {
+        "DESIGN_NAME": "xor",
+        "KLAYOUT_XOR_IGNORE_LAYERS": None,
+        "KLAYOUT_XOR_TILE_SIZE": None,
+        "KLAYOUT_XOR_THREADS": 8,
+        "KLAYOUT_XOR_PARTITION_SIZE": Decimal(50),
+        "KLAYOUT_XOR_PARTITION_OVERLAP": Decimal(10),
+        "KLAYOUT_XOR_WORKERS": None,
+        "KLAYOUT_XOR_MAX_DIFFERENCES": None,
+    }
+    step.step_dir = os.getcwd()
+
+    commands = []
+
+    def run_subprocess(command, **kwargs):
+        commands.append(command)
+        return {"generated_metrics": {"design__xor_difference__count": 2}}
+
+    def get_option(command, option):
+        return command[command.index(option) + 1]
+
+    scheduler = ResourceScheduler(cpus=8, memory=1000)
+    worker_counts = []
+    tpe = klayout.ThreadPoolExecutor
+
+    def thread_pool_executor(max_workers):
+        worker_counts.append(max_workers)
+        return tpe(max_workers=max_workers)
+
+    with mock.patch.object(
+        klayout, "get_scheduler", return_value=scheduler
+    ), mock.patch.object(
+        klayout, "ThreadPoolExecutor", side_effect=thread_pool_executor
+    ), mock.patch.object(
+        klayout, "merge_klayout_xml"
+    ), mock.patch.object(
+        step, "run_subprocess", side_effect=run_subprocess
+    ):
+        _, metrics = step.run(state_in, env={})
+        assert worker_counts == [1], "Partitions run in parallel without history"
+
+        scheduler.record_peak_memory(f"{XOR.id}/xor.log", 300)
+        step.run(state_in, env={})
+        assert worker_counts[1] == 3, "Workers not bounded by recorded peak memory"
+
+    assert metrics == {
+        "design__xor_difference__count": 8
+    }, "Partition differences not summed"
+
+    partitions = sorted(
+        (get_option(command, "--core"), get_option(command, "--window"))
+        for command in commands[:4]
+    )
+    assert partitions == [
+        ("* * 50 50", "* * 60 60"),
+        ("* 50 50 *", "* 40 60 *"),
+        ("50 * * 50", "40 * * 60"),
+        ("50 50 * *", "40 40 * *"),
+    ], "Wrong partition cores or windows"
@@ -0,0 +1,89 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_drc_tiled():
+    from openlane.common import DRC as DRCObject
+    from openlane.state import State
+    from openlane.steps import magic
+    from openlane.steps.magic import DRC
+
+    # Two violations: one within the overlap of all four tiles, one in the
+    # bottom left tile only
+    violations = [
+        ("Metal spacing < 0.14um (met1.2)", (48, 48, 50, 50)),
+        ("Via enclosure < 0.03um (via.4a)", (10, 10, 12, 12)),
+    ]
+
+    step = DRC.__new__(DRC)
+    step.config = {
+        "DESIGN_NAME": "tiled",
+        "MAGIC_DRC_TILE_SIZE": Decimal(50),
+        "MAGIC_DRC_TILE_OVERLAP": Decimal(10),
+        "MAGIC_DRC_WORKERS": 2,
+    }
+    step.step_dir = os.getcwd()
+
+    windows = []
+
+    def run(state_in, env, **kwargs):
+        lx, ly, ux, uy = [Decimal(coord) for coord in env["_DRC_WINDOW"].split()]
+        windows.append((lx, ly, ux, uy))
+        with open(env["_DRC_REPORT"], "w", encoding="utf8") as f:
+            f.write("tiled\n")
+            f.write("-" * 40 + "\n")
+            for description, (v_lx, v_ly, v_ux, v_uy) in violations:
+                if v_ux < lx or v_lx > ux or v_uy < ly or v_ly > uy:
+                    continue
+                f.write(f"{description}\n")
+                f.write("-" * 40 + "\n")
+                f.write(f"{v_lx}um {v_ly}um {v_ux}um {v_uy}um\n")
+                f.write("-" * 40 + "\n")
+        return {}, {}
+
+    with mock.patch.object(magic.MagicStep, "run", side_effect=run):
+        _, metrics = step.run(
+            State(metrics={"design__die__bbox": "0 0 100 100"}), env={}
+        )
+
+    assert sorted(windows) == [
+        (-10, -10, 60, 60),
+        (-10, 40, 60, 110),
+        (40, -10, 110, 60),
+        (40, 40, 110, 110),
+    ], "Wrong tile windows checked"
+    assert (
+        metrics["magic__drc_error__count"] == 2
+    ), "Violations in the overlap of multiple tiles not counted once"
+
+    with open(
+        os.path.join("reports", "drc_violations.magic.rpt"), encoding="utf8"
+    ) as f:
+        merged, count = DRCObject.from_magic(f)
+    assert count == 2, "Merged report has the wrong number of violations"
+    assert sorted(merged.violations) == [
+        "met1.2",
+        "via.4a",
+    ], "Merged report has the wrong violations"
+
+    database = DRCObject.load(metrics["magic__drc__database"])
+    assert sorted(database.violations) == sorted(
+        merged.violations
+    ), "Saved database does not match the report"
@@ -0,0 +1,224 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+from unittest import mock
+
+import pytest
+
+
+def write_odb(path: str, content: str = "odb"):
+    with open(path, "w", encoding="utf8") as f:
+        f.write(content)
+    return os.path.abspath(path)
+
+
+@pytest.fixture
+def mock_server():
+    from openlane.steps import odb_server
+    from openlane.steps.odb_server import OdbServer
+
+    processes = []
+
+    def popen(args, **kwargs):
+        # The server creates its socket once it is ready
+        with open(args[-1], "w", encoding="utf8"):
+            pass
+        process = mock.MagicMock()
+        process.poll.return_value = None
+        processes.append(process)
+        return process
+
+    with mock.patch.object(
+        odb_server.subprocess, "Popen", side_effect=popen
+    ), mock.patch.object(odb_server.socket, "socket") as socket_class:
+        OdbServer.set_enabled(True)
+        try:
+            yield processes, socket_class
+        finally:
+            OdbServer.set_enabled(False)
+
+
+def get_sent_messages(socket_class):
+    connection = socket_class.return_value.__enter__.return_value
+    return [json.loads(call.args[0]) for call in connection.sendall.call_args_list]
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_odb_server_disabled():
+    from openlane.steps.odb_server import OdbServer
+
+    in_odb = write_odb("in.odb")
+    with mock.patch("subprocess.Popen") as popen:
+        assert OdbServer.acquire(in_odb, {}) is None, "Disabled server was acquired"
+        popen.assert_not_called()
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_odb_server_reuse(mock_server):
+    from openlane.steps.odb_server import OdbServer
+
+    processes, socket_class = mock_server
+
+    in_odb = write_odb("in.odb")
+    server = OdbServer.acquire(in_odb, {})
+    assert server is not None, "Server was not started"
+    assert server.busy, "Acquired server not marked as busy"
+    assert server.reuse_db is None, "Freshly started server reused a database"
+
+    out_odb = write_odb("out.odb")
+    server.release(out_odb)
+    assert not server.busy, "Released server still marked as busy"
+
+    reused = OdbServer.acquire(out_odb, {})
+    assert reused is server, "Server was not reused for its resident database"
+    assert reused.reuse_db == os.path.realpath(
+        out_odb
+    ), "Resident database was not passed to the next step"
+    assert len(processes) == 1, "A second OpenROAD process was launched"
+    assert get_sent_messages(socket_class) == [], "Reused server was shut down"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_odb_server_restart(mock_server):
+    from openlane.steps.odb_server import OdbServer
+
+    processes, socket_class = mock_server
+
+    in_odb = write_odb("in.odb")
+    server = OdbServer.acquire(in_odb, {})
+    out_odb = write_odb("out.odb")
+    server.release(out_odb)
+
+    # Not the resident database
+    other = OdbServer.acquire(in_odb, {})
+    assert other is not None, "Server was not restarted"
+    assert other is not server, "Server was not restarted"
+    assert other.reuse_db is None, "Restarted server reused a database"
+    assert len(processes) == 2, "No new OpenROAD process was launched"
+    assert get_sent_messages(socket_class) == [
+        {"shutdown": True}
+    ], "Previous server was not shut down"
+    processes[0].wait.assert_called()
+    other.release(out_odb)
+
+    # The resident database, modified since
+    write_odb(out_odb, "modified odb")
+    modified = OdbServer.acquire(out_odb, {})
+    assert modified is not None, "Server was not restarted"
+    assert modified is not other, "Server was reused for a modified database"
+    assert len(processes) == 3, "No new OpenROAD process was launched"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_odb_server_busy(mock_server):
+    from openlane.steps.odb_server import OdbServer
+
+    processes, _ = mock_server
+
+    in_odb = write_odb("in.odb")
+    server = OdbServer.acquire(in_odb, {})
+    assert server is not None, "Server was not started"
+    assert (
+        OdbServer.acquire(in_odb, {}) is None
+    ), "Busy server was acquired by a second step"
+    assert len(processes) == 1, "A second OpenROAD process was launched"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_odb_server_failed_step(mock_server):
+    from openlane.steps.odb_server import OdbServer
+
+    processes, socket_class = mock_server
+
+    in_odb = write_odb("in.odb")
+    server = OdbServer.acquire(in_odb, {})
+    server.release(None)
+
+    assert get_sent_messages(socket_class) == [
+        {"shutdown": True}
+    ], "Server was not shut down after a failed step"
+    processes[0].wait.assert_called()
+
+    restarted = OdbServer.acquire(in_odb, {})
+    assert restarted is not server, "Server was reused after a failed step"
+    assert len(processes) == 2, "No new OpenROAD process was launched"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_odb_server_startup_failure(mock_server):
+    from openlane.steps import odb_server
+    from openlane.steps.odb_server import OdbServer
+
+    in_odb = write_odb("in.odb")
+    process = mock.MagicMock()
+    process.poll.return_value = 1
+    with mock.patch.object(odb_server.subprocess, "Popen", return_value=process):
+        assert (
+            OdbServer.acquire(in_odb, {}) is None
+        ), "Server that exited on startup was acquired"
+    assert OdbServer.acquire(in_odb, {}) is None, "Server not disabled after failure"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_odb_server_get_command(mock_server):
+    import sys
+    from openlane.steps.odb_server import OdbServer
+
+    in_odb = write_odb("in.odb")
+    server = OdbServer.acquire(in_odb, {})
+
+    command = [
+        "openroad",
+        "-exit",
+        "-no_splash",
+        "-metrics",
+        "/run/or_metrics_out.json",
+        "-python",
+        "/scripts/odbpy/reader.py",
+        "subcommand",
+        "--output-odb",
+        "/run/out.odb",
+        in_odb,
+    ]
+    server_prefix = [
+        sys.executable,
+        OdbServer.get_script_path(),
+        "run",
+        "--socket",
+        server.socket_path,
+        "--metrics",
+        "/run/or_metrics_out.json",
+    ]
+    script = [
+        "--",
+        "/scripts/odbpy/reader.py",
+        "subcommand",
+        "--output-odb",
+        "/run/out.odb",
+        in_odb,
+    ]
+    assert (
+        server.get_command(command) == server_prefix + script
+    ), "Wrong command for a freshly started server"
+
+    server.reuse_db = os.path.realpath(in_odb)
+    assert (
+        server.get_command(command)
+        == server_prefix + ["--reuse-db", os.path.realpath(in_odb)] + script
+    ), "Resident database not passed to the server"
+
+    no_metrics = command[:3] + command[5:]
+    expected = server_prefix[:5] + ["--reuse-db", os.path.realpath(in_odb)] + script
+    assert server.get_command(no_metrics) == expected, "Wrong command without -metrics"
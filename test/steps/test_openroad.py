@@ -0,0 +1,162 @@
+# Copyright 2024 Efabless Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from unittest import mock
+
+import pytest
+
+from openlane.steps import step
+
+mock_variables = pytest.mock_variables
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_multi_corner_sta_grouping():
+    from openlane.state import State
+    from openlane.steps.openroad import MultiCornerSTA, OpenSTAStep
+
+    shared = ("/cwd/a.nl.v",)
+    file_lists = {
+        "nom_tt": OpenSTAStep.CornerFileList(("tt.lib",), shared, ()),
+        "nom_ss": OpenSTAStep.CornerFileList(("ss.lib",), shared, ()),
+        "nom_ss_dup": OpenSTAStep.CornerFileList(("ss.lib",), shared, ()),
+        "nom_ff": OpenSTAStep.CornerFileList(("ff.lib",), shared, ()),
+        "min_tt": OpenSTAStep.CornerFileList(
+            ("tt.lib",), shared + ("/cwd/macro.nl.v",), ()
+        ),
+    }
+
+    step = MultiCornerSTA.__new__(MultiCornerSTA)
+    step.config = {
+        "STA_CORNERS": list(file_lists),
+        "STA_THREADS": 1,
+        "STA_CORNERS_PER_PROCESS": 2,
+        "STA_MACRO_PRIORITIZE_NL": True,
+    }
+    step.step_dir = os.getcwd()
+
+    single_calls = []
+    grouped_calls = []
+
+    def run_corner(state_in, current_env, corner, corner_dir):
+        single_calls.append((corner, current_env))
+        return {f"timing__setup__ws__corner:{corner}": 1}
+
+    def run_corners(state_in, current_env, corners):
+        grouped_calls.append((corners, current_env))
+        return {f"timing__setup__ws__corner:{corner}": 1 for corner in corners}
+
+    with mock.patch.object(
+        step,
+        "_get_corner_files",
+        side_effect=lambda corner, **_: (corner, file_lists[corner]),
+    ), mock.patch.object(
+        step, "prepare_env", side_effect=lambda env, state: env
+    ), mock.patch.object(
+        step, "run_corner", side_effect=run_corner
+    ), mock.patch.object(
+        step, "run_corners", side_effect=run_corners
+    ):
+        _, metrics = step.run(State(), env={})
+
+    assert [corners for corners, _ in grouped_calls] == [
+        ["nom_tt", "nom_ss"]
+    ], "Corners sharing netlists were not grouped up to STA_CORNERS_PER_PROCESS"
+    assert sorted(corner for corner, _ in single_calls) == [
+        "min_tt",
+        "nom_ff",
+    ], "Remaining corners were not run in their own processes"
+    assert (
+        "timing__setup__ws__corner:nom_ss_dup" not in metrics
+    ), "Duplicate corner was not skipped"
+
+    _, grouped_env = grouped_calls[0]
+    assert grouped_env["_CURRENT_CORNER_LIBS__nom_tt"] == "tt.lib"
+    assert grouped_env["_CURRENT_CORNER_LIBS__nom_ss"] == "ss.lib"
+    assert (
+        grouped_env["_CURRENT_CORNER_NETLISTS"] == "/cwd/a.nl.v"
+    ), "Shared netlists were not exposed to the grouped process"
+    assert (
+        "_CURRENT_CORNER_LIBS" not in grouped_env
+    ), "Unsuffixed file list leaked into the grouped process"
+
+    for corner, env in single_calls:
+        assert env["_CURRENT_CORNER_LIBS"] == file_lists[corner].libs[0]
+        assert not any(
+            key.startswith("_CURRENT_CORNER_LIBS__") for key in env
+        ), f"Suffixed file list leaked into the process for {corner}"
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([step])
+def test_export_lazy_views(mock_config):
+    from openlane.common import Path, Toolbox
+    from openlane.state import DesignFormat, State
+    from openlane.steps.openroad import WriteViews, _export_lazy_views
+
+    with open("/cwd/in.odb", "w") as f:
+        f.write("odb\n")
+    state = State({DesignFormat.ODB: Path("/cwd/in.odb")})
+    # The configuration of the step that wrote the ODB is not used
+    with open("/cwd/config.json", "w") as f:
+        f.write('{"DESIGN_NAME": "producer"}\n')
+
+    def prepare_env(env, state):
+        return {**env, "SAVE_DEF": "/cwd/stale.def", "SAVE_ODB": "/cwd/stale.odb"}
+
+    def run_subprocess(command, env, **kwargs):
+        for key, value in env.items():
+            if key.startswith("SAVE_"):
+                with open(value, "w") as f:
+                    f.write(f"{key}\n")
+        return {}
+
+    def export():
+        return _export_lazy_views(
+            mock_config,
+            Toolbox(tmp_dir="/cwd/tmp"),
+            state,
+            [DesignFormat.DEF, DesignFormat.SPEF],
+            "/cwd/run/lazy-views",
+        )
+
+    with mock.patch.object(
+        WriteViews, "prepare_env", side_effect=prepare_env
+    ), mock.patch.object(
+        WriteViews, "run_subprocess", side_effect=run_subprocess
+    ) as run_subprocess_mock:
+        views = export()
+        assert list(views) == [DesignFormat.DEF], "Wrong views exported"
+        def_path = str(views[DesignFormat.DEF])
+        assert (
+            os.path.dirname(os.path.dirname(def_path)) == "/cwd/run/lazy-views"
+        ), "View not exported into the shared directory"
+        assert os.path.basename(def_path) == "whatever.def", "Wrong view name"
+        assert run_subprocess_mock.call_count == 1, "OpenROAD not run once"
+        env = run_subprocess_mock.call_args.kwargs["env"]
+        assert {
+            key: value for key, value in env.items() if key.startswith("SAVE_")
+        } == {"SAVE_DEF": def_path}, "Views other than the requested ones were saved"
+
+        assert export() == views, "Wrong views reused"
+        assert run_subprocess_mock.call_count == 1, "Exported views not reused"
+
+        mtime = os.path.getmtime("/cwd/in.odb")
+        os.utime("/cwd/in.odb", (mtime + 1, mtime + 1))
+        updated_views = export()
+        assert run_subprocess_mock.call_count == 2, "Outdated views reused"
+        assert (
+            updated_views[DesignFormat.DEF] != def_path
+        ), "Views of different ODB versions share a path"
+        assert open(def_path).read() == "SAVE_DEF\n", "Previous views were modified"
@@ -255,6 +255,54 @@ def test_step_start(mock_config):
     }, "Wrong step state_out metrics"
 
 
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([step])
+def test_step_start_materialize_views(mock_run, mock_config, monkeypatch):
+    from openlane.common import Path
+    from openlane.common import Toolbox
+    from openlane.state import DesignFormat, State
+    from openlane.steps import Step
+
+    with open("test.odb", "w") as f:
+        f.write("\n")
+
+    calls = []
+
+    def materializer(config, toolbox, state, formats, export_dir):
+        calls.append(formats)
+        assert (
+            export_dir == "/cwd/lazy-views"
+        ), "Views not exported to the directory shared by the run"
+        if state[DesignFormat.ODB] is None:
+            return {}
+        with open("test.def", "w") as f:
+            f.write("\n")
+        return {DesignFormat.DEF: Path("test.def")}
+
+    monkeypatch.setattr(step, "view_materializers", [materializer])
+
+    class TestStep(Step):
+        inputs = [DesignFormat.DEF]
+        outputs = []
+        id = "TestStep"
+
+        run = mock_run
+
+    state_in = State({DesignFormat.ODB: Path("test.odb")})
+    state_out = TestStep(config=mock_config, state_in=state_in).start(
+        toolbox=Toolbox(tmp_dir="/cwd"), step_dir="/cwd/1-test"
+    )
+    assert calls == [[DesignFormat.DEF]], "Materializer not called for missing input"
+    assert (
+        state_out[DesignFormat.DEF] == "test.def"
+    ), "Materialized view not added to the state"
+
+    TestStep(config=mock_config, state_in=state_out).start(
+        toolbox=Toolbox(tmp_dir="/cwd"), step_dir="/cwd/2-test"
+    )
+    assert len(calls) == 1, "Materializer called for existing view"
+
+
 @pytest.mark.usefixtures("_mock_conf_fs")
 @mock_variables([step])
 def test_step_longname(mock_run, mock_config):
@@ -414,3 +462,85 @@ def test_run_subprocess(mock_run):
 
     with pytest.raises(StepException, match="non-UTF-8"):
         step.start(step_dir=".")
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+@mock_variables([step])
+def test_run_subprocess_batched(mock_run):
+    from openlane.config import Config
+    from openlane.state import State
+    from openlane.steps import (
+        Step,
+        DefaultOutputProcessor,
+        OpenROADAlert,
+        OpenROADOutputProcessor,
+    )
+
+    alerts = []
+
+    class AlertStep(Step):
+        id = "Test.AlertStep"
+        inputs = []
+        outputs = []
+        step_dir = os.getcwd()
+        run = mock_run
+        output_processors = [OpenROADOutputProcessor, DefaultOutputProcessor]
+
+        def on_alert(self, alert: OpenROADAlert) -> OpenROADAlert:
+            alerts.append(alert)
+            return alert
+
+    lines = []
+    report_lines = []
+    for i in range(100000):
+        if i % 5000 == 0:
+            lines.append(f"[WARNING TST-{i:04d}] Warning {i}")
+        elif i == 20001:
+            lines.append("%OL_CREATE_REPORT big.rpt")
+        elif i == 60001:
+            lines.append("%OL_END_REPORT")
+        elif i == 99999:
+            lines.append("%OL_METRIC_I last_line 99999")
+        else:
+            lines.append(f"Line {i}")
+            if 20001 < i < 60001:
+                report_lines.append(f"Line {i}")
+    with open("out.txt", "w") as f:
+        f.write("\n".join(lines) + "\nunterminated")
+
+    step = AlertStep(
+        config=Config(
+            {
+                "DESIGN_NAME": "whatever",
+                "DESIGN_DIR": os.getcwd(),
+                "EXAMPLE_PDK_VAR": "bla",
+                "VERILOG_FILES": [],
+                "PDK_ROOT": "/pdk",
+                "PDK": "dummy",
+                "STD_CELL_LIBRARY": "dummy_scl",
+                "GRT_REPAIR_ANTENNAS": True,
+                "RUN_HEURISTIC_DIODE_INSERTION": False,
+                "MACROS": None,
+                "DIODE_ON_PORTS": None,
+                "TECH_LEFS": {
+                    "nom_*": "/pdk/dummy/libs.ref/techlef/dummy_scl/dummy_tech_lef.tlef"
+                },
+                "DEFAULT_CORNER": "nom_tt_025C_1v80",
+                "RANDOM_ARRAY": None,
+            }
+        ),
+        state_in=State(),
+        _no_revalidate_conf=True,
+    )
+    result = step.run_subprocess(["cat", "out.txt"], silent=True, log_to="out.log")
+
+    assert result["generated_metrics"] == {
+        "last_line": 99999
+    }, "Metric at the end of the output was not captured"
+    assert [alert.code for alert in alerts] == [
+        f"TST-{i:04d}" for i in range(0, 100000, 5000)
+    ], "Alerts were not captured in order"
+    assert (
+        open("big.rpt").read() == "\n".join(report_lines) + "\n"
+    ), "Report does not match the lines between its markers"
+    assert open("out.log").read() == open("out.txt").read(), "Log mismatch"